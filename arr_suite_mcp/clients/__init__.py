@@ -5,8 +5,10 @@ from .base import (
     ArrClientError,
     ArrClientConnectionError,
     ArrClientAuthError,
-    ArrClientNotFoundError
+    ArrClientNotFoundError,
+    test_all
 )
+from .http import close_shared_clients, get_shared_client
 from .sonarr import SonarrClient
 from .radarr import RadarrClient
 from .prowlarr import ProwlarrClient
@@ -20,6 +22,9 @@ __all__ = [
     "ArrClientConnectionError",
     "ArrClientAuthError",
     "ArrClientNotFoundError",
+    "close_shared_clients",
+    "get_shared_client",
+    "test_all",
     "SonarrClient",
     "RadarrClient",
     "ProwlarrClient",
@@ -1,13 +1,56 @@
 """Base API client for arr services."""
 
+import asyncio
 import logging
-from typing import Any, Optional
+import random
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from string import Formatter
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, ClassVar, Optional
 import httpx
-from abc import ABC, abstractmethod
+import ijson
+import orjson
+
+from .http import get_shared_client
 
 
 logger = logging.getLogger(__name__)
 
+# Throttling and transient gateway errors worth retrying
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+# Longest Retry-After wait honored before retrying anyway
+RETRY_AFTER_CAP = 30.0
+
+# Seconds to serve lookup data (profiles, root folders, tags) without refetching
+CACHE_TTL = 60
+
+# Prebuilt fixed requests kept per client; id-bearing URLs cycle through the LRU
+REQUEST_CACHE_SIZE = 64
+
+
+def _backoff_delay(attempt: int, base: float = 0.1, cap: float = 5.0) -> float:
+    """Exponential backoff delay in seconds for a retry attempt, with jitter."""
+    return min(base * 2 ** attempt, cap) + random.random() * 0.05
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header, if present and valid."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((when - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
 
 class ArrClientError(Exception):
     """Base exception for arr client errors."""
@@ -29,15 +72,221 @@ class ArrClientNotFoundError(ArrClientError):
     pass
 
 
-class BaseArrClient(ABC):
-    """Base client for interacting with arr services."""
+class endpoint:
+    """
+    Declare a thin API wrapper method for a fixed endpoint shape.
+
+    The method body is generated once, when the owning class is created,
+    so each call builds its params dict inline and goes straight to the
+    HTTP verb helper. Placeholders in the path become required positional
+    arguments formatted into the URL. Params default to None are only sent
+    when truthy.
+
+    The generated method is annotated like a hand-written one: placeholders
+    are int IDs, params take their default's type (Optional[str] for None),
+    and the return type follows the endpoint shape: None for DELETE, a list
+    for a plain collection GET, otherwise a dict (one item or a page).
+
+    Example:
+        get_series = endpoint(
+            "GET", "series", "Get all series.",
+            ("page", "page", 1), ("page_size", "pageSize", 20)
+        )
+        get_movie = endpoint("GET", "movie/{movie_id}", "Get a specific movie by ID.")
+    """
+
+    def __init__(self, method: str, path: str, doc: str, *params: tuple[str, str, Any]):
+        """
+        Declare the endpoint.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API endpoint, optionally with {argument} placeholders
+            doc: Docstring for the generated method
+            *params: (argument name, API param name, default) per query param
+        """
+        self.method = method
+        self.path = path
+        self.doc = doc
+        self.params = params
+
+    if TYPE_CHECKING:
+        # Replaced by the generated method at class creation; this tells type
+        # checkers that the attribute is an async method, not an endpoint.
+        def __get__(
+            self, instance: Any, owner: Optional[type] = None
+        ) -> Callable[..., Awaitable[Any]]: ...
+
+    def _annotations(self, placeholders: list[str]) -> dict[str, Any]:
+        """Annotations for the generated method's arguments and return value."""
+        annotations: dict[str, Any] = dict.fromkeys(placeholders, int)
+        for arg, _, default in self.params:
+            annotations[arg] = Optional[str] if default is None else type(default)
+        if self.method == "DELETE":
+            annotations["return"] = None
+        elif self.method == "GET" and not placeholders and not self.params:
+            annotations["return"] = list[dict[str, Any]]
+        else:
+            annotations["return"] = dict[str, Any]
+        return annotations
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        """Replace the declaration with the generated method."""
+        namespace: dict[str, Any] = {}
+        placeholders = [field for _, field, _, _ in Formatter().parse(self.path) if field]
+        args = ["self", *placeholders]
+        path = f"f{self.path!r}" if placeholders else repr(self.path)
+        lines = []
+        required = []
+        for index, (arg, api_name, default) in enumerate(self.params):
+            namespace[f"_default{index}"] = default
+            args.append(f"{arg}=_default{index}")
+            if default is None:
+                lines.append(f"    if {arg}:\n        params[{api_name!r}] = {arg}")
+            else:
+                required.append(f"{api_name!r}: {arg}")
+
+        if self.params:
+            body = (
+                f"    params = {{{', '.join(required)}}}\n"
+                + "".join(f"{line}\n" for line in lines)
+            )
+            call_params = ", params=params"
+        else:
+            body = ""
+            call_params = ""
+        source = (
+            f"async def {name}({', '.join(args)}):\n"
+            + body
+            + (
+                f"    return await self.get({path}{call_params})\n"
+                if self.method == "GET"
+                else f"    return await self._request({self.method!r}, {path}{call_params})\n"
+            )
+        )
+        exec(source, namespace)
+
+        method = namespace[name]
+        method.__doc__ = self.doc
+        method.__qualname__ = f"{owner.__qualname__}.{name}"
+        method.__module__ = owner.__module__
+        method.__annotations__ = self._annotations(placeholders)
+        setattr(owner, name, method)
+
+
+class _Batcher:
+    """
+    Debounced micro-batcher for one-at-a-time API calls.
+
+    Items submitted within max_wait seconds of each other (or until
+    max_size items are pending) are sent together with asyncio.gather.
+    Each caller still gets its own result or exception.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Any], Awaitable[Any]],
+        max_wait: float = 0.05,
+        max_size: int = 32
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            send: Coroutine function that performs the call for one item
+            max_wait: Seconds to wait for more items before flushing
+            max_size: Number of pending items that triggers an immediate flush
+        """
+        self._send = send
+        self.max_wait = max_wait
+        self.max_size = max_size
+        self._pending: list[tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Batches being sent; the loop only keeps weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send all pending items."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[Any, asyncio.Future]]) -> None:
+        """Send a batch concurrently and resolve each caller's future."""
+        results = await asyncio.gather(
+            *(self._send(item) for item, _ in batch),
+            return_exceptions=True
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class BaseArrClient:
+    """
+    Base client for interacting with arr services.
+
+    Subclasses set service_name to the display name of their service and
+    declare empty __slots__ so instances stay dict-free.
+    """
+
+    __slots__ = (
+        "base_url",
+        "api_key",
+        "timeout",
+        "max_retries",
+        "max_inflight",
+        "_semaphore",
+        "_client",
+        "_inflight",
+        "_batchers",
+        "_etag_cache",
+        "_req_cache",
+        "_ttl_cache",
+        "_headers",
+        "_url_prefix"
+    )
+
+    service_name: ClassVar[str]
+    _api_version = "v3"  # Most arr services use v3
+
+    # Read-mostly GET endpoints revalidated with ETag/If-None-Match
+    _cacheable_endpoints: ClassVar[frozenset[str]] = frozenset({"system/status"})
+
+    # JSON codec for request and response bodies
+    _dumps = staticmethod(orjson.dumps)
+    _loads = staticmethod(orjson.loads)
 
     def __init__(
         self,
         base_url: str,
         api_key: str,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        client: Optional[httpx.AsyncClient] = None,
+        max_inflight: int = 10
     ):
         """
         Initialize the base arr client.
@@ -47,32 +296,43 @@ class BaseArrClient(ABC):
             api_key: API key for authentication
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            client: HTTP client to use (default: the process-wide shared client)
+            max_inflight: Maximum concurrent requests to this service
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
-        self.client = httpx.AsyncClient(timeout=timeout)
-        self._api_version = "v3"  # Most arr services use v3
+        self._client = client
+        self.max_inflight = max_inflight
+        self._semaphore = asyncio.Semaphore(max_inflight)
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._batchers: dict[str, _Batcher] = {}
+        self._etag_cache: dict[tuple, tuple[str, Any]] = {}
+        # (endpoint, params) -> (expires_at, value) for cached_get
+        self._ttl_cache: dict[tuple, tuple[float, Any]] = {}
+        self._req_cache: OrderedDict[tuple[str, str, Optional[bytes]], httpx.Request] = (
+            OrderedDict()
+        )
+        self._headers = {
+            "X-Api-Key": api_key,
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
+        self._url_prefix = f"{self.base_url}/api/{self._api_version}/"
 
     @property
-    @abstractmethod
-    def service_name(self) -> str:
-        """Return the name of the service."""
-        pass
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for requests: the injected one, or the shared client."""
+        return self._client or get_shared_client()
 
     def _get_headers(self) -> dict[str, str]:
         """Get headers for API requests."""
-        return {
-            "X-Api-Key": self.api_key,
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
+        return self._headers
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL for an endpoint."""
-        endpoint = endpoint.lstrip("/")
-        return f"{self.base_url}/api/{self._api_version}/{endpoint}"
+        return self._url_prefix + endpoint.lstrip("/")
 
     async def _request(
         self,
@@ -80,17 +340,24 @@ class BaseArrClient(ABC):
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
-        retry_count: int = 0
+        content: Optional[bytes] = None
     ) -> Any:
         """
         Make an HTTP request to the arr service.
 
+        At most max_inflight requests are sent at once. Connection failures
+        and 429/502/503/504 responses are retried up to max_retries times
+        with jittered exponential backoff, honoring Retry-After (up to
+        RETRY_AFTER_CAP seconds) when the service sends it. GETs to endpoints in
+        _cacheable_endpoints send If-None-Match and reuse the cached body
+        on 304 Not Modified.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE)
             endpoint: API endpoint
             params: Query parameters
             json: JSON body
-            retry_count: Current retry attempt
+            content: Pre-encoded JSON body, used when json is not given
 
         Returns:
             JSON response from the API
@@ -103,47 +370,161 @@ class BaseArrClient(ABC):
         """
         url = self._build_url(endpoint)
         headers = self._get_headers()
-
-        try:
-            logger.debug(f"{self.service_name}: {method} {url}")
-            response = await self.client.request(
-                method=method,
-                url=url,
+        if json is not None:
+            content = self._dumps(json)
+
+        etag_key = None
+        cached = None
+        if method == "GET" and endpoint.lstrip("/") in self._cacheable_endpoints:
+            etag_key = (endpoint.lstrip("/"), tuple(sorted(params.items())) if params else ())
+            cached = self._etag_cache.get(etag_key)
+            if cached:
+                headers = {**headers, "If-None-Match": cached[0]}
+
+        client = self.client
+        if params is None and json is None and cached is None:
+            # Fixed requests (no params, per-call body or conditional headers)
+            # are built once and re-sent as-is, keeping the most recent
+            # REQUEST_CACHE_SIZE so per-id paths can't grow the cache unbounded.
+            key = (method, url, content)
+            request = self._req_cache.get(key)
+            if request is None:
+                request = self._req_cache[key] = client.build_request(
+                    method, url, headers=headers, content=content, timeout=self.timeout
+                )
+                if len(self._req_cache) > REQUEST_CACHE_SIZE:
+                    self._req_cache.popitem(last=False)
+            else:
+                self._req_cache.move_to_end(key)
+        else:
+            request = client.build_request(
+                method,
+                url,
                 headers=headers,
                 params=params,
-                json=json
+                content=content,
+                timeout=self.timeout
             )
 
-            if response.status_code == 401:
-                raise ArrClientAuthError(
-                    f"{self.service_name}: Authentication failed. Check your API key."
+        for attempt in range(self.max_retries + 1):
+            try:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s: %s %s", self.service_name, method, url)
+                async with self._semaphore:
+                    response = await client.send(request)
+            except (httpx.ConnectError, httpx.RemoteProtocolError) as e:
+                if attempt == self.max_retries:
+                    raise ArrClientConnectionError(
+                        f"{self.service_name}: Could not connect to {self.base_url}"
+                    ) from e
+                logger.warning(
+                    "%s: Connection failed, retrying (%d/%d)...",
+                    self.service_name, attempt + 1, self.max_retries
                 )
-            elif response.status_code == 404:
-                raise ArrClientNotFoundError(
-                    f"{self.service_name}: Resource not found at {endpoint}"
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+            except httpx.TimeoutException as e:
+                raise ArrClientConnectionError(
+                    f"{self.service_name}: Request timed out after {self.timeout}s"
+                ) from e
+
+            status_code = response.status_code
+            if status_code < 300:
+                # Some endpoints return empty responses
+                body = response.content
+                result = self._loads(body) if body else None
+                if etag_key is not None and "ETag" in response.headers:
+                    self._etag_cache[etag_key] = (response.headers["ETag"], result)
+                if method != "GET" and self._ttl_cache:
+                    self.invalidate_cache(endpoint.lstrip("/").split("/", 1)[0])
+                return result
+
+            if status_code == 304 and cached:
+                return cached[1]
+
+            if status_code in RETRY_STATUS_CODES and attempt < self.max_retries:
+                logger.warning(
+                    "%s: HTTP %d, retrying (%d/%d)...",
+                    self.service_name, status_code, attempt + 1, self.max_retries
                 )
-            elif response.status_code >= 400:
-                raise ArrClientError(
-                    f"{self.service_name}: HTTP {response.status_code} - {response.text}"
+                delay = _retry_after(response)
+                await asyncio.sleep(
+                    min(delay, RETRY_AFTER_CAP) if delay is not None else _backoff_delay(attempt)
                 )
+                continue
+
+            self._raise_for_status(response, endpoint)
+
+    def _raise_for_status(self, response: httpx.Response, endpoint: str) -> None:
+        """Raise the matching ArrClientError for a non-2xx response."""
+        status_code = response.status_code
+        if status_code == 401:
+            raise ArrClientAuthError(
+                f"{self.service_name}: Authentication failed. Check your API key."
+            )
+        if status_code == 404:
+            raise ArrClientNotFoundError(
+                f"{self.service_name}: Resource not found at {endpoint}"
+            )
+        raise ArrClientError(
+            f"{self.service_name}: HTTP {status_code} - {response.text}"
+        )
+
+    async def stream_get(
+        self,
+        endpoint: str,
+        item_path: str,
+        params: Optional[dict[str, Any]] = None,
+        fields: Optional[set[str]] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Stream items out of a large JSON response without buffering the body.
 
-            response.raise_for_status()
+        Items are parsed incrementally as bytes arrive, so memory stays
+        bounded by a single item and callers can stop early. Streams are
+        not retried.
 
-            # Some endpoints return empty responses
-            if not response.content:
-                return None
+        Args:
+            endpoint: API endpoint
+            item_path: ijson prefix of the items to yield (e.g. "item", "data.item")
+            params: Query parameters
+            fields: Keys to keep from each (object) item; all keys by default
 
-            return response.json()
+        Yields:
+            Parsed items at item_path
 
-        except httpx.ConnectError as e:
-            if retry_count < self.max_retries:
-                logger.warning(
-                    f"{self.service_name}: Connection failed, retrying "
-                    f"({retry_count + 1}/{self.max_retries})..."
-                )
-                return await self._request(
-                    method, endpoint, params, json, retry_count + 1
-                )
+        Raises:
+            ArrClientConnectionError: If connection fails
+            ArrClientError: For error responses
+        """
+        url = self._build_url(endpoint)
+
+        try:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s: GET %s (streaming)", self.service_name, url)
+            async with self.client.stream(
+                "GET",
+                url,
+                headers=self._get_headers(),
+                params=params,
+                timeout=self.timeout
+            ) as response:
+                if response.status_code >= 300:
+                    await response.aread()
+                    self._raise_for_status(response, endpoint)
+
+                items = ijson.sendable_list()
+                parser = ijson.items_coro(items, item_path, use_float=True)
+                async for chunk in response.aiter_bytes():
+                    parser.send(chunk)
+                    for item in items:
+                        yield {k: item[k] for k in fields if k in item} if fields else item
+                    del items[:]
+                parser.close()
+                for item in items:
+                    yield {k: item[k] for k in fields if k in item} if fields else item
+
+        except (httpx.ConnectError, httpx.RemoteProtocolError) as e:
             raise ArrClientConnectionError(
                 f"{self.service_name}: Could not connect to {self.base_url}"
             ) from e
@@ -157,8 +538,19 @@ class BaseArrClient(ABC):
         endpoint: str,
         params: Optional[dict[str, Any]] = None
     ) -> Any:
-        """Make a GET request."""
-        return await self._request("GET", endpoint, params=params)
+        """
+        Make a GET request.
+
+        Concurrent GETs for the same endpoint and params share a single
+        in-flight request and receive the same parsed response.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request("GET", endpoint, params=params))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
 
     async def post(
         self,
@@ -168,6 +560,10 @@ class BaseArrClient(ABC):
         """Make a POST request."""
         return await self._request("POST", endpoint, json=json)
 
+    async def post_raw(self, endpoint: str, content: bytes) -> Any:
+        """Make a POST request with a pre-encoded JSON body."""
+        return await self._request("POST", endpoint, content=content)
+
     async def put(
         self,
         endpoint: str,
@@ -184,15 +580,177 @@ class BaseArrClient(ABC):
         """Make a DELETE request."""
         return await self._request("DELETE", endpoint, params=params)
 
-    async def test_connection(self) -> bool:
+    async def cached_get(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        ttl: float = CACHE_TTL
+    ) -> Any:
+        """
+        Make a GET request, caching the parsed response for ttl seconds.
+
+        Any successful POST/PUT/DELETE under the same top-level resource
+        (e.g. "qualityprofile") drops the cached entries.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            ttl: Seconds to serve the cached value
+        """
+        key = (endpoint.lstrip("/"), tuple(sorted(params.items())) if params else ())
+        entry = self._ttl_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        value = await self.get(endpoint, params=params)
+        self._ttl_cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """Drop cached_get responses for endpoints starting with prefix (all by default)."""
+        for key in [key for key in self._ttl_cache if key[0].startswith(prefix)]:
+            del self._ttl_cache[key]
+
+    async def _batched(
+        self,
+        name: str,
+        send: Callable[[Any], Awaitable[Any]],
+        item: Any
+    ) -> Any:
+        """
+        Submit an item to the named micro-batcher, creating it on first use.
+
+        Args:
+            name: Batcher name, one per kind of call
+            send: Coroutine function that performs the call for one item
+            item: Item to send
+
+        Returns:
+            Result of send(item)
+        """
+        batcher = self._batchers.get(name)
+        if batcher is None:
+            batcher = self._batchers[name] = _Batcher(send)
+        return await batcher.submit(item)
+
+    async def _get_all_pages(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        page_size: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every page of a paginated endpoint and flatten the records.
+
+        The first page is fetched to learn the total record count, then the
+        remaining pages are requested concurrently.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            page_size: Number of records per page
+            concurrency: Maximum number of pages in flight at once
+
+        Returns:
+            All records across all pages
+        """
+        base_params = dict(params or {})
+        base_params["pageSize"] = page_size
+
+        first = await self.get(endpoint, params={**base_params, "page": 1})
+        records = list(self._page_records(first))
+        total = first.get("totalRecords", first.get("total", len(records))) if first else 0
+        last_page = -(-total // page_size)
+
+        if last_page > 1:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(page: int) -> Any:
+                async with semaphore:
+                    return await self.get(endpoint, params={**base_params, "page": page})
+
+            pages = await asyncio.gather(*(fetch(p) for p in range(2, last_page + 1)))
+            for page in pages:
+                records.extend(self._page_records(page))
+
+        return records
+
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        page_size: int = 200,
+        concurrency: int = 10
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over the records of a paginated endpoint.
+
+        The first page is fetched to learn the total record count, then the
+        remaining pages are prefetched concurrently and their records yielded
+        as each page arrives, so pages after the first may come out of order.
+        Pages still in flight are cancelled if the caller stops early.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            page_size: Number of records per page
+            concurrency: Maximum number of pages in flight at once
+
+        Yields:
+            Records across all pages
+        """
+        base_params = dict(params or {})
+        base_params["pageSize"] = page_size
+
+        first = await self.get(endpoint, params={**base_params, "page": 1})
+        records = self._page_records(first)
+        for record in records:
+            yield record
+
+        total = first.get("totalRecords", first.get("total", len(records))) if first else 0
+        last_page = -(-total // page_size)
+        if last_page <= 1:
+            return
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(page: int) -> Any:
+            async with semaphore:
+                return await self.get(endpoint, params={**base_params, "page": page})
+
+        tasks = [asyncio.ensure_future(fetch(p)) for p in range(2, last_page + 1)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                for record in self._page_records(await next_page):
+                    yield record
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _page_records(page: Any) -> list[dict[str, Any]]:
+        """Extract the records from a paginated response."""
+        if not page:
+            return []
+        return page.get("records", page.get("data", []))
+
+    async def test_connection(self, timeout: Optional[float] = None) -> bool:
         """
         Test connection to the arr service.
 
+        Args:
+            timeout: Seconds to wait before giving up (default: the client
+                timeout, capped at 5s)
+
         Returns:
             True if connection successful, False otherwise
         """
         try:
-            await self.get("system/status")
+            await asyncio.wait_for(
+                self.get("system/status"),
+                timeout or min(self.timeout, 5)
+            )
             logger.info(f"{self.service_name}: Connection test successful")
             return True
         except Exception as e:
@@ -204,8 +762,13 @@ class BaseArrClient(ABC):
         return await self.get("system/status")
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """
+        Release the client.
+
+        The HTTP client is either shared or owned by the caller that
+        injected it, so this is a no-op; use close_shared_clients() on
+        shutdown instead.
+        """
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -214,3 +777,20 @@ class BaseArrClient(ABC):
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         await self.close()
+
+
+async def test_all(
+    clients: list[BaseArrClient],
+    timeout: float = 3
+) -> list[bool]:
+    """
+    Test connections to several services concurrently.
+
+    Args:
+        clients: Clients to test
+        timeout: Seconds to wait for each service
+
+    Returns:
+        Connection test result for each client, in order
+    """
+    return await asyncio.gather(*(client.test_connection(timeout) for client in clients))
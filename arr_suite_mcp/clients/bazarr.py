@@ -1,32 +1,35 @@
 """Bazarr API client."""
 
-from typing import Any, Optional
-from .base import BaseArrClient
+from typing import Any, AsyncIterator, Optional
+from .base import BaseArrClient, endpoint
 
 
 class BazarrClient(BaseArrClient):
     """Client for interacting with Bazarr API."""
 
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30, max_retries: int = 3):
-        """Initialize Bazarr client (uses v4 API)."""
-        super().__init__(base_url, api_key, timeout, max_retries)
-        self._api_version = "v4"  # Bazarr uses v4
+    __slots__ = ()
 
-    @property
-    def service_name(self) -> str:
-        return "Bazarr"
+    service_name = "Bazarr"
+    _api_version = "v4"  # Bazarr uses v4
+    _cacheable_endpoints = frozenset({
+        "system/status", "system/health",
+        "languages", "languages/enabled",
+        "providers", "providers/enabled"
+    })
 
     # Series Subtitles
-    async def get_series(
+    get_series = endpoint(
+        "GET", "series", "Get all series managed by Bazarr.",
+        ("page", "page", 1), ("page_size", "pageSize", 20)
+    )
+
+    async def get_all_series(
         self,
-        page: int = 1,
-        page_size: int = 20
-    ) -> dict[str, Any]:
-        """Get all series managed by Bazarr."""
-        return await self.get(
-            "series",
-            params={"page": page, "pageSize": page_size}
-        )
+        page_size: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get every series managed by Bazarr across all pages."""
+        return await self._get_all_pages("series", page_size=page_size, concurrency=concurrency)
 
     async def get_series_subtitles(self, series_id: int) -> dict[str, Any]:
         """Get subtitle information for a specific series."""
@@ -71,16 +74,18 @@ class BazarrClient(BaseArrClient):
         )
 
     # Movie Subtitles
-    async def get_movies(
+    get_movies = endpoint(
+        "GET", "movies", "Get all movies managed by Bazarr.",
+        ("page", "page", 1), ("page_size", "pageSize", 20)
+    )
+
+    async def get_all_movies(
         self,
-        page: int = 1,
-        page_size: int = 20
-    ) -> dict[str, Any]:
-        """Get all movies managed by Bazarr."""
-        return await self.get(
-            "movies",
-            params={"page": page, "pageSize": page_size}
-        )
+        page_size: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get every movie managed by Bazarr across all pages."""
+        return await self._get_all_pages("movies", page_size=page_size, concurrency=concurrency)
 
     async def get_movie_subtitles(self, movie_id: int) -> dict[str, Any]:
         """Get subtitle information for a specific movie."""
@@ -112,16 +117,31 @@ class BazarrClient(BaseArrClient):
         )
 
     # Subtitle History
-    async def get_history(
+    get_history = endpoint(
+        "GET", "history", "Get subtitle download history.",
+        ("page", "page", 1), ("page_size", "pageSize", 20)
+    )
+
+    async def get_all_history(
+        self,
+        page_size: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get the full subtitle download history across all pages."""
+        return await self._get_all_pages("history", page_size=page_size, concurrency=concurrency)
+
+    async def iter_history(
         self,
         page: int = 1,
         page_size: int = 20
-    ) -> dict[str, Any]:
-        """Get subtitle download history."""
-        return await self.get(
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream subtitle download history entries without buffering the page."""
+        async for entry in self.stream_get(
             "history",
+            "data.item",
             params={"page": page, "pageSize": page_size}
-        )
+        ):
+            yield entry
 
     # Languages
     async def get_languages(self) -> list[dict[str, Any]]:
@@ -164,6 +184,14 @@ class BazarrClient(BaseArrClient):
         """Get system logs."""
         return await self.get("system/logs", params={"lines": lines})
 
+    async def iter_system_logs(
+        self,
+        lines: int = 50
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream system log lines without buffering the full response."""
+        async for line in self.stream_get("system/logs", "item", params={"lines": lines}):
+            yield line
+
     # Config
     async def get_settings(self) -> dict[str, Any]:
         """Get Bazarr settings."""
@@ -177,26 +205,34 @@ class BazarrClient(BaseArrClient):
         return await self.post("system/settings", json=settings_data)
 
     # Wanted
-    async def get_wanted_series(
+    get_wanted_series = endpoint(
+        "GET", "episodes/wanted", "Get series episodes with wanted/missing subtitles.",
+        ("page", "page", 1), ("page_size", "pageSize", 20)
+    )
+
+    async def get_all_wanted_series(
         self,
-        page: int = 1,
-        page_size: int = 20
-    ) -> dict[str, Any]:
-        """Get series episodes with wanted/missing subtitles."""
-        return await self.get(
-            "episodes/wanted",
-            params={"page": page, "pageSize": page_size}
+        page_size: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get every series episode with wanted/missing subtitles across all pages."""
+        return await self._get_all_pages(
+            "episodes/wanted", page_size=page_size, concurrency=concurrency
         )
 
-    async def get_wanted_movies(
+    get_wanted_movies = endpoint(
+        "GET", "movies/wanted", "Get movies with wanted/missing subtitles.",
+        ("page", "page", 1), ("page_size", "pageSize", 20)
+    )
+
+    async def get_all_wanted_movies(
         self,
-        page: int = 1,
-        page_size: int = 20
-    ) -> dict[str, Any]:
-        """Get movies with wanted/missing subtitles."""
-        return await self.get(
-            "movies/wanted",
-            params={"page": page, "pageSize": page_size}
+        page_size: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get every movie with wanted/missing subtitles across all pages."""
+        return await self._get_all_pages(
+            "movies/wanted", page_size=page_size, concurrency=concurrency
         )
 
     # Blacklist
@@ -209,12 +245,29 @@ class BazarrClient(BaseArrClient):
         subtitle_id: str,
         media_type: str
     ) -> dict[str, Any]:
-        """Add a subtitle to blacklist."""
-        return await self.post(
-            "blacklist",
-            json={"subtitleId": subtitle_id, "mediaType": media_type}
+        """
+        Add a subtitle to blacklist.
+
+        Additions issued close together are sent as one concurrent batch.
+        """
+        return await self._batched(
+            "add_to_blacklist",
+            self._add_to_blacklist,
+            {"subtitleId": subtitle_id, "mediaType": media_type}
         )
 
+    async def _add_to_blacklist(self, entry: dict[str, Any]) -> dict[str, Any]:
+        """Add a single blacklist entry immediately."""
+        return await self.post("blacklist", json=entry)
+
     async def remove_from_blacklist(self, blacklist_id: int) -> None:
-        """Remove a subtitle from blacklist."""
+        """
+        Remove a subtitle from blacklist.
+
+        Removals issued close together are sent as one concurrent batch.
+        """
+        await self._batched("remove_from_blacklist", self._remove_from_blacklist, blacklist_id)
+
+    async def _remove_from_blacklist(self, blacklist_id: int) -> None:
+        """Remove a single blacklist entry immediately."""
         await self.delete(f"blacklist/{blacklist_id}")
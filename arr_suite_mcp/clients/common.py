@@ -0,0 +1,91 @@
+"""Endpoints shared by the Sonarr and Radarr API clients."""
+
+from typing import Any, Optional
+import orjson
+from .base import BaseArrClient, endpoint
+
+
+# Constant command bodies, encoded once
+_BACKUP_COMMAND = orjson.dumps({"name": "Backup"})
+
+
+class _CommonArrMixin(BaseArrClient):
+    """Endpoints that Sonarr and Radarr expose identically under /api/v3."""
+
+    __slots__ = ()
+
+    # Quality Profiles
+    async def get_quality_profiles(self) -> list[dict[str, Any]]:
+        """Get all quality profiles."""
+        return await self.cached_get("qualityprofile")
+
+    get_quality_profile = endpoint(
+        "GET", "qualityprofile/{profile_id}", "Get a specific quality profile."
+    )
+
+    # Root Folders
+    async def get_root_folders(self) -> list[dict[str, Any]]:
+        """Get all root folders."""
+        return await self.cached_get("rootfolder")
+
+    # Tags
+    async def get_tags(self) -> list[dict[str, Any]]:
+        """Get all tags."""
+        return await self.cached_get("tag")
+
+    async def create_tag(self, label: str) -> dict[str, Any]:
+        """Create a new tag."""
+        return await self.post("tag", json={"label": label})
+
+    # Queue
+    async def delete_queue_item(
+        self,
+        queue_id: int,
+        remove_from_client: bool = True,
+        blocklist: bool = False
+    ) -> None:
+        """Remove an item from the queue."""
+        await self.delete(
+            f"queue/{queue_id}",
+            params={
+                "removeFromClient": remove_from_client,
+                "blocklist": blocklist
+            }
+        )
+
+    # Calendar
+    async def get_calendar(
+        self,
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> list[dict[str, Any]]:
+        """Get upcoming releases."""
+        params = {}
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        return await self.get("calendar", params=params)
+
+    # Commands
+    async def backup_database(self) -> dict[str, Any]:
+        """Trigger a database backup."""
+        return await self.post_raw("command", _BACKUP_COMMAND)
+
+    # Config
+    async def get_config(self, section: str) -> dict[str, Any]:
+        """
+        Get configuration for a specific section.
+
+        Args:
+            section: Config section (e.g., 'ui', 'naming', 'mediamanagement')
+        """
+        return await self.get(f"config/{section}")
+
+    async def update_config(
+        self,
+        section: str,
+        config_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Update configuration for a specific section."""
+        return await self.put(f"config/{section}", json=config_data)
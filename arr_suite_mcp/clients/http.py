@@ -0,0 +1,76 @@
+"""Shared HTTP transport for all service clients."""
+
+import asyncio
+import functools
+import ssl
+import weakref
+import httpx
+
+
+# Connection pool tuning shared by all service clients. Tool calls fan out
+# concurrently, so keep plenty of warm connections around. Idle connections
+# live just under Kestrel's 130s keep-alive timeout (used by the arr apps),
+# so gaps between tool calls don't cost a fresh TCP+TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=1000,
+    max_keepalive_connections=100,
+    keepalive_expiry=120
+)
+
+
+def _accept_encoding() -> str:
+    """Content codings httpx can decode here; brotli only when a decoder is installed."""
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+# List endpoints return large JSON bodies that compress well
+DEFAULT_HEADERS = {"Accept-Encoding": _accept_encoding()}
+
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_context() -> ssl.SSLContext:
+    """
+    Return the certificate-verifying SSL context shared by every pool.
+
+    Loading the CA bundle takes tens of milliseconds, which httpx would
+    otherwise repeat for each AsyncClient it builds.
+    """
+    return httpx.create_ssl_context()
+
+
+# One AsyncClient per event loop, shared by every client so services
+# behind the same host reuse sockets and TLS sessions.
+_SHARED_CLIENT: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for the running event loop, creating it if needed."""
+    loop = asyncio.get_running_loop()
+    client = _SHARED_CLIENT.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=DEFAULT_LIMITS,
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            verify=get_ssl_context()
+        )
+        _SHARED_CLIENT[loop] = client
+    return client
+
+
+async def close_shared_clients() -> None:
+    """Close all shared HTTP clients. Call once on server shutdown."""
+    clients = list(_SHARED_CLIENT.values())
+    _SHARED_CLIENT.clear()
+    for client in clients:
+        if not client.is_closed:
+            await client.aclose()
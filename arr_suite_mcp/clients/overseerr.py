@@ -1,29 +1,68 @@
 """Overseerr API client."""
 
-from typing import Any, Optional
-from .base import BaseArrClient
+import asyncio
+from typing import Any, AsyncIterator, Optional
+from .base import BaseArrClient, endpoint
 
 
 class OverseerrClient(BaseArrClient):
     """Client for interacting with Overseerr API."""
 
-    def __init__(self, base_url: str, api_key: str, timeout: int = 30, max_retries: int = 3):
-        """Initialize Overseerr client (uses v1 API)."""
-        super().__init__(base_url, api_key, timeout, max_retries)
-        self._api_version = "v1"  # Overseerr uses v1
+    __slots__ = ()
 
-    @property
-    def service_name(self) -> str:
-        return "Overseerr"
+    service_name = "Overseerr"
+    _api_version = "v1"  # Overseerr uses v1
+    _cacheable_endpoints = frozenset({
+        "status", "status/health",
+        "settings/main", "settings/plex", "settings/radarr", "settings/sonarr"
+    })
 
-    # Requests
-    async def get_requests(
+    async def _get_all_results(
         self,
-        take: int = 20,
-        skip: int = 0,
-        filter: Optional[str] = None,
-        sort: str = "added"
-    ) -> dict[str, Any]:
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        take: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch every page of a take/skip paginated endpoint and flatten the results.
+
+        The first page is fetched to learn the total result count, then the
+        remaining pages are requested concurrently.
+
+        Args:
+            endpoint: API endpoint
+            params: Additional query parameters
+            take: Number of results per page
+            concurrency: Maximum number of pages in flight at once
+
+        Returns:
+            All results across all pages
+        """
+        base_params = dict(params or {})
+        base_params["take"] = take
+
+        first = await self.get(endpoint, params={**base_params, "skip": 0})
+        results = list(first.get("results", [])) if first else []
+        total = first.get("pageInfo", {}).get("results", len(results)) if first else 0
+
+        if total > take:
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(skip: int) -> Any:
+                async with semaphore:
+                    return await self.get(endpoint, params={**base_params, "skip": skip})
+
+            pages = await asyncio.gather(*(fetch(skip) for skip in range(take, total, take)))
+            for page in pages:
+                if page:
+                    results.extend(page.get("results", []))
+
+        return results
+
+    # Requests
+    get_requests = endpoint(
+        "GET", "request",
         """
         Get media requests.
 
@@ -35,11 +74,41 @@ class OverseerrClient(BaseArrClient):
 
         Returns:
             Paginated request results
-        """
+        """,
+        ("take", "take", 20),
+        ("skip", "skip", 0),
+        ("filter", "filter", None),
+        ("sort", "sort", "added")
+    )
+
+    async def iter_requests(
+        self,
+        take: int = 20,
+        skip: int = 0,
+        filter: Optional[str] = None,
+        sort: str = "added"
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream media requests without buffering the page; useful with a large take."""
         params = {"take": take, "skip": skip, "sort": sort}
         if filter:
             params["filter"] = filter
-        return await self.get("request", params=params)
+        async for request in self.stream_get("request", "results.item", params=params):
+            yield request
+
+    async def get_all_requests(
+        self,
+        filter: Optional[str] = None,
+        sort: str = "added",
+        take: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get every media request across all pages."""
+        params = {"sort": sort}
+        if filter:
+            params["filter"] = filter
+        return await self._get_all_results(
+            "request", params=params, take=take, concurrency=concurrency
+        )
 
     async def get_request(self, request_id: int) -> dict[str, Any]:
         """Get a specific request by ID."""
@@ -92,15 +161,39 @@ class OverseerrClient(BaseArrClient):
         return await self.post(f"request/{request_id}/{status}")
 
     async def delete_request(self, request_id: int) -> None:
-        """Delete a request."""
+        """
+        Delete a request.
+
+        Deletes issued close together are sent as one concurrent batch.
+        """
+        await self._batched("delete_request", self._delete_request, request_id)
+
+    async def _delete_request(self, request_id: int) -> None:
+        """Delete a single request immediately."""
         await self.delete(f"request/{request_id}")
 
     async def approve_request(self, request_id: int) -> dict[str, Any]:
-        """Approve a pending request."""
+        """
+        Approve a pending request.
+
+        Approvals issued close together are sent as one concurrent batch.
+        """
+        return await self._batched("approve_request", self._approve_request, request_id)
+
+    async def _approve_request(self, request_id: int) -> dict[str, Any]:
+        """Approve a single request immediately."""
         return await self.update_request(request_id, "approve")
 
     async def decline_request(self, request_id: int) -> dict[str, Any]:
-        """Decline a pending request."""
+        """
+        Decline a pending request.
+
+        Declines issued close together are sent as one concurrent batch.
+        """
+        return await self._batched("decline_request", self._decline_request, request_id)
+
+    async def _decline_request(self, request_id: int) -> dict[str, Any]:
+        """Decline a single request immediately."""
         return await self.update_request(request_id, "decline")
 
     # Media
@@ -179,13 +272,18 @@ class OverseerrClient(BaseArrClient):
         )
 
     # Users
-    async def get_users(
+    get_users = endpoint(
+        "GET", "user", "Get all users.",
+        ("take", "take", 20), ("skip", "skip", 0)
+    )
+
+    async def get_all_users(
         self,
-        take: int = 20,
-        skip: int = 0
-    ) -> dict[str, Any]:
-        """Get all users."""
-        return await self.get("user", params={"take": take, "skip": skip})
+        take: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get every user across all pages."""
+        return await self._get_all_results("user", take=take, concurrency=concurrency)
 
     async def get_user(self, user_id: int) -> dict[str, Any]:
         """Get a specific user by ID."""
@@ -301,17 +399,22 @@ class OverseerrClient(BaseArrClient):
         return await self.get("status/health")
 
     # Issues
-    async def get_issues(
+    get_issues = endpoint(
+        "GET", "issue", "Get reported issues.",
+        ("take", "take", 20), ("skip", "skip", 0), ("filter", "filter", None)
+    )
+
+    async def get_all_issues(
         self,
-        take: int = 20,
-        skip: int = 0,
-        filter: Optional[str] = None
-    ) -> dict[str, Any]:
-        """Get reported issues."""
-        params = {"take": take, "skip": skip}
-        if filter:
-            params["filter"] = filter
-        return await self.get("issue", params=params)
+        filter: Optional[str] = None,
+        take: int = 100,
+        concurrency: int = 8
+    ) -> list[dict[str, Any]]:
+        """Get every reported issue across all pages."""
+        params = {"filter": filter} if filter else None
+        return await self._get_all_results(
+            "issue", params=params, take=take, concurrency=concurrency
+        )
 
     async def get_issue(self, issue_id: int) -> dict[str, Any]:
         """Get a specific issue by ID."""
@@ -1,105 +1,437 @@
 """Plex Media Server API client."""
 
-from typing import Any, Optional
+import asyncio
+import logging
+import random
+import time
+import weakref
+from typing import Any, AsyncIterator, Optional
 import httpx
-from .base import ArrClientError
+import orjson
+from .base import (
+    ArrClientError,
+    ArrClientConnectionError,
+    ArrClientAuthError,
+    ArrClientNotFoundError,
+    _retry_after
+)
+from .http import DEFAULT_HEADERS, DEFAULT_LIMITS, get_shared_client, get_ssl_context
+
+
+logger = logging.getLogger(__name__)
+
+# Plex throttles under load and often sits behind a proxy, so also retry 429
+PLEX_RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+RETRY_BASE = 1.0
+RETRY_CAP = 30.0
+
+# Low-churn endpoints (identity, libraries, prefs) change on the order of hours
+CACHE_TTL = 600
+CACHE_MAX_SIZE = 512
+
+# Missing items are probed repeatedly during reconciliation; remember 404s briefly
+NOT_FOUND_TTL = 60
+NOT_FOUND_MAX_SIZE = 2048
+
+# Prefix of library item URIs, filled with the server's machineIdentifier
+LIBRARY_URI_TEMPLATE = "server://%s/com.plexapp.plugins.library/library/metadata/"
+
+
+def _mc_dict(response: Any) -> dict[str, Any]:
+    """Return the MediaContainer of a Plex response, or an empty dict."""
+    container = response.get("MediaContainer") if response else None
+    return container if container is not None else {}
+
+
+def _mc_list(response: Any, key: str) -> list[Any]:
+    """Return the list stored under key in a Plex response's MediaContainer."""
+    container = response.get("MediaContainer") if response else None
+    if container:
+        items = container.get(key)
+        if items is not None:
+            return items
+    return []
+
+
+def _warn_unclosed(client: httpx.AsyncClient, service_name: str) -> None:
+    """Finalizer: log when a dedicated pool is garbage-collected without close()."""
+    if not client.is_closed:
+        logger.warning(
+            "%s: client garbage-collected without close(); open connections were leaked",
+            service_name
+        )
+
+
+def _full_jitter_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff delay in seconds for a retry attempt."""
+    return min(RETRY_CAP, RETRY_BASE * 2 ** attempt) * random.uniform(0, 1)
 
 
 class PlexClient:
     """Client for interacting with Plex Media Server API."""
 
+    __slots__ = (
+        "base_url",
+        "token",
+        "timeout",
+        "max_retries",
+        "max_inflight",
+        "_semaphore",
+        "_in_flight",
+        "_queued",
+        "_client",
+        "_owns_client",
+        "_pool_options",
+        "_finalizer",
+        "_headers",
+        "_url_prefix",
+        "_inflight",
+        "_cache",
+        "_not_found",
+        "_library_uri_prefix",
+        "_background",
+        "__weakref__"
+    )
+
+    service_name = "Plex"
+
+    # JSON codec for request and response bodies
+    _dumps = staticmethod(orjson.dumps)
+    _loads = staticmethod(orjson.loads)
+
+    # Item endpoint templates, filled with a rating key
+    _URL_METADATA = "library/metadata/%s"
+    _URL_METADATA_CHILDREN = "library/metadata/%s/children"
+    _URL_METADATA_ANALYZE = "library/metadata/%s/analyze"
+    _URL_METADATA_REFRESH = "library/metadata/%s/refresh"
+    _URL_METADATA_MATCH = "library/metadata/%s/match"
+
     def __init__(
         self,
         base_url: str,
         token: str,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = True,
+        client: Optional[httpx.AsyncClient] = None,
+        max_inflight: int = 10
     ):
         """
         Initialize Plex client.
 
+        By default requests go through the process-wide shared HTTP client.
+        Passing custom limits or http2=False gives this instance its own
+        connection pool instead, created on first use and shut down by
+        close().
+
         Args:
             base_url: Base URL of Plex server (e.g., http://localhost:32400)
             token: Plex authentication token
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            limits: Connection pool limits for a dedicated pool
+            http2: Whether to negotiate HTTP/2 (False implies a dedicated pool)
+            client: HTTP client to use; owned by the caller
+            max_inflight: Maximum concurrent requests to this server
         """
         self.base_url = base_url.rstrip("/")
         self.token = token
         self.timeout = timeout
         self.max_retries = max_retries
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self._headers = {
+            "X-Plex-Token": token,
+            "Accept": "application/json"
+        }
+        self._url_prefix = f"{self.base_url}/"
+        self._owns_client = client is None and (limits is not None or not http2)
+        self._pool_options = (limits or DEFAULT_LIMITS, http2) if self._owns_client else None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._client = client
+        self.max_inflight = max_inflight
+        self._semaphore = asyncio.Semaphore(max_inflight)
+        self._in_flight = 0
+        self._queued = 0
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._library_uri_prefix: Optional[str] = None
+        self._background: set[asyncio.Task] = set()
+        # (endpoint, params) -> (expires_at, value, etag, last_modified)
+        self._cache: dict[tuple, tuple[float, Any, Optional[str], Optional[str]]] = {}
+        # (endpoint, params) -> expires_at for GETs that returned 404
+        self._not_found: dict[tuple, float] = {}
 
     @property
-    def service_name(self) -> str:
-        return "Plex"
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for requests: dedicated or injected, else the shared client."""
+        if self._client is None:
+            if self._pool_options is None:
+                return get_shared_client()
+            limits, http2 = self._pool_options
+            self._client = httpx.AsyncClient(
+                limits=limits,
+                http2=http2,
+                headers={**DEFAULT_HEADERS, **self._headers},
+                verify=get_ssl_context()
+            )
+            self._finalizer = weakref.finalize(
+                self, _warn_unclosed, self._client, self.service_name
+            )
+        return self._client
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently being sent to this server."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a free max_inflight slot."""
+        return self._queued
+
+    async def _gather_limited(self, coros: list) -> list[Any]:
+        """Run coroutines concurrently, at most max_inflight at a time, collecting exceptions."""
+        semaphore = asyncio.Semaphore(self.max_inflight)
+
+        async def run(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference and logging failures."""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._reap_task)
+        return task
+
+    def _reap_task(self, task: asyncio.Task) -> None:
+        """Drop a finished background task and log its exception, if any."""
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("%s: background request failed: %s", self.service_name, task.exception())
 
     def _get_headers(self) -> dict[str, str]:
         """Get headers for API requests."""
-        return {
-            "X-Plex-Token": self.token,
-            "Accept": "application/json"
-        }
+        return self._headers
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL for an endpoint."""
-        endpoint = endpoint.lstrip("/")
-        return f"{self.base_url}/{endpoint}"
+        return self._url_prefix + endpoint.lstrip("/")
 
-    async def _request(
+    async def _send(
         self,
         method: str,
         endpoint: str,
         params: Optional[dict[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
-        retry_count: int = 0
-    ) -> Any:
-        """Make an HTTP request to Plex."""
+        headers: Optional[dict[str, str]] = None
+    ) -> httpx.Response:
+        """
+        Send an HTTP request to Plex and return the successful response.
+
+        Connection drops and 429/502/503/504 responses are retried up to
+        max_retries times with full-jitter exponential backoff, honoring
+        Retry-After when Plex sends it. Auth and not-found errors fail fast.
+        A 304 Not Modified is returned as-is for conditional requests.
+        GET 404s are remembered for NOT_FOUND_TTL seconds and re-raised
+        without a request; a successful mutation under the same section
+        (first two path segments) forgets them.
+        """
+        not_found_key = None
+        if method == "GET":
+            not_found_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            expires_at = self._not_found.get(not_found_key)
+            if expires_at is not None:
+                if expires_at > time.monotonic():
+                    raise ArrClientNotFoundError(
+                        f"{self.service_name}: Resource not found at {endpoint}"
+                    )
+                del self._not_found[not_found_key]
+
         url = self._build_url(endpoint)
-        headers = self._get_headers()
+        content = None
+        if json is not None:
+            content = self._dumps(json)
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = await self._send_once(
+                    method,
+                    url,
+                    params,
+                    content,
+                    {**self._headers, **headers} if headers else self._headers
+                )
+            except (httpx.ConnectError, httpx.ReadError, httpx.RemoteProtocolError) as e:
+                if attempt == self.max_retries:
+                    raise ArrClientConnectionError(
+                        f"{self.service_name}: Could not connect to {self.base_url}"
+                    ) from e
+                await asyncio.sleep(_full_jitter_delay(attempt))
+                continue
+            except httpx.TimeoutException as e:
+                raise ArrClientConnectionError(f"{self.service_name}: Request timed out") from e
+
+            status_code = response.status_code
+            if status_code in PLEX_RETRY_STATUS_CODES and attempt < self.max_retries:
+                delay = _retry_after(response)
+                await asyncio.sleep(
+                    min(delay, RETRY_CAP) if delay is not None else _full_jitter_delay(attempt)
+                )
+                continue
+
+            if status_code == 401:
+                raise ArrClientAuthError(
+                    f"{self.service_name}: Authentication failed. Check your token."
+                )
+            elif status_code == 404:
+                if not_found_key is not None:
+                    if len(self._not_found) >= NOT_FOUND_MAX_SIZE:
+                        self._not_found.pop(next(iter(self._not_found)))
+                    self._not_found[not_found_key] = time.monotonic() + NOT_FOUND_TTL
+                raise ArrClientNotFoundError(
+                    f"{self.service_name}: Resource not found at {endpoint}"
+                )
+            elif status_code >= 400:
+                raise ArrClientError(f"{self.service_name}: HTTP {status_code}")
+            elif status_code == 304:
+                return response
 
-        # Add token to params for Plex
-        if params is None:
-            params = {}
-        params["X-Plex-Token"] = self.token
+            response.raise_for_status()
+            if not_found_key is None and self._not_found:
+                self._forget_not_found("/".join(endpoint.lstrip("/").split("/", 2)[:2]))
+            return response
 
+    async def _send_once(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict[str, Any]],
+        content: Optional[bytes],
+        headers: dict[str, str]
+    ) -> httpx.Response:
+        """Send one request once a max_inflight slot is free."""
+        self._queued += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._queued -= 1
+        self._in_flight += 1
         try:
-            response = await self.client.request(
+            return await self.client.request(
                 method=method,
                 url=url,
-                headers=headers,
                 params=params,
-                json=json
+                content=content,
+                headers=headers,
+                timeout=self.timeout
             )
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
 
-            if response.status_code == 401:
-                raise ArrClientError(f"{self.service_name}: Authentication failed. Check your token.")
-            elif response.status_code == 404:
-                raise ArrClientError(f"{self.service_name}: Resource not found at {endpoint}")
-            elif response.status_code >= 400:
-                raise ArrClientError(f"{self.service_name}: HTTP {response.status_code}")
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Optional[dict[str, Any]] = None
+    ) -> Any:
+        """Make an HTTP request to Plex and return the parsed JSON body."""
+        response = await self._send(method, endpoint, params=params, json=json)
 
-            response.raise_for_status()
+        if not response.content:
+            return None
 
-            if not response.content:
-                return None
+        return self._loads(response.content)
 
-            return response.json()
+    async def cached_get(
+        self,
+        endpoint: str,
+        params: Optional[dict[str, Any]] = None,
+        ttl: float = CACHE_TTL
+    ) -> Any:
+        """
+        Make a GET request, caching the parsed response for ttl seconds.
+
+        Once an entry expires it is revalidated with If-None-Match /
+        If-Modified-Since, so an unchanged resource costs only a 304.
+        Responses marked Cache-Control: no-store are not cached.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            ttl: Seconds to serve the cached value without revalidating
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        entry = self._cache.get(key)
+        now = time.monotonic()
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        headers = {}
+        if entry is not None:
+            if entry[2]:
+                headers["If-None-Match"] = entry[2]
+            if entry[3]:
+                headers["If-Modified-Since"] = entry[3]
+
+        response = await self._send(
+            "GET", endpoint, params=dict(params) if params else None, headers=headers or None
+        )
+        if response.status_code == 304 and entry is not None:
+            value = entry[1]
+        else:
+            value = self._loads(response.content) if response.content else None
+
+        if "no-store" not in response.headers.get("Cache-Control", ""):
+            self._cache.pop(key, None)
+            if len(self._cache) >= CACHE_MAX_SIZE:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = (
+                now + ttl,
+                value,
+                response.headers.get("ETag", entry[2] if entry else None),
+                response.headers.get("Last-Modified", entry[3] if entry else None)
+            )
+        return value
 
-        except httpx.ConnectError as e:
-            if retry_count < self.max_retries:
-                return await self._request(method, endpoint, params, json, retry_count + 1)
-            raise ArrClientError(f"{self.service_name}: Could not connect to {self.base_url}") from e
-        except httpx.TimeoutException as e:
-            raise ArrClientError(f"{self.service_name}: Request timed out") from e
+    def invalidate_cache(self, prefix: str = "") -> None:
+        """Drop cached responses and 404s for endpoints starting with prefix (all by default)."""
+        for key in [key for key in self._cache if key[0].startswith(prefix)]:
+            del self._cache[key]
+        self._forget_not_found(prefix)
+
+    def _forget_not_found(self, prefix: str) -> None:
+        """Drop remembered 404s for endpoints starting with prefix."""
+        for key in [key for key in self._not_found if key[0].lstrip("/").startswith(prefix)]:
+            del self._not_found[key]
 
     async def get(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> Any:
-        """Make a GET request."""
-        return await self._request("GET", endpoint, params=params)
+        """
+        Make a GET request.
 
-    async def post(self, endpoint: str, json: Optional[dict[str, Any]] = None) -> Any:
+        Concurrent GETs for the same endpoint and params share a single
+        in-flight request and receive the same parsed response.
+        """
+        key = (endpoint, tuple(sorted(params.items())) if params else ())
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._request("GET", endpoint, params=params))
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def post(
+        self,
+        endpoint: str,
+        json: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None
+    ) -> Any:
         """Make a POST request."""
-        return await self._request("POST", endpoint, json=json)
+        return await self._request("POST", endpoint, params=params, json=json)
 
     async def put(self, endpoint: str, params: Optional[dict[str, Any]] = None) -> Any:
         """Make a PUT request."""
@@ -112,26 +444,58 @@ class PlexClient:
     # Server Information
     async def get_server_identity(self) -> dict[str, Any]:
         """Get server identity information."""
-        return await self.get("identity")
+        return await self.cached_get("identity")
+
+    async def _library_uri(self, rating_keys: list[str]) -> str:
+        """Build the server:// URI Plex expects when referencing library items."""
+        if self._library_uri_prefix is None:
+            identity = await self.get_server_identity()
+            machine_id = _mc_dict(identity).get("machineIdentifier", "")
+            self._library_uri_prefix = LIBRARY_URI_TEMPLATE % machine_id
+        return self._library_uri_prefix + ",".join(map(str, rating_keys))
 
     async def get_server_capabilities(self) -> dict[str, Any]:
         """Get server capabilities."""
-        return await self.get("")
+        return await self.cached_get("")
 
     async def get_system_accounts(self) -> dict[str, Any]:
         """Get system accounts."""
         return await self.get("accounts")
 
+    async def _iter_pages(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        page_size: int
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield MediaContainer.Metadata items page by page via X-Plex-Container-Start/Size."""
+        start = 0
+        while True:
+            response = await self.get(endpoint, params={
+                **params,
+                "X-Plex-Container-Start": start,
+                "X-Plex-Container-Size": page_size
+            })
+            container = _mc_dict(response)
+            items = container.get("Metadata", [])
+            for item in items:
+                yield item
+
+            start += len(items)
+            total = container.get("totalSize")
+            if len(items) < page_size or (total is not None and start >= total):
+                return
+
     # Library Management
     async def get_libraries(self) -> list[dict[str, Any]]:
         """Get all libraries."""
-        response = await self.get("library/sections")
-        return response.get("MediaContainer", {}).get("Directory", [])
+        response = await self.cached_get("library/sections")
+        return _mc_list(response, "Directory")
 
     async def get_library(self, section_id: int) -> dict[str, Any]:
         """Get specific library by section ID."""
         response = await self.get(f"library/sections/{section_id}")
-        return response.get("MediaContainer", {})
+        return _mc_dict(response)
 
     async def get_library_items(
         self,
@@ -150,19 +514,46 @@ class PlexClient:
             params["type"] = item_type
 
         response = await self.get(f"library/sections/{section_id}/all", params=params)
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
+
+    async def iter_library_items(
+        self,
+        section_id: int,
+        item_type: Optional[str] = None,
+        page_size: int = 200
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate over the items in a library one page at a time.
+
+        Args:
+            section_id: Library section ID
+            item_type: Filter by type (movie, show, artist, photo)
+            page_size: Items fetched per request
+
+        Yields:
+            Library items
+        """
+        params = {}
+        if item_type:
+            params["type"] = item_type
+
+        async for item in self._iter_pages(f"library/sections/{section_id}/all", params, page_size):
+            yield item
 
     async def refresh_library(self, section_id: int) -> None:
         """Refresh a library section."""
         await self.get(f"library/sections/{section_id}/refresh")
+        self.invalidate_cache("library/sections")
 
     async def scan_library(self, section_id: int) -> None:
         """Force scan a library section."""
         await self.get(f"library/sections/{section_id}/refresh?force=1")
+        self.invalidate_cache("library/sections")
 
     async def empty_library_trash(self, section_id: int) -> None:
         """Empty trash for a library section."""
         await self.put(f"library/sections/{section_id}/emptyTrash")
+        self.invalidate_cache("library/sections")
 
     async def optimize_database(self) -> None:
         """Optimize the Plex database."""
@@ -192,26 +583,76 @@ class PlexClient:
             params["sectionId"] = section_id
 
         response = await self.get("search", params=params)
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
 
     # Media Items
     async def get_metadata(self, rating_key: str) -> dict[str, Any]:
         """Get metadata for a specific item."""
-        response = await self.get(f"library/metadata/{rating_key}")
-        return response.get("MediaContainer", {}).get("Metadata", [{}])[0]
+        response = await self.get(self._URL_METADATA % rating_key)
+        items = _mc_list(response, "Metadata")
+        return items[0] if items else {}
+
+    async def get_metadata_many(self, rating_keys: list[str]) -> list[Any]:
+        """
+        Get metadata for several items at once.
+
+        Numeric rating keys are fetched in a single request via Plex's
+        comma-separated metadata endpoint; otherwise items are fetched
+        concurrently.
+
+        Returns:
+            Metadata for each rating key, in order. Concurrent fetches
+            return the exception in place of items that failed.
+        """
+        if not rating_keys:
+            return []
+        keys = [str(key) for key in rating_keys]
+        if all(key.isdigit() for key in keys):
+            response = await self.get(self._URL_METADATA % ",".join(keys))
+            by_key = {
+                str(item.get("ratingKey")): item
+                for item in _mc_list(response, "Metadata")
+            }
+            return [by_key.get(key, {}) for key in keys]
+        return await self._gather_limited([self.get_metadata(key) for key in keys])
 
     async def get_children(self, rating_key: str) -> list[dict[str, Any]]:
         """Get children of an item (e.g., seasons of a show)."""
-        response = await self.get(f"library/metadata/{rating_key}/children")
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        response = await self.get(self._URL_METADATA_CHILDREN % rating_key)
+        return _mc_list(response, "Metadata")
+
+    async def get_children_many(self, rating_keys: list[str]) -> list[Any]:
+        """Get children of several items concurrently (exceptions in place of failures)."""
+        return await self._gather_limited([self.get_children(key) for key in rating_keys])
 
-    async def mark_watched(self, rating_key: str) -> None:
-        """Mark an item as watched."""
-        await self.get(f":/scrobble?key={rating_key}&identifier=com.plexapp.plugins.library")
+    async def mark_watched(self, rating_key: str, await_completion: bool = False) -> None:
+        """
+        Mark an item as watched.
 
-    async def mark_unwatched(self, rating_key: str) -> None:
-        """Mark an item as unwatched."""
-        await self.get(f":/unscrobble?key={rating_key}&identifier=com.plexapp.plugins.library")
+        The request runs in the background unless await_completion is set;
+        background failures are logged.
+        """
+        await self._scrobble(":/scrobble", rating_key, await_completion)
+
+    async def mark_unwatched(self, rating_key: str, await_completion: bool = False) -> None:
+        """Mark an item as unwatched (in the background unless await_completion is set)."""
+        await self._scrobble(":/unscrobble", rating_key, await_completion)
+
+    async def mark_watched_many(self, rating_keys: list[str]) -> list[Any]:
+        """Mark several items as watched concurrently (exceptions in place of failures)."""
+        return await self._gather_limited([
+            self.mark_watched(key, await_completion=True) for key in rating_keys
+        ])
+
+    async def _scrobble(self, endpoint: str, rating_key: str, await_completion: bool) -> None:
+        """Send a (un)scrobble request, optionally without waiting for it."""
+        request = self._request(
+            "GET", endpoint, params={"key": rating_key, "identifier": "com.plexapp.plugins.library"}
+        )
+        if await_completion:
+            await request
+        else:
+            self._spawn(request)
 
     async def update_metadata(
         self,
@@ -225,11 +666,12 @@ class PlexClient:
             rating_key: Item rating key
             **fields: Fields to update (title, summary, etc.)
         """
-        return await self.put(f"library/metadata/{rating_key}", params=fields)
+        return await self.put(self._URL_METADATA % rating_key, params=fields)
 
     async def delete_metadata(self, rating_key: str) -> None:
         """Delete an item from library."""
-        await self.delete(f"library/metadata/{rating_key}")
+        await self.delete(self._URL_METADATA % rating_key)
+        self.invalidate_cache("library/sections")
 
     # Recently Added
     async def get_recently_added(
@@ -246,28 +688,28 @@ class PlexClient:
         else:
             response = await self.get("library/recentlyAdded")
 
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
 
     async def get_on_deck(self) -> list[dict[str, Any]]:
         """Get On Deck items (in progress)."""
         response = await self.get("library/onDeck")
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
 
     # Playlists
     async def get_playlists(self) -> list[dict[str, Any]]:
         """Get all playlists."""
         response = await self.get("playlists")
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
 
     async def get_playlist(self, playlist_id: str) -> dict[str, Any]:
         """Get specific playlist."""
         response = await self.get(f"playlists/{playlist_id}")
-        return response.get("MediaContainer", {})
+        return _mc_dict(response)
 
     async def get_playlist_items(self, playlist_id: str) -> list[dict[str, Any]]:
         """Get items in a playlist."""
         response = await self.get(f"playlists/{playlist_id}/items")
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
 
     async def create_playlist(
         self,
@@ -287,7 +729,7 @@ class PlexClient:
             "title": title,
             "type": "video",
             "smart": "1" if smart else "0",
-            "uri": f"server://{{machineIdentifier}}/com.plexapp.plugins.library/library/metadata/{','.join(items)}"
+            "uri": await self._library_uri(items)
         }
         return await self.post("playlists", params=params)
 
@@ -295,7 +737,7 @@ class PlexClient:
     async def get_sessions(self) -> list[dict[str, Any]]:
         """Get current active sessions (what's playing)."""
         response = await self.get("status/sessions")
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
 
     async def get_session_history(
         self,
@@ -310,7 +752,20 @@ class PlexClient:
             params["X-Plex-Container-Size"] = limit
 
         response = await self.get("status/sessions/history/all", params=params)
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
+
+    async def iter_session_history(
+        self,
+        account_id: Optional[int] = None,
+        page_size: int = 200
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over session history (watch history), newest first, one page at a time."""
+        params = {"sort": "viewedAt:desc"}
+        if account_id:
+            params["accountID"] = account_id
+
+        async for item in self._iter_pages("status/sessions/history/all", params, page_size):
+            yield item
 
     async def terminate_session(self, session_id: str, reason: str = "Terminated by admin") -> None:
         """Terminate an active session."""
@@ -320,18 +775,18 @@ class PlexClient:
     async def get_users(self) -> list[dict[str, Any]]:
         """Get all shared users."""
         response = await self.get("accounts")
-        return response.get("MediaContainer", {}).get("Account", [])
+        return _mc_list(response, "Account")
 
     async def get_user_servers(self, user_id: str) -> list[dict[str, Any]]:
         """Get servers shared with a user."""
         response = await self.get(f"accounts/{user_id}/servers")
-        return response.get("MediaContainer", {}).get("Server", [])
+        return _mc_list(response, "Server")
 
     # Transcoding
     async def get_transcode_sessions(self) -> list[dict[str, Any]]:
         """Get active transcode sessions."""
         response = await self.get("transcode/sessions")
-        return response.get("MediaContainer", {}).get("TranscodeSession", [])
+        return _mc_list(response, "TranscodeSession")
 
     async def kill_transcode_session(self, session_key: str) -> None:
         """Kill a transcode session."""
@@ -341,7 +796,7 @@ class PlexClient:
     async def get_server_stats(self) -> dict[str, Any]:
         """Get server statistics."""
         response = await self.get("statistics/media")
-        return response.get("MediaContainer", {})
+        return _mc_dict(response)
 
     async def get_bandwidth_stats(
         self,
@@ -354,18 +809,18 @@ class PlexClient:
             timespan: Timespan in months
         """
         response = await self.get(f"statistics/bandwidth?timespan={timespan}")
-        return response.get("MediaContainer", {})
+        return _mc_dict(response)
 
     async def get_resources_stats(self) -> dict[str, Any]:
         """Get resource usage statistics."""
         response = await self.get("statistics/resources")
-        return response.get("MediaContainer", {})
+        return _mc_dict(response)
 
     # Notifications and Activities
     async def get_activities(self) -> list[dict[str, Any]]:
         """Get current background activities."""
         response = await self.get("activities")
-        return response.get("MediaContainer", {}).get("Activity", [])
+        return _mc_list(response, "Activity")
 
     async def cancel_activity(self, activity_uuid: str) -> None:
         """Cancel a background activity."""
@@ -374,17 +829,18 @@ class PlexClient:
     # Preferences
     async def get_preferences(self) -> list[dict[str, Any]]:
         """Get server preferences."""
-        response = await self.get(":/prefs")
-        return response.get("MediaContainer", {}).get("Setting", [])
+        response = await self.cached_get(":/prefs")
+        return _mc_list(response, "Setting")
 
     async def update_preference(self, pref_id: str, value: str) -> None:
         """Update a server preference."""
         await self.put(f":/prefs?{pref_id}={value}")
+        self.invalidate_cache(":/prefs")
 
     # Butler (Scheduled Tasks)
     async def get_butler_tasks(self) -> list[dict[str, Any]]:
         """Get Butler scheduled tasks."""
-        response = await self.get("butler")
+        response = await self.cached_get("butler")
         return response.get("ButlerTasks", {}).get("ButlerTask", [])
 
     async def start_butler_task(self, task_name: str) -> None:
@@ -395,25 +851,34 @@ class PlexClient:
             task_name: Task name (e.g., BackupDatabase, OptimizeDatabase, CleanOldBundles)
         """
         await self.post(f"butler/{task_name}")
+        self.invalidate_cache("butler")
 
     # Media Analysis
     async def analyze_media(self, rating_key: str) -> None:
         """Analyze media file (thumbnails, etc.)."""
-        await self.put(f"library/metadata/{rating_key}/analyze")
+        await self.put(self._URL_METADATA_ANALYZE % rating_key)
 
     async def refresh_metadata(self, rating_key: str) -> None:
         """Refresh metadata for an item."""
-        await self.put(f"library/metadata/{rating_key}/refresh")
+        await self.put(self._URL_METADATA_REFRESH % rating_key)
+
+    async def refresh_metadata_many(self, rating_keys: list[str]) -> list[Any]:
+        """Refresh metadata for several items concurrently (exceptions in place of failures)."""
+        return await self._gather_limited([self.refresh_metadata(key) for key in rating_keys])
+
+    async def analyze_media_many(self, rating_keys: list[str]) -> list[Any]:
+        """Analyze several media items concurrently (exceptions in place of failures)."""
+        return await self._gather_limited([self.analyze_media(key) for key in rating_keys])
 
     async def match_media(self, rating_key: str) -> None:
         """Match media to metadata."""
-        await self.put(f"library/metadata/{rating_key}/match")
+        await self.put(self._URL_METADATA_MATCH % rating_key)
 
     # Collections
     async def get_collections(self, section_id: int) -> list[dict[str, Any]]:
         """Get collections in a library."""
         response = await self.get(f"library/sections/{section_id}/collections")
-        return response.get("MediaContainer", {}).get("Metadata", [])
+        return _mc_list(response, "Metadata")
 
     async def create_collection(
         self,
@@ -434,13 +899,16 @@ class PlexClient:
             "title": title,
             "smart": "0",
             "sectionId": section_id,
-            "uri": f"server://{{machineIdentifier}}/com.plexapp.plugins.library/library/metadata/{','.join(items)}"
+            "uri": await self._library_uri(items)
         }
         return await self.post("library/collections", params=params)
 
     async def add_to_collection(self, collection_key: str, rating_key: str) -> None:
         """Add an item to a collection."""
-        await self.put(f"library/collections/{collection_key}/items", params={"uri": f"server://{{machineIdentifier}}/com.plexapp.plugins.library/library/metadata/{rating_key}"})
+        await self.put(
+            f"library/collections/{collection_key}/items",
+            params={"uri": await self._library_uri([rating_key])}
+        )
 
     # Webhooks
     async def test_webhook(self, url: str) -> dict[str, Any]:
@@ -448,8 +916,17 @@ class PlexClient:
         return await self.get(":/webhook/test", params={"url": url})
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """
+        Wait for background requests, then close the HTTP client if this
+        instance owns it. Safe to call more than once.
+        """
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+        if self._owns_client and self._client is not None:
+            client, self._client = self._client, None
+            self._finalizer.detach()
+            if not client.is_closed:
+                await client.aclose()
 
     async def __aenter__(self):
         """Async context manager entry."""
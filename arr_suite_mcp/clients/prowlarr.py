@@ -1,15 +1,27 @@
 """Prowlarr API client."""
 
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Optional, Sequence
+import orjson
 from .base import BaseArrClient
 
 
+# Constant command bodies, encoded once
+_APPLICATION_SYNC_COMMAND = orjson.dumps({"name": "ApplicationSync"})
+
+
+@lru_cache(maxsize=128)
+def _join_ids(ids: tuple[int, ...]) -> str:
+    """Comma-join IDs for a query parameter, cached for repeated searches."""
+    return ",".join(map(str, ids))
+
+
 class ProwlarrClient(BaseArrClient):
     """Client for interacting with Prowlarr API."""
 
-    @property
-    def service_name(self) -> str:
-        return "Prowlarr"
+    __slots__ = ()
+
+    service_name = "Prowlarr"
 
     # Indexer Management
     async def get_all_indexers(self) -> list[dict[str, Any]]:
@@ -44,8 +56,8 @@ class ProwlarrClient(BaseArrClient):
     async def search(
         self,
         query: str,
-        indexer_ids: Optional[list[int]] = None,
-        categories: Optional[list[int]] = None,
+        indexer_ids: Optional[Sequence[int]] = None,
+        categories: Optional[Sequence[int]] = None,
         type: str = "search"
     ) -> list[dict[str, Any]]:
         """
@@ -62,9 +74,9 @@ class ProwlarrClient(BaseArrClient):
         """
         params = {"query": query, "type": type}
         if indexer_ids:
-            params["indexerIds"] = ",".join(map(str, indexer_ids))
+            params["indexerIds"] = _join_ids(tuple(indexer_ids))
         if categories:
-            params["categories"] = ",".join(map(str, categories))
+            params["categories"] = _join_ids(tuple(categories))
 
         return await self.get("search", params=params)
 
@@ -102,15 +114,12 @@ class ProwlarrClient(BaseArrClient):
 
     async def sync_all_applications(self) -> dict[str, Any]:
         """Sync indexers to all applications."""
-        return await self.post(
-            "command",
-            json={"name": "ApplicationSync"}
-        )
+        return await self.post_raw("command", _APPLICATION_SYNC_COMMAND)
 
     # Tags
     async def get_tags(self) -> list[dict[str, Any]]:
         """Get all tags."""
-        return await self.get("tag")
+        return await self.cached_get("tag")
 
     async def create_tag(self, label: str) -> dict[str, Any]:
         """Create a new tag."""
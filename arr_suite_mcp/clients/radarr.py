@@ -1,24 +1,37 @@
 """Radarr API client."""
 
-from typing import Any, Optional
-from .base import BaseArrClient
+import asyncio
+from typing import Any, AsyncIterator, Optional
+import orjson
+from .base import endpoint
+from .common import _CommonArrMixin
 
 
-class RadarrClient(BaseArrClient):
+# Constant command bodies, encoded once
+_REFRESH_MONITORED_DOWNLOADS_COMMAND = orjson.dumps({"name": "RefreshMonitoredDownloads"})
+_RSS_SYNC_COMMAND = orjson.dumps({"name": "RssSync"})
+
+
+class RadarrClient(_CommonArrMixin):
     """Client for interacting with Radarr API."""
 
-    @property
-    def service_name(self) -> str:
-        return "Radarr"
+    __slots__ = ()
+
+    service_name = "Radarr"
 
     # Movie Management
-    async def get_all_movies(self) -> list[dict[str, Any]]:
-        """Get all movies in Radarr."""
-        return await self.get("movie")
+    get_all_movies = endpoint("GET", "movie", "Get all movies in Radarr.")
+
+    def iter_all_movies(self, fields: Optional[set[str]] = None) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream all movies without buffering the whole response.
+
+        Args:
+            fields: Keys to keep from each movie (e.g. {"id", "title"}); all by default
+        """
+        return self.stream_get("movie", "item", fields=fields)
 
-    async def get_movie(self, movie_id: int) -> dict[str, Any]:
-        """Get a specific movie by ID."""
-        return await self.get(f"movie/{movie_id}")
+    get_movie = endpoint("GET", "movie/{movie_id}", "Get a specific movie by ID.")
 
     async def lookup_movie(self, term: str) -> list[dict[str, Any]]:
         """
@@ -62,24 +75,55 @@ class RadarrClient(BaseArrClient):
         if not lookup_results:
             raise ValueError(f"Movie with TMDB ID {tmdb_id} not found")
 
-        movie_data = lookup_results[0]
-        movie_data.update({
-            "qualityProfileId": quality_profile_id,
-            "rootFolderPath": root_folder_path,
-            "monitored": monitored,
-            "minimumAvailability": minimum_availability,
-            "addOptions": {
-                "searchForMovie": search_for_movie
-            },
-            **kwargs
-        })
+        # Copy: lookup results may be shared with coalesced callers
+        movie_data = dict(lookup_results[0])
+        movie_data["qualityProfileId"] = quality_profile_id
+        movie_data["rootFolderPath"] = root_folder_path
+        movie_data["monitored"] = monitored
+        movie_data["minimumAvailability"] = minimum_availability
+        movie_data["addOptions"] = {"searchForMovie": search_for_movie}
+        if kwargs:
+            movie_data.update(kwargs)
 
         return await self.post("movie", json=movie_data)
 
+    async def add_movies_bulk(self, specs: list[dict[str, Any]]) -> list[Any]:
+        """
+        Add several movies concurrently.
+
+        Args:
+            specs: Keyword arguments for add_movie() per movie
+
+        Returns:
+            Added movie data per spec, in order, with the exception in place
+            of any that failed
+        """
+        return await asyncio.gather(
+            *(self.add_movie(**spec) for spec in specs),
+            return_exceptions=True
+        )
+
     async def update_movie(self, movie_data: dict[str, Any]) -> dict[str, Any]:
         """Update an existing movie."""
         return await self.put("movie", json=movie_data)
 
+    async def edit_movies_bulk(
+        self,
+        movie_ids: list[int],
+        changes: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Apply the same changes to several movies in one request.
+
+        Args:
+            movie_ids: IDs of the movies to edit
+            changes: Movie editor fields (e.g. monitored, qualityProfileId, tags)
+
+        Returns:
+            Updated movie data for each edited movie
+        """
+        return await self.put("movie/editor", json={**changes, "movieIds": movie_ids})
+
     async def delete_movie(
         self,
         movie_id: int,
@@ -102,24 +146,19 @@ class RadarrClient(BaseArrClient):
             json={"name": "MoviesSearch", "movieIds": [movie_id]}
         )
 
+    async def search_movies(self, movie_ids: list[int]) -> dict[str, Any]:
+        """Trigger one search command covering several movies."""
+        return await self.post(
+            "command",
+            json={"name": "MoviesSearch", "movieIds": movie_ids}
+        )
+
     # Collections
-    async def get_collections(self) -> list[dict[str, Any]]:
-        """Get all movie collections."""
-        return await self.get("collection")
+    get_collections = endpoint("GET", "collection", "Get all movie collections.")
 
-    async def get_collection(self, collection_id: int) -> dict[str, Any]:
-        """Get a specific collection."""
-        return await self.get(f"collection/{collection_id}")
+    get_collection = endpoint("GET", "collection/{collection_id}", "Get a specific collection.")
 
     # Quality Profiles
-    async def get_quality_profiles(self) -> list[dict[str, Any]]:
-        """Get all quality profiles."""
-        return await self.get("qualityprofile")
-
-    async def get_quality_profile(self, profile_id: int) -> dict[str, Any]:
-        """Get a specific quality profile."""
-        return await self.get(f"qualityprofile/{profile_id}")
-
     async def create_quality_profile(
         self,
         profile_data: dict[str, Any]
@@ -134,31 +173,17 @@ class RadarrClient(BaseArrClient):
         """Update a quality profile."""
         return await self.put("qualityprofile", json=profile_data)
 
-    async def delete_quality_profile(self, profile_id: int) -> None:
-        """Delete a quality profile."""
-        await self.delete(f"qualityprofile/{profile_id}")
+    delete_quality_profile = endpoint(
+        "DELETE", "qualityprofile/{profile_id}", "Delete a quality profile."
+    )
 
     # Root Folders
-    async def get_root_folders(self) -> list[dict[str, Any]]:
-        """Get all root folders."""
-        return await self.get("rootfolder")
-
     async def add_root_folder(self, path: str) -> dict[str, Any]:
         """Add a new root folder."""
         return await self.post("rootfolder", json={"path": path})
 
     # Tags
-    async def get_tags(self) -> list[dict[str, Any]]:
-        """Get all tags."""
-        return await self.get("tag")
-
-    async def create_tag(self, label: str) -> dict[str, Any]:
-        """Create a new tag."""
-        return await self.post("tag", json={"label": label})
-
-    async def delete_tag(self, tag_id: int) -> None:
-        """Delete a tag."""
-        await self.delete(f"tag/{tag_id}")
+    delete_tag = endpoint("DELETE", "tag/{tag_id}", "Delete a tag.")
 
     # Queue
     async def get_queue(
@@ -177,19 +202,18 @@ class RadarrClient(BaseArrClient):
             }
         )
 
-    async def delete_queue_item(
+    def iter_queue(
         self,
-        queue_id: int,
-        remove_from_client: bool = True,
-        blocklist: bool = False
-    ) -> None:
-        """Remove an item from the queue."""
-        await self.delete(
-            f"queue/{queue_id}",
-            params={
-                "removeFromClient": remove_from_client,
-                "blocklist": blocklist
-            }
+        include_unknown_movies: bool = False,
+        page_size: int = 200,
+        concurrency: int = 10
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the whole download queue, prefetching pages concurrently."""
+        return self._iter_pages(
+            "queue",
+            params={"includeUnknownMovieItems": include_unknown_movies},
+            page_size=page_size,
+            concurrency=concurrency
         )
 
     # History
@@ -208,19 +232,22 @@ class RadarrClient(BaseArrClient):
             params["eventType"] = event_type
         return await self.get("history", params=params)
 
-    # Calendar
-    async def get_calendar(
+    def iter_history(
         self,
-        start: Optional[str] = None,
-        end: Optional[str] = None
-    ) -> list[dict[str, Any]]:
-        """Get upcoming movies."""
+        movie_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        page_size: int = 200,
+        concurrency: int = 10
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the whole history, prefetching pages concurrently."""
         params = {}
-        if start:
-            params["start"] = start
-        if end:
-            params["end"] = end
-        return await self.get("calendar", params=params)
+        if movie_id:
+            params["movieId"] = movie_id
+        if event_type:
+            params["eventType"] = event_type
+        return self._iter_pages(
+            "history", params=params, page_size=page_size, concurrency=concurrency
+        )
 
     # Commands
     async def refresh_movie(self, movie_id: int) -> dict[str, Any]:
@@ -244,52 +271,23 @@ class RadarrClient(BaseArrClient):
             json={"name": "RenameMovie", "movieIds": [movie_id]}
         )
 
-    async def backup_database(self) -> dict[str, Any]:
-        """Trigger a database backup."""
-        return await self.post("command", json={"name": "Backup"})
-
     async def refresh_monitored_downloads(self) -> dict[str, Any]:
         """Refresh monitored downloads."""
-        return await self.post(
-            "command",
-            json={"name": "RefreshMonitoredDownloads"}
-        )
+        return await self.post_raw("command", _REFRESH_MONITORED_DOWNLOADS_COMMAND)
 
     async def rss_sync(self) -> dict[str, Any]:
         """Trigger RSS sync."""
-        return await self.post("command", json={"name": "RssSync"})
-
-    # Config
-    async def get_config(self, section: str) -> dict[str, Any]:
-        """
-        Get configuration for a specific section.
-
-        Args:
-            section: Config section (e.g., 'ui', 'naming', 'mediamanagement')
-        """
-        return await self.get(f"config/{section}")
-
-    async def update_config(
-        self,
-        section: str,
-        config_data: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Update configuration for a specific section."""
-        return await self.put(f"config/{section}", json=config_data)
+        return await self.post_raw("command", _RSS_SYNC_COMMAND)
 
     # Import Lists
-    async def get_import_lists(self) -> list[dict[str, Any]]:
-        """Get all import lists."""
-        return await self.get("importlist")
+    get_import_lists = endpoint("GET", "importlist", "Get all import lists.")
 
     async def test_import_list(self, list_data: dict[str, Any]) -> dict[str, Any]:
         """Test an import list configuration."""
         return await self.post("importlist/test", json=list_data)
 
     # Notifications
-    async def get_notifications(self) -> list[dict[str, Any]]:
-        """Get all notification configurations."""
-        return await self.get("notification")
+    get_notifications = endpoint("GET", "notification", "Get all notification configurations.")
 
     async def test_notification(
         self,
@@ -1,24 +1,31 @@
 """Sonarr API client."""
 
-from typing import Any, Optional
-from .base import BaseArrClient
+import asyncio
+from typing import Any, AsyncIterator, Optional
+from .base import endpoint
+from .common import _CommonArrMixin
 
 
-class SonarrClient(BaseArrClient):
+class SonarrClient(_CommonArrMixin):
     """Client for interacting with Sonarr API."""
 
-    @property
-    def service_name(self) -> str:
-        return "Sonarr"
+    __slots__ = ()
+
+    service_name = "Sonarr"
 
     # Series Management
-    async def get_all_series(self) -> list[dict[str, Any]]:
-        """Get all series in Sonarr."""
-        return await self.get("series")
+    get_all_series = endpoint("GET", "series", "Get all series in Sonarr.")
 
-    async def get_series(self, series_id: int) -> dict[str, Any]:
-        """Get a specific series by ID."""
-        return await self.get(f"series/{series_id}")
+    def iter_all_series(self, fields: Optional[set[str]] = None) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream all series without buffering the whole response.
+
+        Args:
+            fields: Keys to keep from each series (e.g. {"id", "title"}); all by default
+        """
+        return self.stream_get("series", "item", fields=fields)
+
+    get_series = endpoint("GET", "series/{series_id}", "Get a specific series by ID.")
 
     async def lookup_series(self, term: str) -> list[dict[str, Any]]:
         """Search for series by name."""
@@ -54,24 +61,55 @@ class SonarrClient(BaseArrClient):
         if not lookup_results:
             raise ValueError(f"Series with TVDB ID {tvdb_id} not found")
 
-        series_data = lookup_results[0]
-        series_data.update({
-            "qualityProfileId": quality_profile_id,
-            "rootFolderPath": root_folder_path,
-            "monitored": monitored,
-            "seasonFolder": season_folder,
-            "addOptions": {
-                "searchForMissingEpisodes": search_for_missing
-            },
-            **kwargs
-        })
+        # Copy: lookup results may be shared with coalesced callers
+        series_data = dict(lookup_results[0])
+        series_data["qualityProfileId"] = quality_profile_id
+        series_data["rootFolderPath"] = root_folder_path
+        series_data["monitored"] = monitored
+        series_data["seasonFolder"] = season_folder
+        series_data["addOptions"] = {"searchForMissingEpisodes": search_for_missing}
+        if kwargs:
+            series_data.update(kwargs)
 
         return await self.post("series", json=series_data)
 
+    async def add_series_bulk(self, specs: list[dict[str, Any]]) -> list[Any]:
+        """
+        Add several series concurrently.
+
+        Args:
+            specs: Keyword arguments for add_series() per series
+
+        Returns:
+            Added series data per spec, in order, with the exception in place
+            of any that failed
+        """
+        return await asyncio.gather(
+            *(self.add_series(**spec) for spec in specs),
+            return_exceptions=True
+        )
+
     async def update_series(self, series_data: dict[str, Any]) -> dict[str, Any]:
         """Update an existing series."""
         return await self.put("series", json=series_data)
 
+    async def edit_series_bulk(
+        self,
+        series_ids: list[int],
+        changes: dict[str, Any]
+    ) -> list[dict[str, Any]]:
+        """
+        Apply the same changes to several series in one request.
+
+        Args:
+            series_ids: IDs of the series to edit
+            changes: Series editor fields (e.g. monitored, qualityProfileId, tags)
+
+        Returns:
+            Updated series data for each edited series
+        """
+        return await self.put("series/editor", json={**changes, "seriesIds": series_ids})
+
     async def delete_series(
         self,
         series_id: int,
@@ -88,9 +126,7 @@ class SonarrClient(BaseArrClient):
         """Get all episodes for a series."""
         return await self.get("episode", params={"seriesId": series_id})
 
-    async def get_episode(self, episode_id: int) -> dict[str, Any]:
-        """Get a specific episode by ID."""
-        return await self.get(f"episode/{episode_id}")
+    get_episode = endpoint("GET", "episode/{episode_id}", "Get a specific episode by ID.")
 
     async def update_episode(self, episode_data: dict[str, Any]) -> dict[str, Any]:
         """Update an episode."""
@@ -103,6 +139,13 @@ class SonarrClient(BaseArrClient):
             json={"name": "EpisodeSearch", "episodeIds": [episode_id]}
         )
 
+    async def search_episodes(self, episode_ids: list[int]) -> dict[str, Any]:
+        """Trigger one search command covering several episodes."""
+        return await self.post(
+            "command",
+            json={"name": "EpisodeSearch", "episodeIds": episode_ids}
+        )
+
     async def search_series(self, series_id: int) -> dict[str, Any]:
         """Trigger a search for all missing episodes in a series."""
         return await self.post(
@@ -110,29 +153,6 @@ class SonarrClient(BaseArrClient):
             json={"name": "SeriesSearch", "seriesId": series_id}
         )
 
-    # Quality Profiles
-    async def get_quality_profiles(self) -> list[dict[str, Any]]:
-        """Get all quality profiles."""
-        return await self.get("qualityprofile")
-
-    async def get_quality_profile(self, profile_id: int) -> dict[str, Any]:
-        """Get a specific quality profile."""
-        return await self.get(f"qualityprofile/{profile_id}")
-
-    # Root Folders
-    async def get_root_folders(self) -> list[dict[str, Any]]:
-        """Get all root folders."""
-        return await self.get("rootfolder")
-
-    # Tags
-    async def get_tags(self) -> list[dict[str, Any]]:
-        """Get all tags."""
-        return await self.get("tag")
-
-    async def create_tag(self, label: str) -> dict[str, Any]:
-        """Create a new tag."""
-        return await self.post("tag", json={"label": label})
-
     # Queue
     async def get_queue(
         self,
@@ -150,19 +170,18 @@ class SonarrClient(BaseArrClient):
             }
         )
 
-    async def delete_queue_item(
+    def iter_queue(
         self,
-        queue_id: int,
-        remove_from_client: bool = True,
-        blocklist: bool = False
-    ) -> None:
-        """Remove an item from the queue."""
-        await self.delete(
-            f"queue/{queue_id}",
-            params={
-                "removeFromClient": remove_from_client,
-                "blocklist": blocklist
-            }
+        include_unknown_series: bool = False,
+        page_size: int = 200,
+        concurrency: int = 10
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the whole download queue, prefetching pages concurrently."""
+        return self._iter_pages(
+            "queue",
+            params={"includeUnknownSeriesItems": include_unknown_series},
+            page_size=page_size,
+            concurrency=concurrency
         )
 
     # History
@@ -181,19 +200,22 @@ class SonarrClient(BaseArrClient):
             params["eventType"] = event_type
         return await self.get("history", params=params)
 
-    # Calendar
-    async def get_calendar(
+    def iter_history(
         self,
-        start: Optional[str] = None,
-        end: Optional[str] = None
-    ) -> list[dict[str, Any]]:
-        """Get upcoming episodes."""
+        series_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        page_size: int = 200,
+        concurrency: int = 10
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Iterate over the whole history, prefetching pages concurrently."""
         params = {}
-        if start:
-            params["start"] = start
-        if end:
-            params["end"] = end
-        return await self.get("calendar", params=params)
+        if series_id:
+            params["seriesId"] = series_id
+        if event_type:
+            params["eventType"] = event_type
+        return self._iter_pages(
+            "history", params=params, page_size=page_size, concurrency=concurrency
+        )
 
     # Commands
     async def refresh_series(self, series_id: int) -> dict[str, Any]:
@@ -216,25 +238,3 @@ class SonarrClient(BaseArrClient):
             "command",
             json={"name": "RenameSeries", "seriesIds": [series_id]}
         )
-
-    async def backup_database(self) -> dict[str, Any]:
-        """Trigger a database backup."""
-        return await self.post("command", json={"name": "Backup"})
-
-    # Config
-    async def get_config(self, section: str) -> dict[str, Any]:
-        """
-        Get configuration for a specific section.
-
-        Args:
-            section: Config section (e.g., 'ui', 'naming', 'mediamanagement')
-        """
-        return await self.get(f"config/{section}")
-
-    async def update_config(
-        self,
-        section: str,
-        config_data: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Update configuration for a specific section."""
-        return await self.put(f"config/{section}", json=config_data)
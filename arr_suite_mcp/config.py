@@ -1,7 +1,10 @@
 """Configuration management for arr suite MCP server."""
 
+import os
+from functools import cached_property
 from typing import Optional
-from pydantic import Field
+from dotenv import dotenv_values
+from pydantic import Field, PrivateAttr, ValidationError
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,7 +17,7 @@ class ArrServiceConfig(BaseSettings):
     ssl: bool = Field(default=False, description="Use HTTPS")
     base_path: str = Field(default="", description="Base path for the service")
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         """Construct the base URL for the service."""
         protocol = "https" if self.ssl else "http"
@@ -29,7 +32,7 @@ class SonarrConfig(ArrServiceConfig):
 
     port: int = Field(default=8989)
 
-    model_config = SettingsConfigDict(env_prefix="SONARR_")
+    model_config = SettingsConfigDict(env_prefix="SONARR_", frozen=True)
 
 
 class RadarrConfig(ArrServiceConfig):
@@ -37,7 +40,7 @@ class RadarrConfig(ArrServiceConfig):
 
     port: int = Field(default=7878)
 
-    model_config = SettingsConfigDict(env_prefix="RADARR_")
+    model_config = SettingsConfigDict(env_prefix="RADARR_", frozen=True)
 
 
 class ProwlarrConfig(ArrServiceConfig):
@@ -45,7 +48,7 @@ class ProwlarrConfig(ArrServiceConfig):
 
     port: int = Field(default=9696)
 
-    model_config = SettingsConfigDict(env_prefix="PROWLARR_")
+    model_config = SettingsConfigDict(env_prefix="PROWLARR_", frozen=True)
 
 
 class BazarrConfig(ArrServiceConfig):
@@ -53,7 +56,7 @@ class BazarrConfig(ArrServiceConfig):
 
     port: int = Field(default=6767)
 
-    model_config = SettingsConfigDict(env_prefix="BAZARR_")
+    model_config = SettingsConfigDict(env_prefix="BAZARR_", frozen=True)
 
 
 class OverseerrConfig(ArrServiceConfig):
@@ -61,7 +64,7 @@ class OverseerrConfig(ArrServiceConfig):
 
     port: int = Field(default=5055)
 
-    model_config = SettingsConfigDict(env_prefix="OVERSEERR_")
+    model_config = SettingsConfigDict(env_prefix="OVERSEERR_", frozen=True)
 
 
 class JackettConfig(ArrServiceConfig):
@@ -69,7 +72,7 @@ class JackettConfig(ArrServiceConfig):
 
     port: int = Field(default=9117)
 
-    model_config = SettingsConfigDict(env_prefix="JACKETT_")
+    model_config = SettingsConfigDict(env_prefix="JACKETT_", frozen=True)
 
 
 class PlexConfig(BaseSettings):
@@ -80,15 +83,28 @@ class PlexConfig(BaseSettings):
     token: str = Field(description="Plex authentication token")
     ssl: bool = Field(default=False, description="Use HTTPS")
 
-    model_config = SettingsConfigDict(env_prefix="PLEX_")
+    model_config = SettingsConfigDict(env_prefix="PLEX_", frozen=True)
 
-    @property
+    @cached_property
     def base_url(self) -> str:
         """Construct the base URL for Plex."""
         protocol = "https" if self.ssl else "http"
         return f"{protocol}://{self.host}:{self.port}"
 
 
+# Attribute name on ArrSuiteConfig -> settings class for each service
+SERVICE_CONFIGS: tuple[tuple[str, type[BaseSettings]], ...] = (
+    ("sonarr", SonarrConfig),
+    ("radarr", RadarrConfig),
+    ("prowlarr", ProwlarrConfig),
+    ("bazarr", BazarrConfig),
+    ("overseerr", OverseerrConfig),
+    ("jackett", JackettConfig),
+    ("plex", PlexConfig)
+)
+SERVICE_NAMES = frozenset(name for name, _ in SERVICE_CONFIGS)
+
+
 class ArrSuiteConfig(BaseSettings):
     """Main configuration for the arr suite MCP server."""
 
@@ -103,9 +119,18 @@ class ArrSuiteConfig(BaseSettings):
 
     # Global settings
     request_timeout: int = Field(default=30, description="API request timeout in seconds")
+    tool_timeout: int = Field(
+        default=120, description="Wall-clock limit for one tool call, retries included, in seconds"
+    )
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
+    max_concurrent_requests: int = Field(
+        default=10, description="Maximum concurrent requests per service"
+    )
     log_level: str = Field(default="INFO", description="Logging level")
 
+    # Recomputed whenever a service config is assigned
+    _enabled_services: tuple[str, ...] = PrivateAttr(default=())
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -117,58 +142,51 @@ class ArrSuiteConfig(BaseSettings):
         """Initialize configuration, attempting to load each service."""
         super().__init__(**kwargs)
 
-        # Try to initialize each service config from environment
-        try:
-            self.sonarr = SonarrConfig()
-        except Exception:
-            pass
-
-        try:
-            self.radarr = RadarrConfig()
-        except Exception:
-            pass
-
-        try:
-            self.prowlarr = ProwlarrConfig()
-        except Exception:
-            pass
-
-        try:
-            self.bazarr = BazarrConfig()
-        except Exception:
-            pass
-
-        try:
-            self.overseerr = OverseerrConfig()
-        except Exception:
-            pass
-
-        try:
-            self.jackett = JackettConfig()
-        except Exception:
-            pass
-
-        try:
-            self.plex = PlexConfig()
-        except Exception:
-            pass
+        # Parse .env once for all services. Its values are passed to each
+        # service config directly rather than copied into os.environ, and
+        # only for keys the real environment doesn't set, so those still win.
+        env_keys = {key.upper() for key in os.environ}
+        file_values: dict[str, str] = {}
+        env_file = self.model_config.get("env_file")
+        if env_file and os.path.isfile(env_file):
+            file_values = {
+                key.upper(): value
+                for key, value in dotenv_values(env_file).items()
+                if value is not None and key.upper() not in env_keys
+            }
+
+        # Try to initialize each service config. Every service requires a
+        # credential, so one with no variables under its prefix cannot
+        # validate and is skipped without building it.
+        for name, config_cls in SERVICE_CONFIGS:
+            prefix = config_cls.model_config["env_prefix"].upper()
+            overrides = {
+                field: file_values[prefix + field.upper()]
+                for field in config_cls.model_fields
+                if prefix + field.upper() in file_values
+            }
+            if not overrides and not any(key.startswith(prefix) for key in env_keys):
+                continue
+            try:
+                setattr(self, name, config_cls(**overrides))
+            except ValidationError:
+                pass
+        self._refresh_enabled_services()
+
+    def __setattr__(self, name: str, value) -> None:
+        """Set an attribute, refreshing enabled_services when a service changes."""
+        super().__setattr__(name, value)
+        if name in SERVICE_NAMES:
+            self._refresh_enabled_services()
+
+    def _refresh_enabled_services(self) -> None:
+        """Recompute the services that have credentials configured."""
+        self._enabled_services = tuple(
+            name for name, _ in SERVICE_CONFIGS
+            if getattr(getattr(self, name), "token" if name == "plex" else "api_key", None)
+        )
 
     @property
-    def enabled_services(self) -> list[str]:
-        """Return list of enabled services."""
-        services = []
-        if self.sonarr and self.sonarr.api_key:
-            services.append("sonarr")
-        if self.radarr and self.radarr.api_key:
-            services.append("radarr")
-        if self.prowlarr and self.prowlarr.api_key:
-            services.append("prowlarr")
-        if self.bazarr and self.bazarr.api_key:
-            services.append("bazarr")
-        if self.overseerr and self.overseerr.api_key:
-            services.append("overseerr")
-        if self.jackett and self.jackett.api_key:
-            services.append("jackett")
-        if self.plex and self.plex.token:
-            services.append("plex")
-        return services
+    def enabled_services(self) -> tuple[str, ...]:
+        """Return the enabled services, in SERVICE_CONFIGS order."""
+        return self._enabled_services
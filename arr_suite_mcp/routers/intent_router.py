@@ -1,10 +1,26 @@
 """Intelligent intent-based routing for arr suite operations."""
 
+import functools
 import re
+import string
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional, Sequence
 from dataclasses import dataclass
 
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator, see the "fast" extra
+    ahocorasick = None
+
+# Distinct queries whose parsed intent is memoized per router
+PARSE_CACHE_SIZE = 1024
+
+# Distinct query tokens whose keyword hits are memoized without pyahocorasick
+TOKEN_CACHE_SIZE = 4096
+
+_DIGITS = frozenset(string.digits)
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "_")
+
 
 class ArrService(Enum):
     """Available arr services."""
@@ -37,7 +53,7 @@ class OperationType(Enum):
     WATCH = "watch"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ArrIntent:
     """Represents a parsed user intent."""
     service: ArrService
@@ -46,6 +62,154 @@ class ArrIntent:
     context: dict[str, any]
 
 
+def _weighted_keywords(keyword_map: dict, members: tuple) -> tuple:
+    """
+    Flatten a keyword map into (keyword, target index, weight) entries.
+
+    Args:
+        keyword_map: Mapping of target (service or operation) to keywords
+        members: Enum members in index order
+
+    Returns:
+        Tuple of entries in table order
+    """
+    return tuple(
+        # Longer keywords get higher weight
+        (keyword, members.index(target), len(keyword.split()) * 0.2 + 1.0)
+        for target, keywords in keyword_map.items()
+        for keyword in keywords
+    )
+
+
+def _build_automaton(keywords: Sequence[str]) -> Callable[[str], set[int]]:
+    """
+    Build an Aho-Corasick matcher over a list of keywords.
+
+    Args:
+        keywords: Keywords in table order
+
+    Returns:
+        Function returning the indexes of the keywords found in a query
+    """
+    # A keyword listed under several targets maps to all of its positions
+    positions = {}
+    for index, keyword in enumerate(keywords):
+        positions.setdefault(keyword, []).append(index)
+
+    automaton = ahocorasick.Automaton()
+    for keyword, indexes in positions.items():
+        automaton.add_word(keyword, tuple(indexes))
+    automaton.make_automaton()
+
+    def match(query: str) -> set[int]:
+        return {index for _, indexes in automaton.iter(query) for index in indexes}
+
+    return match
+
+
+def _build_trie(keywords: Sequence[str]) -> Callable[[str], set[int]]:
+    """
+    Build a character-trie matcher that walks the query once.
+
+    Args:
+        keywords: Keywords in table order
+
+    Returns:
+        Function returning the indexes of the keywords found in a query
+    """
+    # Terminal nodes keep their keyword indexes under None, which can
+    # never collide with a query character
+    trie = {}
+    for index, keyword in enumerate(keywords):
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(index)
+
+    def match(query: str) -> set[int]:
+        matched = set()
+        length = len(query)
+        for start in range(length):
+            node = trie.get(query[start])
+            position = start + 1
+            while node is not None:
+                if None in node:
+                    matched.update(node[None])
+                if position == length:
+                    break
+                node = node.get(query[position])
+                position += 1
+        return matched
+
+    return match
+
+
+def _build_token_index(keywords: Sequence[str]) -> Callable[[str], set[int]]:
+    """
+    Build a token-memoizing matcher, used when pyahocorasick is missing.
+
+    A keyword without spaces can only occur inside one whitespace-separated
+    token, so the trie results for each token are memoized and a query
+    costs one dict lookup per token. Multi-word keywords are checked
+    against the whole query.
+
+    Args:
+        keywords: Keywords in table order
+
+    Returns:
+        Function returning the indexes of the keywords found in a query
+    """
+    single = [(index, keyword) for index, keyword in enumerate(keywords) if " " not in keyword]
+    multi = tuple((index, keyword) for index, keyword in enumerate(keywords) if " " in keyword)
+    single_indexes = [index for index, _ in single]
+    match_single = _build_trie([keyword for _, keyword in single])
+
+    @functools.lru_cache(maxsize=TOKEN_CACHE_SIZE)
+    def token_hits(token: str) -> frozenset[int]:
+        return frozenset(single_indexes[i] for i in match_single(token))
+
+    def match(query: str) -> set[int]:
+        matched = set()
+        for token in query.split():
+            matched |= token_hits(token)
+        matched.update(index for index, keyword in multi if keyword in query)
+        return matched
+
+    return match
+
+
+def _find_year(text: str) -> Optional[tuple[int, int]]:
+    """
+    Find the first standalone 19xx/20xx year in an ASCII string.
+
+    Gives the same result as the "year" context pattern, using str.find
+    instead of trying the regex at every offset.
+
+    Args:
+        text: ASCII query
+
+    Returns:
+        (start, end) span of the year, or None
+    """
+    end = len(text)
+    best = -1
+    for prefix in ("19", "20"):
+        start = text.find(prefix)
+        while start >= 0 and (best < 0 or start < best):
+            after = start + 4
+            if (
+                after <= end
+                and text[start + 2] in _DIGITS
+                and text[start + 3] in _DIGITS
+                and (start == 0 or text[start - 1] not in _WORD_CHARS)
+                and (after == end or text[after] not in _WORD_CHARS)
+            ):
+                best = start
+                break
+            start = text.find(prefix, start + 1)
+    return (best, best + 4) if best >= 0 else None
+
+
 class IntentRouter:
     """
     Intelligent router that analyzes natural language to determine
@@ -135,12 +299,22 @@ class IntentRouter:
         ]
     }
 
+    # Operation used when a query matches no operation keyword
+    DEFAULT_OPERATIONS = {
+        ArrService.SONARR: OperationType.SEARCH,
+        ArrService.RADARR: OperationType.SEARCH,
+        ArrService.PROWLARR: OperationType.LIST,
+        ArrService.BAZARR: OperationType.SEARCH,
+        ArrService.OVERSEERR: OperationType.REQUEST,
+        ArrService.PLEX: OperationType.GET,
+    }
+
     # Context patterns for extracting additional information
     CONTEXT_PATTERNS = {
         "title": [
             r"(?:titled?|named?|called)\s+['\"]([^'\"]+)['\"]",
             r"['\"]([^'\"]+)['\"]",
-            r"(?:movie|show|series)\s+([A-Z][^\.,;]+)"
+            r"(?:movie|show|series)\s+([a-z][^\.,;]+)"
         ],
         "year": [
             r"\b(19\d{2}|20\d{2})\b"
@@ -154,26 +328,133 @@ class IntentRouter:
             r"e(\d+)"
         ],
         "quality": [
-            r"(?:in\s+)?(\d+[kp]|4k|1080p|720p|sd|hd|uhd)",
+            r"(\d+[kp]|4k|1080p|720p|sd|hd|uhd)",
         ],
         "language": [
             r"(?:in\s+)?(\w+)\s+(?:language|subtitle|subs?)"
         ]
     }
 
-    def __init__(self):
-        """Initialize the intent router."""
-        pass
+    # Cheap literal scans that must hit before a key's patterns can match
+    CONTEXT_GATES = {
+        "language": r"language|sub"
+    }
+
+    # CONTEXT_PATTERNS compiled once at import time. The patterns are all
+    # lowercase, so ASCII queries are matched in lowercase without
+    # IGNORECASE; anything else goes through the case-folding set.
+    _CONTEXT_REGEXES = {
+        key: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for key, patterns in CONTEXT_PATTERNS.items()
+    }
+    _CONTEXT_REGEXES_ASCII = {
+        key: [re.compile(pattern) for pattern in patterns]
+        for key, patterns in CONTEXT_PATTERNS.items()
+    }
+    _CONTEXT_GATES = {
+        key: re.compile(pattern, re.IGNORECASE) for key, pattern in CONTEXT_GATES.items()
+    }
+    _CONTEXT_GATES_ASCII = {
+        key: re.compile(pattern) for key, pattern in CONTEXT_GATES.items()
+    }
+
+    # Plain-Python replacements for patterns on the ASCII path. Season and
+    # episode stay regexes: their literal prefixes already scan fast.
+    _CONTEXT_SCANNERS_ASCII = {
+        "year": _find_year
+    }
+
+    # Enum members by score index
+    _SERVICES = tuple(ArrService)
+    _OPERATIONS = tuple(OperationType)
 
-    def parse_intent(self, query: str) -> ArrIntent:
+    # Keyword tables flattened once, with weights precomputed
+    _SERVICE_TABLE = _weighted_keywords(SERVICE_KEYWORDS, _SERVICES)
+    _OPERATION_TABLE = _weighted_keywords(OPERATION_KEYWORDS, _OPERATIONS)
+
+    # Built on first use: one matcher over both tables, service keywords
+    # first, so an index past the service table names an operation keyword
+    _keyword_matcher = None
+
+    def __init__(self, cache_enabled: bool = True):
+        """
+        Initialize the intent router.
+
+        Args:
+            cache_enabled: Memoize parsed intents for repeated queries
+        """
+        self._analyze = (
+            functools.lru_cache(maxsize=PARSE_CACHE_SIZE)(self._analyze_query)
+            if cache_enabled
+            else self._analyze_query
+        )
+
+        cls = type(self)
+        if cls._keyword_matcher is None:
+            build = _build_automaton if ahocorasick is not None else _build_token_index
+            cls._keyword_matcher = staticmethod(build([
+                keyword for keyword, _, _ in cls._SERVICE_TABLE + cls._OPERATION_TABLE
+            ]))
+
+    def _score_keywords(self, query: str) -> tuple[list[float], list[float]]:
+        """
+        Sum keyword weights per service and per operation in one query scan.
+
+        Args:
+            query: Lowercased query
+
+        Returns:
+            Tuple of (service scores, operation scores), indexed like the enums
+        """
+        service_table = self._SERVICE_TABLE
+        operation_table = self._OPERATION_TABLE
+        split = len(service_table)
+        service_scores = [0.0] * len(self._SERVICES)
+        operation_scores = [0.0] * len(self._OPERATIONS)
+
+        # Each keyword counts once however often it occurs, and weights are
+        # summed in table order so ties break the same way in _argmax()
+        for index in sorted(self._keyword_matcher(query)):
+            if index < split:
+                _, target, weight = service_table[index]
+                service_scores[target] += weight
+            else:
+                _, target, weight = operation_table[index - split]
+                operation_scores[target] += weight
+
+        return service_scores, operation_scores
+
+    @staticmethod
+    def _argmax(scores: list[float]) -> tuple[int, float]:
+        """
+        Find the first highest score in one pass.
+
+        Args:
+            scores: Non-negative scores
+
+        Returns:
+            Tuple of (index, score), with index -1 when every score is zero
+        """
+        best_index = -1
+        best_score = 0.0
+        for index, score in enumerate(scores):
+            if score > best_score:
+                best_index = index
+                best_score = score
+        return best_index, best_score
+
+    def parse_intent(self, query: str, extract_context: bool = True) -> ArrIntent:
         """
         Parse natural language query to determine intent.
 
         Args:
             query: Natural language query from user
+            extract_context: Also extract titles, years, flags, etc. Callers
+                that only route can skip the context regexes
 
         Returns:
-            ArrIntent object with service, operation, and context
+            ArrIntent object with service, operation, and context (empty
+            when extract_context is False)
 
         Examples:
             "Add Breaking Bad to my TV shows" -> (SONARR, ADD, {...})
@@ -182,45 +463,62 @@ class IntentRouter:
             "Show all indexers" -> (PROWLARR, LIST, {})
             "Request Dune" -> (OVERSEERR, REQUEST, {title: "Dune"})
         """
+        if not extract_context:
+            service, operation, confidence = self._classify(query.lower())
+            return ArrIntent(
+                service=service,
+                operation=operation,
+                confidence=confidence,
+                context={}
+            )
+
+        service, operation, confidence, context = self._analyze(query)
+
+        # The cached context is shared, so every intent gets its own copy
+        return ArrIntent(
+            service=service,
+            operation=operation,
+            confidence=confidence,
+            context=dict(context)
+        )
+
+    def _analyze_query(
+        self,
+        query: str
+    ) -> tuple[ArrService, OperationType, float, dict[str, any]]:
+        """Run keyword scoring and context extraction for a query."""
         query_lower = query.lower()
+        service, operation, confidence = self._classify(query_lower)
+
+        # Extract context
+        context = self._extract_context(query, query_lower)
+
+        return service, operation, confidence, context
+
+    def _classify(self, query_lower: str) -> tuple[ArrService, OperationType, float]:
+        """Pick the service and operation for a lowercased query."""
+        service_scores, operation_scores = self._score_keywords(query_lower)
 
         # Determine service
-        service, service_confidence = self._identify_service(query_lower)
+        service, service_confidence = self._identify_service(service_scores)
 
         # Determine operation
-        operation, op_confidence = self._identify_operation(query_lower, service)
-
-        # Extract context
-        context = self._extract_context(query)
+        operation, op_confidence = self._identify_operation(operation_scores, service)
 
         # Calculate overall confidence
         confidence = (service_confidence + op_confidence) / 2
 
-        return ArrIntent(
-            service=service,
-            operation=operation,
-            confidence=confidence,
-            context=context
-        )
-
-    def _identify_service(self, query: str) -> tuple[ArrService, float]:
-        """Identify which arr service to use based on keywords."""
-        scores = {service: 0.0 for service in ArrService}
-
-        for service, keywords in self.SERVICE_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in query:
-                    # Longer keywords get higher weight
-                    weight = len(keyword.split()) * 0.2 + 1.0
-                    scores[service] += weight
+        return service, operation, confidence
 
+    def _identify_service(self, scores: list[float]) -> tuple[ArrService, float]:
+        """Identify which arr service to use based on keyword scores."""
         # Determine best match
-        if all(score == 0 for score in scores.values()):
+        max_index, max_score = self._argmax(scores)
+        if max_index < 0:
             # Default to Overseerr for generic requests
             return ArrService.OVERSEERR, 0.3
 
-        max_service = max(scores, key=scores.get)
-        max_score = scores[max_service]
+        max_service = self._SERVICES[max_index]
 
         # Normalize confidence to 0-1
         confidence = min(max_score / 3.0, 1.0)
@@ -229,70 +527,87 @@ class IntentRouter:
 
     def _identify_operation(
         self,
-        query: str,
+        scores: list[float],
         service: ArrService
     ) -> tuple[OperationType, float]:
-        """Identify which operation to perform."""
-        scores = {op: 0.0 for op in OperationType}
-
-        for operation, keywords in self.OPERATION_KEYWORDS.items():
-            for keyword in keywords:
-                if keyword in query:
-                    weight = len(keyword.split()) * 0.2 + 1.0
-                    scores[operation] += weight
-
+        """Identify which operation to perform based on keyword scores."""
         # Apply service-specific defaults
-        if all(score == 0 for score in scores.values()):
-            # Default operations based on service
-            default_ops = {
-                ArrService.SONARR: OperationType.SEARCH,
-                ArrService.RADARR: OperationType.SEARCH,
-                ArrService.PROWLARR: OperationType.LIST,
-                ArrService.BAZARR: OperationType.SEARCH,
-                ArrService.OVERSEERR: OperationType.REQUEST,
-                ArrService.PLEX: OperationType.GET,
-            }
-            return default_ops.get(service, OperationType.LIST), 0.5
-
-        max_operation = max(scores, key=scores.get)
-        max_score = scores[max_operation]
+        max_index, max_score = self._argmax(scores)
+        if max_index < 0:
+            return self.DEFAULT_OPERATIONS.get(service, OperationType.LIST), 0.5
+
+        max_operation = self._OPERATIONS[max_index]
 
         confidence = min(max_score / 2.0, 1.0)
 
         return max_operation, confidence
 
-    def _extract_context(self, query: str) -> dict[str, any]:
-        """Extract contextual information from the query."""
+    def _extract_context(self, query: str, query_lower: str) -> dict[str, any]:
+        """
+        Extract contextual information from the query.
+
+        Args:
+            query: Natural language query, original case
+            query_lower: The same query lowercased
+
+        Returns:
+            Extracted context values and flags
+        """
         context = {}
 
-        for key, patterns in self.CONTEXT_PATTERNS.items():
+        if query.isascii():
+            # Lowercasing ASCII keeps every offset, so values are sliced
+            # out of the original query by the match span
+            regexes, gates, text = (
+                self._CONTEXT_REGEXES_ASCII, self._CONTEXT_GATES_ASCII, query_lower
+            )
+            scanners = self._CONTEXT_SCANNERS_ASCII
+        else:
+            regexes, gates, text = self._CONTEXT_REGEXES, self._CONTEXT_GATES, query
+            scanners = {}
+
+        for key, patterns in regexes.items():
+            scanner = scanners.get(key)
+            if scanner is not None:
+                span = scanner(text)
+                if span is not None:
+                    context[key] = query[span[0]:span[1]]
+                continue
+            gate = gates.get(key)
+            if gate is not None and not gate.search(text):
+                continue
             for pattern in patterns:
-                match = re.search(pattern, query, re.IGNORECASE)
+                match = pattern.search(text)
                 if match:
-                    context[key] = match.group(1)
+                    context[key] = query[match.start(1):match.end(1)]
                     break
 
         # Extract boolean flags
-        context["monitored"] = "unmonitor" not in query.lower()
-        context["search_on_add"] = "don't search" not in query.lower()
+        context["monitored"] = "unmonitor" not in query_lower
+        context["search_on_add"] = "don't search" not in query_lower
 
         # Extract quality preferences
-        if "4k" in query.lower():
+        if "4k" in query_lower:
             context["is_4k"] = True
 
         return context
 
-    def route(self, query: str) -> tuple[ArrService, OperationType, dict]:
+    def route(
+        self,
+        query: str,
+        extract_context: bool = True
+    ) -> tuple[ArrService, OperationType, dict]:
         """
         Route a query to the appropriate service and operation.
 
         Args:
             query: Natural language query
+            extract_context: Also extract the query context
 
         Returns:
             Tuple of (service, operation, context)
         """
-        intent = self.parse_intent(query)
+        intent = self.parse_intent(query, extract_context=extract_context)
         return intent.service, intent.operation, intent.context
 
     def explain_intent(self, query: str) -> str:
@@ -1,8 +1,12 @@
 """Main MCP server implementation for arr suite."""
 
 import logging
+import logging.handlers
 import asyncio
-from typing import Any, Optional
+import queue
+import time
+from typing import Any, Awaitable, Callable, Optional
+import orjson
 from mcp.server import Server
 from mcp.types import Tool, TextContent, ImageContent, EmbeddedResource
 
@@ -14,14 +18,36 @@ from .clients import (
     BazarrClient,
     OverseerrClient,
     PlexClient,
-    ArrClientError
+    ArrClientError,
+    ArrClientConnectionError,
+    close_shared_clients
 )
 from .routers import IntentRouter, ArrIntent
 from .routers.intent_router import ArrService, OperationType
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Default number of arr_batch_execute operations running at once
+BATCH_MAX_CONCURRENT = 8
+
+# Seconds to reuse a service's arr_get_system_status result
+STATUS_CACHE_TTL = 5.0
+
+# Consecutive connection failures that open a service's circuit breaker,
+# and how long calls to that service are then refused without any I/O
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_OPEN_SECONDS = 30.0
+
+
+def _render_result(result: Any) -> str:
+    """Serialize a tool result as compact JSON, stringifying unknown types."""
+    return orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+async def _message(text: str) -> dict[str, str]:
+    """Wrap a fixed message as an operation result."""
+    return {"message": text}
+
 
 class ArrSuiteMCPServer:
     """MCP Server for the arr suite with intelligent routing."""
@@ -35,8 +61,18 @@ class ArrSuiteMCPServer:
         # Initialize clients
         self.clients: dict[str, Any] = {}
         self._initialize_clients()
+        # service name -> (expires_at, status entry) for arr_get_system_status
+        self._status_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        # service name -> (open_until, consecutive connection failures)
+        self._breakers: dict[str, tuple[float, int]] = {}
+
+        # The configured services are fixed from here on, so the tool
+        # list and the services listing never change
+        self._tools = self._build_tools()
+        self._services_payload = self._build_services_payload()
 
         # Register MCP handlers
+        self._build_dispatch()
         self._register_handlers()
 
         logger.info(f"Arr Suite MCP Server initialized with services: {self.config.enabled_services}")
@@ -48,7 +84,8 @@ class ArrSuiteMCPServer:
                 base_url=self.config.sonarr.base_url,
                 api_key=self.config.sonarr.api_key,
                 timeout=self.config.request_timeout,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                max_inflight=self.config.max_concurrent_requests
             )
 
         if self.config.radarr and self.config.radarr.api_key:
@@ -56,7 +93,8 @@ class ArrSuiteMCPServer:
                 base_url=self.config.radarr.base_url,
                 api_key=self.config.radarr.api_key,
                 timeout=self.config.request_timeout,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                max_inflight=self.config.max_concurrent_requests
             )
 
         if self.config.prowlarr and self.config.prowlarr.api_key:
@@ -64,7 +102,8 @@ class ArrSuiteMCPServer:
                 base_url=self.config.prowlarr.base_url,
                 api_key=self.config.prowlarr.api_key,
                 timeout=self.config.request_timeout,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                max_inflight=self.config.max_concurrent_requests
             )
 
         if self.config.bazarr and self.config.bazarr.api_key:
@@ -72,7 +111,8 @@ class ArrSuiteMCPServer:
                 base_url=self.config.bazarr.base_url,
                 api_key=self.config.bazarr.api_key,
                 timeout=self.config.request_timeout,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                max_inflight=self.config.max_concurrent_requests
             )
 
         if self.config.overseerr and self.config.overseerr.api_key:
@@ -80,7 +120,8 @@ class ArrSuiteMCPServer:
                 base_url=self.config.overseerr.base_url,
                 api_key=self.config.overseerr.api_key,
                 timeout=self.config.request_timeout,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                max_inflight=self.config.max_concurrent_requests
             )
 
         if self.config.plex and self.config.plex.token:
@@ -88,7 +129,8 @@ class ArrSuiteMCPServer:
                 base_url=self.config.plex.base_url,
                 token=self.config.plex.token,
                 timeout=self.config.request_timeout,
-                max_retries=self.config.max_retries
+                max_retries=self.config.max_retries,
+                max_inflight=self.config.max_concurrent_requests
             )
 
     def _register_handlers(self) -> None:
@@ -97,110 +139,18 @@ class ArrSuiteMCPServer:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List available MCP tools."""
-            tools = [
-                Tool(
-                    name="arr_execute",
-                    description=(
-                        "Execute arr suite operations using natural language. "
-                        "Intelligently routes to the correct service (Sonarr, Radarr, "
-                        "Prowlarr, Bazarr, or Overseerr) based on your request. "
-                        "Examples: 'add Breaking Bad', 'search for The Matrix', "
-                        "'download English subtitles for Dune', 'list all indexers', "
-                        "'request Inception'"
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Natural language query describing what you want to do"
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="arr_explain_intent",
-                    description=(
-                        "Explain how a natural language query would be interpreted "
-                        "and routed to arr services. Useful for understanding what "
-                        "the system will do before executing."
-                    ),
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Natural language query to explain"
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                ),
-                Tool(
-                    name="arr_list_services",
-                    description="List all configured and available arr services",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-                Tool(
-                    name="arr_get_system_status",
-                    description="Get system status for all configured arr services",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {}
-                    }
-                ),
-            ]
-
-            # Add service-specific tools
-            if "sonarr" in self.clients:
-                tools.extend(self._get_sonarr_tools())
-            if "radarr" in self.clients:
-                tools.extend(self._get_radarr_tools())
-            if "prowlarr" in self.clients:
-                tools.extend(self._get_prowlarr_tools())
-            if "bazarr" in self.clients:
-                tools.extend(self._get_bazarr_tools())
-            if "overseerr" in self.clients:
-                tools.extend(self._get_overseerr_tools())
-            if "plex" in self.clients:
-                tools.extend(self._get_plex_tools())
-
-            return tools
+            return self._tools
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             """Handle tool calls."""
             try:
-                # Route to appropriate handler
-                if name == "arr_execute":
-                    result = await self._handle_arr_execute(arguments["query"])
-                elif name == "arr_explain_intent":
-                    result = self._handle_explain_intent(arguments["query"])
-                elif name == "arr_list_services":
-                    result = self._handle_list_services()
-                elif name == "arr_get_system_status":
-                    result = await self._handle_system_status()
-                # Service-specific tools
-                elif name.startswith("sonarr_"):
-                    result = await self._handle_sonarr_tool(name, arguments)
-                elif name.startswith("radarr_"):
-                    result = await self._handle_radarr_tool(name, arguments)
-                elif name.startswith("prowlarr_"):
-                    result = await self._handle_prowlarr_tool(name, arguments)
-                elif name.startswith("bazarr_"):
-                    result = await self._handle_bazarr_tool(name, arguments)
-                elif name.startswith("overseerr_"):
-                    result = await self._handle_overseerr_tool(name, arguments)
-                elif name.startswith("plex_"):
-                    result = await self._handle_plex_tool(name, arguments)
+                if name == "arr_batch_execute":
+                    # Each batched call gets its own deadline instead
+                    result = await self._dispatch_tool(name, arguments)
                 else:
-                    result = {"error": f"Unknown tool: {name}"}
-
-                return [TextContent(type="text", text=str(result))]
+                    result = await self._run_tool(name, arguments)
+                return [TextContent(type="text", text=_render_result(result))]
 
             except Exception as e:
                 logger.error(f"Error handling tool {name}: {e}", exc_info=True)
@@ -209,6 +159,273 @@ class ArrSuiteMCPServer:
                     text=f"Error: {str(e)}"
                 )]
 
+    def _build_dispatch(self) -> None:
+        """Build the tool-name lookup tables used by _dispatch_tool."""
+        self._exact_handlers = {
+            "arr_execute": lambda arguments: self._handle_arr_execute(arguments["query"]),
+            "arr_explain_intent": lambda arguments: self._handle_explain_intent(
+                arguments["query"]
+            ),
+            "arr_list_services": lambda arguments: self._handle_list_services(),
+            "arr_get_system_status": lambda arguments: self._handle_system_status(),
+            "arr_batch_execute": lambda arguments: self._handle_batch_execute(
+                arguments["operations"],
+                max_concurrent=arguments.get("max_concurrent", BATCH_MAX_CONCURRENT),
+                stop_on_error=arguments.get("stop_on_error", False)
+            ),
+        }
+        # Service-specific tools: tool name -> call on that service's client.
+        # The client is the one named by the text before the first "_".
+        self._service_tools: dict[str, Callable[[Any, dict[str, Any]], Awaitable[Any]]] = {
+            # Sonarr
+            "sonarr_search_series": lambda client, arguments: client.lookup_series(
+                arguments["term"]
+            ),
+            "sonarr_add_series": lambda client, arguments: client.add_series(**arguments),
+            "sonarr_get_series": lambda client, arguments: (
+                client.get_series(arguments["series_id"])
+                if "series_id" in arguments else client.get_all_series()
+            ),
+            # Radarr
+            "radarr_search_movie": lambda client, arguments: client.lookup_movie(
+                arguments["term"]
+            ),
+            "radarr_add_movie": lambda client, arguments: client.add_movie(**arguments),
+            "radarr_get_movies": lambda client, arguments: (
+                client.get_movie(arguments["movie_id"])
+                if "movie_id" in arguments else client.get_all_movies()
+            ),
+            # Prowlarr
+            "prowlarr_search": lambda client, arguments: client.search(**arguments),
+            "prowlarr_get_indexers": lambda client, arguments: client.get_all_indexers(),
+            "prowlarr_sync_apps": lambda client, arguments: client.sync_all_applications(),
+            # Bazarr
+            "bazarr_search_subtitles": lambda client, arguments: (
+                client.search_series_subtitles(
+                    arguments["media_id"],
+                    arguments.get("episode_id")
+                )
+                if arguments["media_type"] == "series"
+                else client.search_movie_subtitles(arguments["media_id"])
+            ),
+            "bazarr_download_subtitle": lambda client, arguments: (
+                client.download_series_subtitle
+                if arguments["media_type"] == "episode"
+                else client.download_movie_subtitle
+            )(arguments["media_id"], arguments["language"]),
+            # Overseerr
+            "overseerr_search": lambda client, arguments: client.search_media(arguments["query"]),
+            "overseerr_request": lambda client, arguments: client.create_request(**arguments),
+            "overseerr_get_requests": lambda client, arguments: client.get_requests(
+                filter=arguments.get("filter")
+            ),
+            # Plex
+            "plex_get_libraries": lambda client, arguments: client.get_libraries(),
+            "plex_search": lambda client, arguments: client.search(arguments["query"]),
+            "plex_get_recently_added": lambda client, arguments: client.get_recently_added(
+                limit=arguments.get("limit", 50)
+            ),
+            "plex_get_on_deck": lambda client, arguments: client.get_on_deck(),
+            "plex_get_sessions": lambda client, arguments: client.get_sessions(),
+            "plex_scan_library": lambda client, arguments: client.scan_library(
+                arguments["section_id"]
+            ),
+            "plex_mark_watched": lambda client, arguments: client.mark_watched(
+                arguments["rating_key"]
+            ),
+        }
+
+        # arr_execute operations: (service, operation) -> call on that service's client
+        self._operations: dict[
+            tuple[ArrService, OperationType], Callable[[Any, dict[str, Any]], Awaitable[Any]]
+        ] = {
+            (ArrService.SONARR, OperationType.SEARCH): lambda client, context: (
+                client.lookup_series(context.get("title", ""))
+            ),
+            (ArrService.SONARR, OperationType.LIST): lambda client, context: (
+                client.get_all_series()
+            ),
+            (ArrService.RADARR, OperationType.SEARCH): lambda client, context: (
+                client.lookup_movie(context.get("title", ""))
+            ),
+            (ArrService.RADARR, OperationType.LIST): lambda client, context: (
+                client.get_all_movies()
+            ),
+            (ArrService.PROWLARR, OperationType.SEARCH): lambda client, context: (
+                client.search(context.get("title", ""))
+            ),
+            (ArrService.PROWLARR, OperationType.LIST): lambda client, context: (
+                client.get_all_indexers()
+            ),
+            (ArrService.OVERSEERR, OperationType.SEARCH): lambda client, context: (
+                client.search_media(context.get("title", ""))
+            ),
+            # Would need more context to execute
+            (ArrService.OVERSEERR, OperationType.REQUEST): lambda client, context: _message(
+                "Please use overseerr_request tool with media_type and media_id"
+            ),
+            (ArrService.PLEX, OperationType.SEARCH): lambda client, context: (
+                client.search(context.get("title", ""))
+            ),
+            (ArrService.PLEX, OperationType.LIST): lambda client, context: (
+                client.get_libraries()
+            ),
+            (ArrService.PLEX, OperationType.GET): lambda client, context: (
+                client.get_libraries()
+            ),
+            (ArrService.PLEX, OperationType.SCAN): lambda client, context: _message(
+                "Please use plex_scan_library tool with section_id"
+            ),
+            (ArrService.PLEX, OperationType.PLAY): lambda client, context: (
+                client.get_sessions()
+            ),
+            (ArrService.PLEX, OperationType.REFRESH): lambda client, context: (
+                client.get_recently_added()
+            ),
+        }
+
+    async def _dispatch_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        """Run a tool by name and return its result."""
+        handler = self._exact_handlers.get(name)
+        if handler is not None:
+            return await handler(arguments)
+
+        method = self._service_tools.get(name)
+        if method is not None:
+            service = name.partition("_")[0]
+            client = self.clients[service]
+            return await self._call_service(service, lambda: method(client, arguments))
+
+        return {"error": f"Unknown tool: {name}"}
+
+    async def _run_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+        """
+        Run a tool, giving up after the configured tool_timeout.
+
+        Raises:
+            TimeoutError: If the tool does not finish in time
+        """
+        try:
+            return await asyncio.wait_for(
+                self._dispatch_tool(name, arguments),
+                self.config.tool_timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"{name} timed out after {self.config.tool_timeout}s"
+            ) from None
+
+    def _build_tools(self) -> list[Tool]:
+        """Build the tool list for the configured services."""
+        tools = [
+            Tool(
+                name="arr_execute",
+                description=(
+                    "Execute arr suite operations using natural language. "
+                    "Intelligently routes to the correct service (Sonarr, Radarr, "
+                    "Prowlarr, Bazarr, or Overseerr) based on your request. "
+                    "Examples: 'add Breaking Bad', 'search for The Matrix', "
+                    "'download English subtitles for Dune', 'list all indexers', "
+                    "'request Inception'"
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Natural language query describing what you want to do"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="arr_explain_intent",
+                description=(
+                    "Explain how a natural language query would be interpreted "
+                    "and routed to arr services. Useful for understanding what "
+                    "the system will do before executing."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "query": {
+                            "type": "string",
+                            "description": "Natural language query to explain"
+                        }
+                    },
+                    "required": ["query"]
+                }
+            ),
+            Tool(
+                name="arr_list_services",
+                description="List all configured and available arr services",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
+            ),
+            Tool(
+                name="arr_get_system_status",
+                description="Get system status for all configured arr services",
+                inputSchema={
+                    "type": "object",
+                    "properties": {}
+                }
+            ),
+            Tool(
+                name="arr_batch_execute",
+                description=(
+                    "Run several tool calls in one request. Operations run "
+                    "concurrently and results come back in the same order."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operations": {
+                            "type": "array",
+                            "description": "Tool calls to run",
+                            "items": {
+                                "type": "object",
+                                "properties": {
+                                    "name": {"type": "string", "description": "Tool name"},
+                                    "arguments": {"type": "object", "description": "Tool arguments"}
+                                },
+                                "required": ["name"]
+                            }
+                        },
+                        "max_concurrent": {
+                            "type": "integer",
+                            "description": "Maximum operations running at once",
+                            "default": BATCH_MAX_CONCURRENT
+                        },
+                        "stop_on_error": {
+                            "type": "boolean",
+                            "description": "Skip operations not yet started after one fails",
+                            "default": False
+                        }
+                    },
+                    "required": ["operations"]
+                }
+            ),
+        ]
+
+        # Add service-specific tools
+        if "sonarr" in self.clients:
+            tools.extend(self._get_sonarr_tools())
+        if "radarr" in self.clients:
+            tools.extend(self._get_radarr_tools())
+        if "prowlarr" in self.clients:
+            tools.extend(self._get_prowlarr_tools())
+        if "bazarr" in self.clients:
+            tools.extend(self._get_bazarr_tools())
+        if "overseerr" in self.clients:
+            tools.extend(self._get_overseerr_tools())
+        if "plex" in self.clients:
+            tools.extend(self._get_plex_tools())
+
+        return tools
+
     def _get_sonarr_tools(self) -> list[Tool]:
         """Get Sonarr-specific tools."""
         return [
@@ -423,157 +640,150 @@ class ArrSuiteMCPServer:
         context: dict
     ) -> Any:
         """Execute the appropriate operation on the client."""
-        # This is a simplified implementation - you would expand this
-        # with more sophisticated routing logic
-
-        if service == ArrService.SONARR:
-            if operation == OperationType.SEARCH:
-                term = context.get("title", "")
-                return await client.lookup_series(term)
-            elif operation == OperationType.LIST:
-                return await client.get_all_series()
-
-        elif service == ArrService.RADARR:
-            if operation == OperationType.SEARCH:
-                term = context.get("title", "")
-                return await client.lookup_movie(term)
-            elif operation == OperationType.LIST:
-                return await client.get_all_movies()
-
-        elif service == ArrService.PROWLARR:
-            if operation == OperationType.SEARCH:
-                query = context.get("title", "")
-                return await client.search(query)
-            elif operation == OperationType.LIST:
-                return await client.get_all_indexers()
-
-        elif service == ArrService.OVERSEERR:
-            if operation == OperationType.SEARCH:
-                query = context.get("title", "")
-                return await client.search_media(query)
-            elif operation == OperationType.REQUEST:
-                # Would need more context to execute
-                return {"message": "Please use overseerr_request tool with media_type and media_id"}
-
-        elif service == ArrService.PLEX:
-            if operation == OperationType.SEARCH:
-                query = context.get("title", "")
-                return await client.search(query)
-            elif operation == OperationType.LIST or operation == OperationType.GET:
-                return await client.get_libraries()
-            elif operation == OperationType.SCAN:
-                return {"message": "Please use plex_scan_library tool with section_id"}
-            elif operation == OperationType.PLAY:
-                return await client.get_sessions()
-            elif operation == OperationType.REFRESH:
-                return await client.get_recently_added()
+        handler = self._operations.get((service, operation))
+        if handler is not None:
+            return await self._call_service(service.value, lambda: handler(client, context))
 
         return {"message": f"Operation {operation.value} not yet implemented for {service.value}"}
 
-    def _handle_explain_intent(self, query: str) -> dict[str, Any]:
+    async def _handle_explain_intent(self, query: str) -> dict[str, Any]:
         """Explain how a query would be interpreted."""
         explanation = self.router.explain_intent(query)
         return {"explanation": explanation}
 
-    def _handle_list_services(self) -> dict[str, Any]:
-        """List all configured services."""
+    def _build_services_payload(self) -> dict[str, Any]:
+        """Build the arr_list_services result for the configured services."""
+        services = {}
+        for name in ["sonarr", "radarr", "prowlarr", "bazarr", "overseerr", "plex"]:
+            service_config = getattr(self.config, name, None)
+            services[name] = {
+                "configured": name in self.clients,
+                "url": service_config.base_url if service_config else None
+            }
+
         return {
             "enabled_services": self.config.enabled_services,
-            "services": {
-                name: {
-                    "configured": name in self.clients,
-                    "url": getattr(self.config, name).base_url if hasattr(self.config, name) and getattr(self.config, name) else None
-                }
-                for name in ["sonarr", "radarr", "prowlarr", "bazarr", "overseerr"]
-            }
+            "services": services
         }
 
+    async def _handle_list_services(self) -> dict[str, Any]:
+        """List all configured services."""
+        return self._services_payload
+
+    async def _handle_batch_execute(
+        self,
+        operations: list[dict[str, Any]],
+        max_concurrent: int = BATCH_MAX_CONCURRENT,
+        stop_on_error: bool = False
+    ) -> dict[str, Any]:
+        """
+        Run several tool calls concurrently.
+
+        Args:
+            operations: Tool calls as {"name": ..., "arguments": {...}}
+            max_concurrent: Maximum operations running at once
+            stop_on_error: Skip operations not yet started once one fails
+
+        Returns:
+            Dict with a "results" list in the same order as operations
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+        failed = asyncio.Event()
+
+        async def run(operation: dict[str, Any]) -> dict[str, Any]:
+            name = operation.get("name", "")
+            async with semaphore:
+                if stop_on_error and failed.is_set():
+                    return {"name": name, "skipped": True}
+                if name == "arr_batch_execute":
+                    failed.set()
+                    return {"name": name, "error": "Batches cannot be nested"}
+                try:
+                    result = await self._run_tool(name, operation.get("arguments") or {})
+                except Exception as e:
+                    logger.error(f"Error handling batched tool {name}: {e}", exc_info=True)
+                    failed.set()
+                    return {"name": name, "error": str(e)}
+                # Some tools report failure in their result instead of raising
+                if isinstance(result, dict) and "error" in result:
+                    failed.set()
+                return {"name": name, "result": result}
+
+        results = await asyncio.gather(*(run(operation) for operation in operations))
+        return {"results": results}
+
     async def _handle_system_status(self) -> dict[str, Any]:
-        """Get system status for all services."""
-        statuses = {}
-        for name, client in self.clients.items():
-            try:
-                status = await client.get_system_status()
-                statuses[name] = {
-                    "online": True,
-                    "status": status
-                }
-            except Exception as e:
-                statuses[name] = {
-                    "online": False,
-                    "error": str(e)
-                }
-        return statuses
-
-    async def _handle_sonarr_tool(self, name: str, arguments: dict) -> Any:
-        """Handle Sonarr-specific tools."""
-        client = self.clients["sonarr"]
-
-        if name == "sonarr_search_series":
-            return await client.lookup_series(arguments["term"])
-        elif name == "sonarr_add_series":
-            return await client.add_series(**arguments)
-        elif name == "sonarr_get_series":
-            if "series_id" in arguments:
-                return await client.get_series(arguments["series_id"])
-            return await client.get_all_series()
-
-    async def _handle_radarr_tool(self, name: str, arguments: dict) -> Any:
-        """Handle Radarr-specific tools."""
-        client = self.clients["radarr"]
-
-        if name == "radarr_search_movie":
-            return await client.lookup_movie(arguments["term"])
-        elif name == "radarr_add_movie":
-            return await client.add_movie(**arguments)
-        elif name == "radarr_get_movies":
-            if "movie_id" in arguments:
-                return await client.get_movie(arguments["movie_id"])
-            return await client.get_all_movies()
-
-    async def _handle_prowlarr_tool(self, name: str, arguments: dict) -> Any:
-        """Handle Prowlarr-specific tools."""
-        client = self.clients["prowlarr"]
-
-        if name == "prowlarr_search":
-            return await client.search(**arguments)
-        elif name == "prowlarr_get_indexers":
-            return await client.get_all_indexers()
-        elif name == "prowlarr_sync_apps":
-            return await client.sync_all_applications()
-
-    async def _handle_bazarr_tool(self, name: str, arguments: dict) -> Any:
-        """Handle Bazarr-specific tools."""
-        client = self.clients["bazarr"]
-
-        if name == "bazarr_search_subtitles":
-            if arguments["media_type"] == "series":
-                return await client.search_series_subtitles(
-                    arguments["media_id"],
-                    arguments.get("episode_id")
-                )
-            return await client.search_movie_subtitles(arguments["media_id"])
-        elif name == "bazarr_download_subtitle":
-            if arguments["media_type"] == "episode":
-                return await client.download_series_subtitle(
-                    arguments["media_id"],
-                    arguments["language"]
-                )
-            return await client.download_movie_subtitle(
-                arguments["media_id"],
-                arguments["language"]
+        """Get system status for all services, reusing results younger than STATUS_CACHE_TTL."""
+        now = time.monotonic()
+        stale = [
+            (name, client) for name, client in self.clients.items()
+            if name not in self._status_cache or self._status_cache[name][0] <= now
+        ]
+        if stale:
+            results = await asyncio.gather(
+                *(self._safe_status(name, client) for name, client in stale)
             )
+            expires_at = time.monotonic() + STATUS_CACHE_TTL
+            for name, status in results:
+                self._status_cache[name] = (expires_at, status)
 
-    async def _handle_overseerr_tool(self, name: str, arguments: dict) -> Any:
-        """Handle Overseerr-specific tools."""
-        client = self.clients["overseerr"]
+        return {name: self._status_cache[name][1] for name in self.clients}
+
+    async def _safe_status(self, name: str, client: Any) -> tuple[str, dict[str, Any]]:
+        """Get one service's status, reporting failures instead of raising."""
+        try:
+            status = await self._call_service(name, client.get_system_status)
+            return name, {
+                "online": True,
+                "status": status
+            }
+        except Exception as e:
+            return name, {
+                "online": False,
+                "error": str(e)
+            }
+
+    async def _call_service(self, name: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Make a call to a service through its circuit breaker.
+
+        After BREAKER_FAILURE_THRESHOLD consecutive connection failures the
+        breaker opens and calls fail fast for BREAKER_OPEN_SECONDS. The next
+        call after that is let through; success closes the breaker, another
+        connection failure reopens it.
+
+        Args:
+            name: Service name
+            call: Starts the request when called
+
+        Returns:
+            The call's result
+
+        Raises:
+            ArrClientConnectionError: If the breaker is open or the service is unreachable
+        """
+        open_until, _ = self._breakers.get(name, (0.0, 0))
+        now = time.monotonic()
+        if open_until > now:
+            raise ArrClientConnectionError(
+                f"{name} is unreachable; retrying in {open_until - now:.0f}s"
+            )
 
-        if name == "overseerr_search":
-            return await client.search_media(arguments["query"])
-        elif name == "overseerr_request":
-            return await client.create_request(**arguments)
-        elif name == "overseerr_get_requests":
-            return await client.get_requests(filter=arguments.get("filter"))
+        try:
+            result = await call()
+        except ArrClientConnectionError:
+            # Re-read: other calls may have recorded failures meanwhile
+            open_until, failures = self._breakers.get(name, (0.0, 0))
+            failures += 1
+            if failures >= BREAKER_FAILURE_THRESHOLD:
+                open_until = time.monotonic() + BREAKER_OPEN_SECONDS
+                logger.warning(f"{name} unreachable, pausing calls for {BREAKER_OPEN_SECONDS:.0f}s")
+            self._breakers[name] = (open_until, failures)
+            raise
+
+        # Concurrent successes may both close the breaker
+        self._breakers.pop(name, None)
+        return result
 
     def _get_plex_tools(self) -> list[Tool]:
         """Get Plex-specific tools."""
@@ -638,52 +848,75 @@ class ArrSuiteMCPServer:
             ),
         ]
 
-    async def _handle_plex_tool(self, name: str, arguments: dict) -> Any:
-        """Handle Plex-specific tools."""
-        client = self.clients["plex"]
-
-        if name == "plex_get_libraries":
-            return await client.get_libraries()
-        elif name == "plex_search":
-            return await client.search(arguments["query"])
-        elif name == "plex_get_recently_added":
-            return await client.get_recently_added(limit=arguments.get("limit", 50))
-        elif name == "plex_get_on_deck":
-            return await client.get_on_deck()
-        elif name == "plex_get_sessions":
-            return await client.get_sessions()
-        elif name == "plex_scan_library":
-            return await client.scan_library(arguments["section_id"])
-        elif name == "plex_mark_watched":
-            return await client.mark_watched(arguments["rating_key"])
-
     async def run(self) -> None:
         """Run the MCP server."""
         from mcp.server.stdio import stdio_server
 
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options()
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options()
+                )
+        finally:
+            await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close every client, then the shared HTTP pools."""
+        for client in self.clients.values():
+            try:
+                await client.close()
+            except Exception as e:
+                logger.warning(f"Error closing {client.service_name} client: {e}")
+        await close_shared_clients()
+
+
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so the event loop never writes to stderr.
+
+    The root logger only enqueues records; a listener thread does the
+    formatting and the stream writes.
+
+    Args:
+        level: Root logger level
+
+    Returns:
+        The started listener; call stop() on it to flush and shut it down
+    """
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 
 def main():
     """Main entry point."""
     import sys
 
-    # Load configuration
-    config = ArrSuiteConfig()
-
-    # Create and run server
-    server = ArrSuiteMCPServer(config)
+    listener = configure_logging()
 
     try:
+        # Load configuration
+        config = ArrSuiteConfig()
+
+        # Create and run server
+        server = ArrSuiteMCPServer(config)
+
         asyncio.run(server.run())
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
         sys.exit(0)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
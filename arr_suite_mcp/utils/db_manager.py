@@ -1,16 +1,47 @@
 """Database management utilities for arr suite."""
 
+import asyncio
+import contextlib
+import itertools
 import os
 import shutil
 import sqlite3
 import logging
+import time
 from pathlib import Path
-from typing import Optional, Any
+from typing import AsyncIterator, Callable, Iterable, Optional, Any
 from datetime import datetime
 
 
 logger = logging.getLogger(__name__)
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(_SIZE_UNITS)))
+
+
+async def _run_to_completion(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run blocking connection work in a thread, and wait for it even if cancelled.
+
+    Callers hold a pooled connection's lock or reader slot around this
+    call. Cancellation cannot stop the worker thread, so releasing the
+    connection as soon as the task is cancelled would hand it to another
+    caller while the thread is still mid-statement (or mid-transaction).
+    The cancellation is re-raised once the thread has finished.
+    """
+    task = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        while not task.done():
+            try:
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                pass
+        # The caller is going away; don't leave the thread's error unretrieved
+        task.exception()
+        raise
+
 
 class ArrDatabaseManager:
     """Manager for arr suite database operations."""
@@ -23,14 +54,59 @@ class ArrDatabaseManager:
         "bazarr": "bazarr.db",
     }
 
-    def __init__(self, config_base_path: str = "/opt/docker-media-server/config"):
+    # Per-connection settings for pooled connections: a 64 MB page cache,
+    # in-memory temp tables, and WAL files truncated back to 64 MB after
+    # checkpoints
+    PRAGMAS = (
+        "PRAGMA cache_size=-64000",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA journal_size_limit=67108864",
+    )
+
+    # Bytes of each database to memory-map when use_mmap is set
+    MMAP_SIZE = 256 * 1024 * 1024
+
+    # Read-only connections per service; WAL lets them read alongside the writer
+    READER_POOL_SIZE = min(os.cpu_count() or 1, 4)
+
+    # Prepared statements kept per pooled connection, so repeated SQL skips
+    # parsing and planning
+    STATEMENT_CACHE_SIZE = 256
+
+    # Seconds to reuse a database file size before stat-ing it again
+    SIZE_CACHE_TTL = 1.0
+
+    def __init__(
+        self,
+        config_base_path: str = "/opt/docker-media-server/config",
+        use_mmap: bool = True
+    ):
         """
         Initialize database manager.
 
         Args:
             config_base_path: Base path where arr config directories are located
+            use_mmap: Memory-map database reads; disable for databases on network
+                filesystems, where a truncated file can crash the process
         """
         self.config_base_path = Path(config_base_path)
+        self.use_mmap = use_mmap
+        self._db_paths = {
+            service: self.config_base_path / service / db_file
+            for service, db_file in self.DATABASE_FILES.items()
+        }
+        self._read_only_uris = {
+            service: f"{db_path.absolute().as_uri()}?mode=ro"
+            for service, db_path in self._db_paths.items()
+        }
+        # Per service: one writer connection, used by one statement at a time,
+        # and up to READER_POOL_SIZE read-only connections for fetching queries
+        self._writers: dict[str, sqlite3.Connection] = {}
+        self._write_locks: dict[str, asyncio.Lock] = {}
+        self._readers: dict[str, list[sqlite3.Connection]] = {}
+        self._read_slots: dict[str, asyncio.Semaphore] = {}
+        # service -> (expires_at, size in bytes) for get_database_size
+        self._size_cache: dict[str, tuple[float, int]] = {}
 
     def get_db_path(self, service: str) -> Path:
         """
@@ -42,25 +118,125 @@ class ArrDatabaseManager:
         Returns:
             Path to the database file
         """
-        if service not in self.DATABASE_FILES:
-            raise ValueError(f"Unknown service: {service}")
+        try:
+            return self._db_paths[service]
+        except KeyError:
+            raise ValueError(f"Unknown service: {service}") from None
+
+    def _connect(self, service: str, read_only: bool = False) -> sqlite3.Connection:
+        """
+        Open a pooled connection to a service database.
 
-        db_file = self.DATABASE_FILES[service]
-        db_path = self.config_base_path / service / db_file
+        Pooled connections stay open so SQLite's page and statement caches
+        survive between queries. Statements run in autocommit mode.
 
-        return db_path
+        Args:
+            service: Service name
+            read_only: Open the database with mode=ro
+
+        Returns:
+            Open, configured connection
+        """
+        if read_only:
+            database, uri = self._read_only_uris[service], True
+        else:
+            database, uri = str(self.get_db_path(service)), False
+
+        conn = sqlite3.connect(
+            database,
+            uri=uri,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=self.STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure(conn)
+        return conn
+
+    def _configure(self, conn: sqlite3.Connection) -> None:
+        """Apply the per-connection PRAGMAs to a new connection."""
+        for pragma in self.PRAGMAS:
+            conn.execute(pragma).fetchone()
+        if self.use_mmap:
+            conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}").fetchone()
+        # NORMAL is only crash-safe in WAL mode, which the arr apps use
+        if conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal":
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+    @contextlib.asynccontextmanager
+    async def _writer(self, service: str) -> AsyncIterator[sqlite3.Connection]:
+        """Hold a service's writer connection, opening it on first use."""
+        lock = self._write_locks.get(service)
+        if lock is None:
+            lock = self._write_locks[service] = asyncio.Lock()
+
+        async with lock:
+            conn = self._writers.get(service)
+            if conn is None:
+                conn = self._writers[service] = self._connect(service)
+            yield conn
+
+    @contextlib.asynccontextmanager
+    async def _reader(self, service: str) -> AsyncIterator[sqlite3.Connection]:
+        """Borrow a read-only connection from a service's reader pool."""
+        slots = self._read_slots.get(service)
+        if slots is None:
+            slots = self._read_slots[service] = asyncio.Semaphore(self.READER_POOL_SIZE)
+
+        async with slots:
+            idle = self._readers.setdefault(service, [])
+            conn = idle.pop() if idle else self._connect(service, read_only=True)
+            try:
+                yield conn
+            finally:
+                # The pool may have been closed while this connection was out
+                if self._readers.get(service) is idle:
+                    idle.append(conn)
+                else:
+                    conn.close()
+
+    async def _close_service(self, service: str) -> None:
+        """Close a service's pooled connections, if open."""
+        for conn in self._readers.pop(service, []):
+            conn.close()
+        lock = self._write_locks.get(service)
+        if lock is None:
+            return
+        async with lock:
+            conn = self._writers.pop(service, None)
+            if conn is not None:
+                conn.close()
+
+    async def close(self) -> None:
+        """Close all pooled database connections."""
+        for service in self._writers.keys() | self._readers.keys():
+            await self._close_service(service)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
 
     async def backup_database(
         self,
         service: str,
-        backup_dir: Optional[str] = None
+        backup_dir: Optional[str] = None,
+        pages: int = -1
     ) -> Path:
         """
         Backup a service database.
 
+        Uses SQLite's online backup API, so the copy is consistent even while
+        the service is writing and includes changes still in the WAL file.
+
         Args:
             service: Service name
             backup_dir: Directory to store backup (default: config_path/backups)
+            pages: Pages copied per backup step; -1 copies everything in one
+                step, which in WAL mode never blocks the service's writes
 
         Returns:
             Path to backup file
@@ -79,18 +255,48 @@ class ArrDatabaseManager:
         backup_path.mkdir(parents=True, exist_ok=True)
 
         # Create timestamped backup
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        backup_file = backup_path / f"{service}_{timestamp}.db"
+        backup_file = self._reserve_backup_file(
+            backup_path, f"{service}_{datetime.now():%Y%m%d_%H%M%S}"
+        )
 
         logger.info(f"Backing up {service} database to {backup_file}")
 
-        # Copy database file
-        shutil.copy2(db_path, backup_file)
+        await asyncio.to_thread(self._backup, self._read_only_uris[service], backup_file, pages)
 
         logger.info(f"Backup completed: {backup_file}")
 
         return backup_file
 
+    @staticmethod
+    def _reserve_backup_file(backup_path: Path, stem: str) -> Path:
+        """
+        Create a new, empty backup file named after stem.
+
+        Backups within the same second would share a name, so later ones
+        get a _1, _2, ... suffix. Creation is exclusive, so concurrent
+        backups never pick the same file.
+        """
+        for attempt in itertools.count():
+            backup_file = backup_path / (f"{stem}_{attempt}.db" if attempt else f"{stem}.db")
+            try:
+                backup_file.touch(exist_ok=False)
+            except FileExistsError:
+                continue
+            return backup_file
+
+    @staticmethod
+    def _backup(source_uri: str, backup_file: Path, pages: int) -> None:
+        """Copy a live database into a new file with the backup API (blocking)."""
+        source = sqlite3.connect(source_uri, uri=True)
+        try:
+            target = sqlite3.connect(str(backup_file))
+            try:
+                source.backup(target, pages=pages)
+            finally:
+                target.close()
+        finally:
+            source.close()
+
     async def backup_all(
         self,
         backup_dir: Optional[str] = None
@@ -106,14 +312,19 @@ class ArrDatabaseManager:
         """
         backups = {}
 
-        for service in self.DATABASE_FILES.keys():
-            try:
-                backup_file = await self.backup_database(service, backup_dir)
-                backups[service] = backup_file
-            except FileNotFoundError:
+        # Each database is a separate file, so copy them all at once
+        results = await asyncio.gather(
+            *(self.backup_database(service, backup_dir) for service in self.DATABASE_FILES),
+            return_exceptions=True
+        )
+
+        for service, result in zip(self.DATABASE_FILES, results):
+            if isinstance(result, FileNotFoundError):
                 logger.warning(f"Database for {service} not found, skipping")
-            except Exception as e:
-                logger.error(f"Failed to backup {service}: {e}")
+            elif isinstance(result, Exception):
+                logger.error(f"Failed to backup {service}: {result}")
+            else:
+                backups[service] = result
 
         return backups
 
@@ -142,9 +353,13 @@ class ArrDatabaseManager:
             logger.info(f"Creating backup of current {service} database")
             await self.backup_database(service)
 
+        # The pooled connection must not outlive the file it was opened on
+        await self._close_service(service)
+
         # Restore from backup
         logger.info(f"Restoring {service} database from {backup_file}")
-        shutil.copy2(backup_path, db_path)
+        await asyncio.to_thread(shutil.copy2, backup_path, db_path)
+        self._size_cache.pop(service, None)
 
         logger.info(f"Database restored successfully")
 
@@ -162,7 +377,8 @@ class ArrDatabaseManager:
             service: Service name
             query: SQL query to execute
             params: Query parameters
-            fetch: Whether to fetch results
+            fetch: Whether to fetch results; fetching queries run on a
+                read-only connection
 
         Returns:
             Query results if fetch=True
@@ -172,25 +388,109 @@ class ArrDatabaseManager:
         if not db_path.exists():
             raise FileNotFoundError(f"Database not found: {db_path}")
 
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
+        # Fetching queries read through the reader pool; everything else
+        # goes through the single writer
+        pool = self._reader if fetch else self._writer
+        async with pool(service) as conn:
+            return await _run_to_completion(self._run_query, conn, query, params, fetch)
 
+    @staticmethod
+    def _run_query(
+        conn: sqlite3.Connection,
+        query: str,
+        params: Optional[tuple],
+        fetch: bool
+    ) -> Any:
+        """Run one statement on a connection (blocking)."""
+        cursor = conn.execute(query, params or ())
         try:
-            cursor = conn.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-
             if fetch:
-                results = [dict(row) for row in cursor.fetchall()]
-                return results
-            else:
-                conn.commit()
-                return cursor.rowcount
-
+                return [dict(row) for row in cursor.fetchall()]
+            return cursor.rowcount
         finally:
-            conn.close()
+            cursor.close()
+
+    async def execute_many(
+        self,
+        service: str,
+        query: str,
+        seq_of_params: Iterable[tuple]
+    ) -> int:
+        """
+        Execute a write statement once per parameter tuple, in one transaction.
+
+        The statement is prepared once for the whole batch, and all rows
+        are committed together (or not at all).
+
+        Args:
+            service: Service name
+            query: SQL statement to execute
+            seq_of_params: Parameters for each execution
+
+        Returns:
+            Total number of rows changed
+        """
+        db_path = self.get_db_path(service)
+
+        if not db_path.exists():
+            raise FileNotFoundError(f"Database not found: {db_path}")
+
+        async with self._writer(service) as conn:
+            return await _run_to_completion(self._run_many, conn, query, seq_of_params)
+
+    @staticmethod
+    def _run_many(conn: sqlite3.Connection, query: str, seq_of_params: Iterable[tuple]) -> int:
+        """Run a statement for each parameter tuple in one transaction (blocking)."""
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.executemany(query, seq_of_params)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        rowcount = cursor.rowcount
+        cursor.close()
+        return rowcount
+
+    async def iter_query(
+        self,
+        service: str,
+        query: str,
+        params: Optional[tuple] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream the rows of a query without materializing the whole result.
+
+        Rows are fetched batch_size at a time on a pooled read-only
+        connection, which stays borrowed until the iteration ends, so
+        memory is bounded by one batch and callers can stop early.
+
+        Args:
+            service: Service name
+            query: SQL query to execute
+            params: Query parameters
+            batch_size: Rows fetched per round trip to the worker thread
+
+        Yields:
+            Each result row as a dict
+        """
+        db_path = self.get_db_path(service)
+
+        if not db_path.exists():
+            raise FileNotFoundError(f"Database not found: {db_path}")
+
+        async with self._reader(service) as conn:
+            cursor = await _run_to_completion(conn.execute, query, params or ())
+            try:
+                while True:
+                    rows = await _run_to_completion(cursor.fetchmany, batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield dict(row)
+            finally:
+                cursor.close()
 
     async def get_table_info(
         self,
@@ -207,8 +507,10 @@ class ArrDatabaseManager:
         Returns:
             List of column information
         """
-        query = f"PRAGMA table_info({table_name})"
-        return await self.execute_query(service, query)
+        # The table-valued form takes the name as a bound parameter, so it
+        # can't be used to inject SQL; unknown tables give no rows
+        query = "SELECT * FROM pragma_table_info(?)"
+        return await self.execute_query(service, query, (table_name,))
 
     async def list_tables(self, service: str) -> list[str]:
         """
@@ -224,12 +526,45 @@ class ArrDatabaseManager:
         results = await self.execute_query(service, query)
         return [row["name"] for row in results]
 
-    async def vacuum_database(self, service: str) -> None:
+    async def get_full_schema(self, service: str) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get schema information for every table in one query.
+
+        Equivalent to get_table_info for each table from list_tables,
+        without a round trip per table.
+
+        Args:
+            service: Service name
+
+        Returns:
+            Dictionary mapping table names to their column information
+        """
+        query = (
+            "SELECT m.name AS table_name, p.* "
+            "FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+            "WHERE m.type = 'table' ORDER BY m.rowid, p.cid"
+        )
+        schema: dict[str, list[dict[str, Any]]] = {}
+        for row in await self.execute_query(service, query):
+            schema.setdefault(row.pop("table_name"), []).append(row)
+        return schema
+
+    async def vacuum_database(self, service: str, min_free_ratio: float = 0.1) -> bool:
         """
         Vacuum (optimize) a service database.
 
+        VACUUM rewrites the whole file, which takes minutes and twice the
+        disk space on large databases; optimize_database covers routine
+        maintenance. It is skipped when too little of the file is free
+        pages to be worth reclaiming.
+
         Args:
             service: Service name
+            min_free_ratio: Smallest fraction of free pages that triggers a
+                VACUUM (0 always vacuums)
+
+        Returns:
+            Whether the database was vacuumed
         """
         db_path = self.get_db_path(service)
 
@@ -238,11 +573,64 @@ class ArrDatabaseManager:
 
         logger.info(f"Vacuuming {service} database")
 
+        if not await asyncio.to_thread(self._vacuum, db_path, min_free_ratio):
+            logger.info(f"Skipped vacuuming {service}: under {min_free_ratio:.0%} free pages")
+            return False
+
+        self._size_cache.pop(service, None)
+        logger.info(f"Database vacuumed successfully")
+        return True
+
+    async def optimize_database(self, service: str, incremental_pages: int = 128000) -> None:
+        """
+        Run cheap routine maintenance on a service database.
+
+        Checkpoints and truncates the WAL file, refreshes query planner
+        statistics, and, when the database uses incremental auto-vacuum,
+        releases up to incremental_pages free pages.
+
+        Args:
+            service: Service name
+            incremental_pages: Most free pages to release
+        """
+        db_path = self.get_db_path(service)
+
+        if not db_path.exists():
+            raise FileNotFoundError(f"Database not found: {db_path}")
+
+        logger.info(f"Optimizing {service} database")
+
+        async with self._writer(service) as conn:
+            await _run_to_completion(self._optimize, conn, incremental_pages)
+        self._size_cache.pop(service, None)
+        logger.info(f"Database optimized successfully")
+
+    @staticmethod
+    def _optimize(conn: sqlite3.Connection, incremental_pages: int) -> None:
+        """Checkpoint, analyze and incrementally vacuum on a connection (blocking)."""
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        conn.execute("PRAGMA optimize").fetchall()
+        # auto_vacuum=2 is INCREMENTAL; otherwise incremental_vacuum does nothing
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            # execute() would step it once, freeing a single page; the script
+            # runs it to completion
+            conn.executescript(f"PRAGMA incremental_vacuum({int(incremental_pages)});")
+
+    @staticmethod
+    def _vacuum(db_path: Path, min_free_ratio: float) -> bool:
+        """Rebuild a database file on a fresh connection if worthwhile (blocking)."""
         conn = sqlite3.connect(str(db_path))
         try:
+            free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            total_pages = conn.execute("PRAGMA page_count").fetchone()[0]
+            if min_free_ratio > 0 and (
+                not total_pages or free_pages / total_pages < min_free_ratio
+            ):
+                return False
+
             conn.execute("VACUUM")
             conn.commit()
-            logger.info(f"Database vacuumed successfully")
+            return True
         finally:
             conn.close()
 
@@ -258,10 +646,17 @@ class ArrDatabaseManager:
         """
         db_path = self.get_db_path(service)
 
-        if not db_path.exists():
-            return 0
+        now = time.monotonic()
+        entry = self._size_cache.get(service)
+        if entry is not None and entry[0] > now:
+            return entry[1]
 
-        return db_path.stat().st_size
+        try:
+            size = os.stat(db_path).st_size
+        except FileNotFoundError:
+            size = 0
+        self._size_cache[service] = (now + self.SIZE_CACHE_TTL, size)
+        return size
 
     async def get_all_database_sizes(self) -> dict[str, dict[str, Any]]:
         """
@@ -287,8 +682,10 @@ class ArrDatabaseManager:
     @staticmethod
     def _human_readable_size(size_bytes: int) -> str:
         """Convert bytes to human readable format."""
-        for unit in ["B", "KB", "MB", "GB", "TB"]:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.2f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.2f} PB"
+        if size_bytes < 1024:
+            return f"{size_bytes:.2f} B"
+        # Each unit is 2**10 times the last, so the bit length picks it directly
+        unit = (size_bytes.bit_length() - 1) // 10
+        if unit > 5:  # Larger sizes are still shown in PB
+            unit = 5
+        return f"{size_bytes / _SIZE_DIVISORS[unit]:.2f} {_SIZE_UNITS[unit]}"
@@ -0,0 +1,788 @@
+"""Tests for arr API clients."""
+
+import asyncio
+import typing
+from typing import Any, Optional
+
+import httpx
+import orjson
+import pytest
+
+from arr_suite_mcp.clients import BazarrClient, OverseerrClient, RadarrClient, SonarrClient
+from arr_suite_mcp.clients import base
+from arr_suite_mcp.clients import http as http_module
+
+
+@pytest.fixture
+def requests_seen():
+    """Requests received by the mock transport."""
+    return []
+
+
+@pytest.fixture
+def responder():
+    """Mutable holder for the mock transport's response function."""
+    return {"handler": lambda request: httpx.Response(200, json={"ok": True})}
+
+
+@pytest.fixture
+async def mock_transport(requests_seen, responder):
+    """Install a mock transport as the shared HTTP client for this loop."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return responder["handler"](request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    http_module._SHARED_CLIENT[asyncio.get_running_loop()] = client
+    yield client
+    await http_module.close_shared_clients()
+
+
+class TestBaseArrClient:
+    """Test cases for the shared BaseArrClient plumbing."""
+
+    async def test_builds_versioned_url_and_auth_header(self, mock_transport, requests_seen):
+        """Each service sends its own API key to its own versioned URL."""
+        sonarr = SonarrClient("http://arr:8989/", "sonarr-key")
+        bazarr = BazarrClient("http://arr:6767", "bazarr-key")
+
+        await sonarr.get("/system/status")
+        await bazarr.get("series", params={"page": 1})
+
+        assert str(requests_seen[0].url) == "http://arr:8989/api/v3/system/status"
+        assert requests_seen[0].headers["X-Api-Key"] == "sonarr-key"
+        assert str(requests_seen[1].url) == "http://arr:6767/api/v4/series?page=1"
+        assert requests_seen[1].headers["X-Api-Key"] == "bazarr-key"
+
+    async def test_clients_share_connection_pool(self, mock_transport):
+        """All clients on a loop use the same AsyncClient."""
+        sonarr = SonarrClient("http://arr:8989", "a")
+        radarr = RadarrClient("http://arr:7878", "b")
+
+        assert sonarr.client is radarr.client is mock_transport
+
+        await sonarr.close()
+        assert not mock_transport.is_closed
+
+    async def test_fixed_requests_are_reused(self, mock_transport, requests_seen):
+        """Requests without params or body are built once."""
+        client = SonarrClient("http://arr:8989", "key")
+
+        await client.get("tag")
+        await client.get("tag")
+        await client.get("tag", params={"id": 1})
+
+        assert requests_seen[0] is requests_seen[1]
+        assert requests_seen[2] is not requests_seen[0]
+
+    async def test_fixed_request_cache_is_bounded(self, mock_transport, requests_seen, monkeypatch):
+        """Per-id paths evict the least recently used prebuilt request."""
+        monkeypatch.setattr(base, "REQUEST_CACHE_SIZE", 2)
+        client = RadarrClient("http://arr:7878", "key")
+
+        await client.get_movie(1)
+        await client.get_movie(2)
+        await client.get_movie(1)
+        await client.get_movie(3)
+        await client.get_movie(1)
+        await client.get_movie(2)
+
+        assert len(client._req_cache) == 2
+        assert requests_seen[2] is requests_seen[0]
+        assert requests_seen[4] is requests_seen[0]
+        assert requests_seen[5] is not requests_seen[1]
+
+
+class TestPagination:
+    """Test cases for fetching every page of paginated endpoints."""
+
+    async def test_bazarr_fetches_remaining_pages(self, mock_transport, requests_seen, responder):
+        """Pages after the first are fetched and flattened in order."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json={"data": [{"page": page}] * 2, "total": 5})
+
+        responder["handler"] = handler
+        client = BazarrClient("http://arr:6767", "key")
+
+        series = await client.get_all_series(page_size=2)
+
+        assert [item["page"] for item in series] == [1, 1, 2, 2, 3, 3]
+        assert len(requests_seen) == 3
+
+    async def test_overseerr_pages_by_skip(self, mock_transport, requests_seen, responder):
+        """Overseerr pagination walks take/skip offsets."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            skip = int(request.url.params["skip"])
+            return httpx.Response(
+                200,
+                json={"pageInfo": {"results": 3}, "results": [{"skip": skip}]}
+            )
+
+        responder["handler"] = handler
+        client = OverseerrClient("http://arr:5055", "key")
+
+        requests = await client.get_all_requests(take=1)
+
+        assert [item["skip"] for item in requests] == [0, 1, 2]
+
+
+    async def test_iter_history_prefetches_pages(self, mock_transport, requests_seen, responder):
+        """iter_history yields every record across concurrently fetched pages."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            records = [{"id": i} for i in range((page - 1) * 2, min(page * 2, 5))]
+            return httpx.Response(200, json={"records": records, "totalRecords": 5})
+
+        responder["handler"] = handler
+        radarr = RadarrClient("http://arr:7878", "key")
+
+        ids = sorted([record["id"] async for record in radarr.iter_history(page_size=2)])
+
+        assert ids == [0, 1, 2, 3, 4]
+        assert len(requests_seen) == 3
+        assert requests_seen[0].url.params["pageSize"] == "2"
+
+class TestRequestCoalescing:
+    """Test cases for in-flight GET deduplication."""
+
+    async def test_concurrent_identical_gets_share_request(self, mock_transport, requests_seen):
+        """Identical concurrent GETs hit the network once."""
+        client = SonarrClient("http://arr:8989", "key")
+
+        results = await asyncio.gather(*(client.get("system/status") for _ in range(5)))
+
+        assert len(requests_seen) == 1
+        assert all(result == {"ok": True} for result in results)
+        assert client._inflight == {}
+
+    async def test_different_params_are_not_coalesced(self, mock_transport, requests_seen):
+        """GETs with different params are sent separately."""
+        client = SonarrClient("http://arr:8989", "key")
+
+        await asyncio.gather(
+            client.get("series/lookup", params={"term": "a"}),
+            client.get("series/lookup", params={"term": "b"})
+        )
+
+        assert len(requests_seen) == 2
+
+
+    async def test_bulk_adds_share_identical_lookups(self, mock_transport, requests_seen, responder):
+        """Concurrent adds of the same movie look it up only once."""
+        responder["handler"] = lambda request: httpx.Response(
+            200 if request.method == "GET" else 201,
+            json=[{"tmdbId": 603}] if request.method == "GET" else {"id": 1}
+        )
+        client = RadarrClient("http://arr:7878", "key")
+        spec = {"tmdb_id": 603, "quality_profile_id": 1, "root_folder_path": "/movies"}
+
+        await client.add_movies_bulk([spec, spec, spec])
+
+        assert [request.method for request in requests_seen].count("GET") == 1
+
+class TestRetries:
+    """Test cases for retrying transient failures."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Skip backoff sleeps."""
+        monkeypatch.setattr(base, "_backoff_delay", lambda attempt: 0)
+
+    async def test_retries_gateway_errors(self, mock_transport, requests_seen, responder):
+        """503 responses are retried until the service recovers."""
+        statuses = iter([503, 502, 200])
+        responder["handler"] = lambda request: httpx.Response(next(statuses), json={"ok": True})
+        client = SonarrClient("http://arr:8989", "key", max_retries=3)
+
+        assert await client.post("command", json={"name": "Backup"}) == {"ok": True}
+        assert len(requests_seen) == 3
+
+    async def test_connection_error_after_retries(self, mock_transport, requests_seen, responder):
+        """Connection errors surface once retries are exhausted."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        responder["handler"] = handler
+        client = SonarrClient("http://arr:8989", "key", max_retries=2)
+
+        with pytest.raises(base.ArrClientConnectionError):
+            await client.get("system/status")
+        assert len(requests_seen) == 3
+
+    async def test_auth_errors_are_not_retried(self, mock_transport, requests_seen, responder):
+        """401 fails fast."""
+        responder["handler"] = lambda request: httpx.Response(401)
+        client = SonarrClient("http://arr:8989", "key")
+
+        with pytest.raises(base.ArrClientAuthError):
+            await client.get("system/status")
+        assert len(requests_seen) == 1
+
+
+    async def test_throttling_honors_retry_after(self, mock_transport, requests_seen, responder, monkeypatch):
+        """429 responses wait for Retry-After (capped) before retrying."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        statuses = iter([(429, "2"), (429, "3600"), (200, None)])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            status, retry_after = next(statuses)
+            headers = {"Retry-After": retry_after} if retry_after else {}
+            return httpx.Response(status, headers=headers, json={"ok": True})
+
+        responder["handler"] = handler
+        client = SonarrClient("http://arr:8989", "key")
+
+        assert await client.get("system/status") == {"ok": True}
+        assert sleeps == [2.0, base.RETRY_AFTER_CAP]
+
+class TestJsonBodies:
+    """Test cases for JSON request and response bodies."""
+
+    async def test_round_trips_json(self, mock_transport, requests_seen, responder):
+        """Request bodies are serialized and responses parsed."""
+        responder["handler"] = lambda request: httpx.Response(200, content=request.content)
+        client = SonarrClient("http://arr:8989", "key")
+
+        result = await client.post("tag", json={"label": "4k"})
+
+        assert result == {"label": "4k"}
+        assert requests_seen[0].headers["Content-Type"] == "application/json"
+
+    async def test_constant_command_bodies_are_reused(self, mock_transport, requests_seen):
+        """Constant commands send their pre-encoded body from one cached request."""
+        client = RadarrClient("http://arr:7878", "key")
+
+        await client.backup_database()
+        await client.backup_database()
+
+        assert requests_seen[0] is requests_seen[1]
+        assert orjson.loads(requests_seen[0].content) == {"name": "Backup"}
+
+    async def test_empty_response_returns_none(self, mock_transport, responder):
+        """Empty bodies are returned as None."""
+        responder["handler"] = lambda request: httpx.Response(200)
+        client = SonarrClient("http://arr:8989", "key")
+
+        assert await client.delete("tag/1") is None
+
+
+class TestBatching:
+    """Test cases for debounced micro-batching."""
+
+    async def test_approvals_flush_together(self, mock_transport, requests_seen, responder):
+        """Approvals issued together are all sent and resolved per caller."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/2/approve"):
+                return httpx.Response(500, text="boom")
+            return httpx.Response(200, json={"path": request.url.path})
+
+        responder["handler"] = handler
+        client = OverseerrClient("http://arr:5055", "key")
+
+        results = await asyncio.gather(
+            client.approve_request(1),
+            client.approve_request(2),
+            client.approve_request(3),
+            return_exceptions=True
+        )
+
+        assert results[0] == {"path": "/api/v1/request/1/approve"}
+        assert isinstance(results[1], base.ArrClientError)
+        assert results[2] == {"path": "/api/v1/request/3/approve"}
+        assert len(requests_seen) == 3
+
+    async def test_full_batch_flushes_immediately(self):
+        """Reaching max_size flushes without waiting for the timer."""
+        sent = []
+
+        async def send(item):
+            sent.append(item)
+            return item
+
+        batcher = base._Batcher(send, max_wait=60, max_size=2)
+
+        assert await asyncio.gather(batcher.submit("a"), batcher.submit("b")) == ["a", "b"]
+        assert sent == ["a", "b"]
+
+    async def test_in_flight_batches_are_referenced(self):
+        """The batcher holds each sending batch's task until it finishes."""
+        release = asyncio.Event()
+
+        async def send(item):
+            await release.wait()
+            return item
+
+        batcher = base._Batcher(send, max_wait=60, max_size=1)
+        submitted = asyncio.ensure_future(batcher.submit("a"))
+        await asyncio.sleep(0)
+
+        assert len(batcher._tasks) == 1
+        release.set()
+        assert await submitted == "a"
+        await asyncio.sleep(0)
+        assert batcher._tasks == set()
+
+
+class TestStreaming:
+    """Test cases for streaming JSON responses."""
+
+    async def test_stream_get_yields_items(self, mock_transport, responder):
+        """Items are yielded from the nested array."""
+        responder["handler"] = lambda request: httpx.Response(
+            200, json={"data": [{"id": 1}, {"id": 2}], "total": 2}
+        )
+        client = BazarrClient("http://arr:6767", "key")
+
+        entries = [entry async for entry in client.iter_history()]
+
+        assert entries == [{"id": 1}, {"id": 2}]
+
+    async def test_stream_get_raises_on_error(self, mock_transport, responder):
+        """Error statuses raise before any items are yielded."""
+        responder["handler"] = lambda request: httpx.Response(404)
+        client = BazarrClient("http://arr:6767", "key")
+
+        with pytest.raises(base.ArrClientNotFoundError):
+            async for _ in client.iter_system_logs():
+                pass
+
+
+    async def test_iter_all_movies_projects_fields(self, mock_transport, responder):
+        """Only the requested fields are kept from each streamed movie."""
+        responder["handler"] = lambda request: httpx.Response(
+            200, json=[{"id": 1, "title": "Heat", "overview": "..."}, {"id": 2, "title": "Ran"}]
+        )
+        client = RadarrClient("http://arr:7878", "key")
+
+        movies = [movie async for movie in client.iter_all_movies(fields={"id", "title"})]
+
+        assert movies == [{"id": 1, "title": "Heat"}, {"id": 2, "title": "Ran"}]
+
+class TestEndpointDeclarations:
+    """Test cases for generated endpoint methods."""
+
+    async def test_generated_method_sends_params(self, mock_transport, requests_seen):
+        """Optional params are only sent when set."""
+        client = OverseerrClient("http://arr:5055", "key")
+
+        await client.get_issues()
+        await client.get_issues(take=5, filter="open")
+
+        assert dict(requests_seen[0].url.params) == {"take": "20", "skip": "0"}
+        assert dict(requests_seen[1].url.params) == {"take": "5", "skip": "0", "filter": "open"}
+
+    def test_generated_method_metadata(self):
+        """Generated methods look like hand-written ones."""
+        assert BazarrClient.get_series.__qualname__ == "BazarrClient.get_series"
+        assert BazarrClient.get_series.__doc__ == "Get all series managed by Bazarr."
+        assert typing.get_type_hints(OverseerrClient.get_issues) == {
+            "take": int, "skip": int, "filter": Optional[str], "return": dict[str, Any]
+        }
+        assert typing.get_type_hints(RadarrClient.get_movie) == {
+            "movie_id": int, "return": dict[str, Any]
+        }
+        assert typing.get_type_hints(RadarrClient.get_all_movies) == {
+            "return": list[dict[str, Any]]
+        }
+        assert typing.get_type_hints(RadarrClient.delete_tag) == {
+            "tag_id": int, "return": type(None)
+        }
+
+    async def test_path_placeholders_become_arguments(self, mock_transport, requests_seen):
+        """Path placeholders are required arguments formatted into the URL."""
+        client = RadarrClient("http://arr:7878", "key")
+
+        await client.get_movie(42)
+        await client.delete_tag(tag_id=7)
+
+        assert str(requests_seen[0].url) == "http://arr:7878/api/v3/movie/42"
+        assert requests_seen[1].method == "DELETE"
+        assert requests_seen[1].url.path == "/api/v3/tag/7"
+
+
+class TestEtagCache:
+    """Test cases for ETag revalidation of read-mostly endpoints."""
+
+    async def test_not_modified_reuses_cached_body(self, mock_transport, requests_seen, responder):
+        """A 304 returns the previously cached body."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"version": "1.0"}, headers={"ETag": '"v1"'})
+
+        responder["handler"] = handler
+        client = BazarrClient("http://arr:6767", "key")
+
+        assert await client.get_languages() == {"version": "1.0"}
+        assert await client.get_languages() == {"version": "1.0"}
+        assert "If-None-Match" not in requests_seen[0].headers
+        assert requests_seen[1].headers["If-None-Match"] == '"v1"'
+
+    async def test_other_endpoints_are_not_revalidated(self, mock_transport, requests_seen, responder):
+        """Endpoints outside the allowlist never send If-None-Match."""
+        responder["handler"] = lambda request: httpx.Response(
+            200, json=[], headers={"ETag": '"x"'}
+        )
+        client = BazarrClient("http://arr:6767", "key")
+
+        await client.get_blacklist()
+        await client.get_blacklist()
+
+        assert all("If-None-Match" not in request.headers for request in requests_seen)
+
+
+class TestBulkAdd:
+    """Test cases for concurrent bulk adds."""
+
+    async def test_add_movies_bulk_keeps_order_and_failures(self, mock_transport, responder):
+        """Each spec gets its result, or its exception, in order."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/lookup"):
+                term = request.url.params["term"]
+                return httpx.Response(200, json=[] if term == "tmdb:0" else [{"tmdbId": term}])
+            return httpx.Response(201, content=request.content)
+
+        responder["handler"] = handler
+        radarr = RadarrClient("http://arr:7878", "key")
+
+        added, missing = await radarr.add_movies_bulk([
+            {"tmdb_id": 1, "quality_profile_id": 1, "root_folder_path": "/movies"},
+            {"tmdb_id": 0, "quality_profile_id": 1, "root_folder_path": "/movies"}
+        ])
+
+        assert added["tmdbId"] == "tmdb:1"
+        assert added["rootFolderPath"] == "/movies"
+        assert isinstance(missing, ValueError)
+
+
+    async def test_edit_movies_bulk_sends_one_request(self, mock_transport, requests_seen, responder):
+        """Bulk edits go to the movie editor endpoint in a single PUT."""
+        responder["handler"] = lambda request: httpx.Response(202, json=[{"id": 1}, {"id": 2}])
+        radarr = RadarrClient("http://arr:7878", "key")
+
+        await radarr.edit_movies_bulk([1, 2], {"monitored": False})
+
+        assert len(requests_seen) == 1
+        assert requests_seen[0].url.path == "/api/v3/movie/editor"
+        assert orjson.loads(requests_seen[0].content) == {"monitored": False, "movieIds": [1, 2]}
+
+class TestTtlCache:
+    """Test cases for TTL-cached lookup endpoints."""
+
+    async def test_lookups_are_cached_until_mutation(self, mock_transport, requests_seen):
+        """Tags are fetched once, then refetched after a tag is created."""
+        client = RadarrClient("http://arr:7878", "key")
+
+        await client.get_tags()
+        await client.get_tags()
+        await client.get_quality_profiles()
+        assert len(requests_seen) == 2
+
+        await client.create_tag("4k")
+        await client.get_tags()
+        await client.get_quality_profiles()
+        assert [request.url.path for request in requests_seen[2:]] == [
+            "/api/v3/tag", "/api/v3/tag"
+        ]
+
+
+class TestConnectionChecks:
+    """Test cases for connection tests."""
+
+    async def test_all_runs_concurrently_with_timeout(self, mock_transport, responder):
+        """A hung service times out without blocking the others."""
+        from arr_suite_mcp.clients import test_all
+
+        class SlowRadarrClient(RadarrClient):
+            __slots__ = ()
+
+            async def get(self, endpoint, params=None):
+                await asyncio.sleep(10)
+
+        sonarr = SonarrClient("http://arr:8989", "key")
+        radarr = SlowRadarrClient("http://arr:7878", "key")
+
+        results = await asyncio.wait_for(test_all([sonarr, radarr], timeout=0.1), 1)
+
+        assert results == [True, False]
+
+
+class TestPlexClient:
+    """Test cases for the Plex client."""
+
+    @pytest.fixture
+    def plex(self, mock_transport):
+        """Plex client backed by the mock transport."""
+        from arr_suite_mcp.clients import PlexClient
+
+        return PlexClient("http://plex:32400", "token")
+
+    async def test_shares_client_with_arr_clients(self, plex, mock_transport, requests_seen):
+        """Plex uses the shared pool and sends its own token."""
+        await plex.get("identity")
+
+        assert plex.client is SonarrClient("http://arr:8989", "key").client
+        assert requests_seen[0].headers["X-Plex-Token"] == "token"
+        assert "X-Plex-Token" not in requests_seen[0].url.params
+
+    async def test_dedicated_pool_is_closed(self):
+        """Custom limits give the instance a pool that close() shuts down."""
+        from arr_suite_mcp.clients import PlexClient
+
+        plex = PlexClient("http://plex:32400", "token", limits=httpx.Limits(max_connections=5))
+        pool = plex.client
+
+        await plex.close()
+        await plex.close()
+        assert pool.is_closed
+
+    async def test_dedicated_pool_is_lazy(self):
+        """No pool is opened until the first request needs one."""
+        from arr_suite_mcp.clients import PlexClient
+
+        async with PlexClient("http://plex:32400", "token", http2=False) as plex:
+            assert plex._client is None
+
+    def test_unclosed_dedicated_pool_is_reported(self, caplog):
+        """Dropping an open dedicated pool logs a leak warning."""
+        from arr_suite_mcp.clients import PlexClient
+
+        plex = PlexClient("http://plex:32400", "token", http2=False)
+        plex.client
+        del plex
+
+        assert "garbage-collected without close()" in caplog.text
+
+    async def test_retries_throttling_with_retry_after(self, plex, requests_seen, responder, monkeypatch):
+        """429 responses wait for Retry-After before retrying."""
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        statuses = iter([429, 200])
+        responder["handler"] = lambda request: httpx.Response(
+            next(statuses), json={"MediaContainer": {}}, headers={"Retry-After": "2"}
+        )
+
+        assert await plex.get("identity") == {"MediaContainer": {}}
+        assert sleeps == [2.0]
+        assert len(requests_seen) == 2
+
+    async def test_auth_errors_fail_fast(self, plex, requests_seen, responder):
+        """401 is not retried."""
+        responder["handler"] = lambda request: httpx.Response(401)
+
+        with pytest.raises(base.ArrClientAuthError):
+            await plex.get("identity")
+        assert len(requests_seen) == 1
+
+    async def test_cached_get_serves_and_revalidates(self, plex, requests_seen, responder, monkeypatch):
+        """Cached endpoints are served locally, then revalidated after expiry."""
+        from arr_suite_mcp.clients import plex as plex_module
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"lib"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json={"MediaContainer": {"Directory": [{"key": "1"}]}},
+                headers={"ETag": '"lib"'}
+            )
+
+        responder["handler"] = handler
+        clock = [1000.0]
+        monkeypatch.setattr(plex_module.time, "monotonic", lambda: clock[0])
+
+        assert await plex.get_libraries() == [{"key": "1"}]
+        assert await plex.get_libraries() == [{"key": "1"}]
+        assert len(requests_seen) == 1
+
+        clock[0] += plex_module.CACHE_TTL + 1
+        assert await plex.get_libraries() == [{"key": "1"}]
+        assert requests_seen[1].headers["If-None-Match"] == '"lib"'
+
+    async def test_mutations_invalidate_cache(self, plex, requests_seen, responder):
+        """Refreshing a library drops cached library listings."""
+        responder["handler"] = lambda request: httpx.Response(200, json={"MediaContainer": {}})
+
+        await plex.get_libraries()
+        await plex.refresh_library(1)
+        await plex.get_libraries()
+
+        assert len(requests_seen) == 3
+
+    async def test_metadata_many_uses_batch_endpoint(self, plex, requests_seen, responder):
+        """Numeric rating keys are fetched in one request, returned in order."""
+        responder["handler"] = lambda request: httpx.Response(
+            200,
+            json={"MediaContainer": {"Metadata": [{"ratingKey": "2"}, {"ratingKey": "1"}]}}
+        )
+
+        items = await plex.get_metadata_many(["1", "2", "3"])
+
+        assert items == [{"ratingKey": "1"}, {"ratingKey": "2"}, {}]
+        assert requests_seen[0].url.path == "/library/metadata/1,2,3"
+
+    async def test_children_many_collects_failures(self, plex, responder):
+        """Failed items come back as exceptions without failing the batch."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "/bad/" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, json={"MediaContainer": {"Metadata": [{"index": 1}]}})
+
+        responder["handler"] = handler
+
+        good, bad = await plex.get_children_many(["good", "bad"])
+
+        assert good == [{"index": 1}]
+        assert isinstance(bad, base.ArrClientNotFoundError)
+
+    async def test_json_bodies_use_orjson(self, plex, requests_seen, responder):
+        """Request bodies are encoded and responses decoded with orjson."""
+        responder["handler"] = lambda request: httpx.Response(200, content=request.content)
+
+        result = await plex.post("prefs", json={"name": "FriendlyName"})
+
+        assert result == {"name": "FriendlyName"}
+        assert requests_seen[0].content == orjson.dumps({"name": "FriendlyName"})
+        assert requests_seen[0].headers["Content-Type"] == "application/json"
+
+    async def test_iter_library_items_pages(self, plex, requests_seen, responder):
+        """Library items are fetched one container page at a time."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            start = int(request.url.params["X-Plex-Container-Start"])
+            items = [{"ratingKey": str(i)} for i in range(start, min(start + 2, 5))]
+            return httpx.Response(200, json={"MediaContainer": {"totalSize": 5, "Metadata": items}})
+
+        responder["handler"] = handler
+
+        keys = [item["ratingKey"] async for item in plex.iter_library_items(1, page_size=2)]
+
+        assert keys == ["0", "1", "2", "3", "4"]
+        assert len(requests_seen) == 3
+
+    async def test_concurrent_gets_share_request(self, plex, requests_seen):
+        """Identical concurrent GETs collapse into one request."""
+        results = await asyncio.gather(*(plex.get("library/sections") for _ in range(5)))
+
+        assert len(requests_seen) == 1
+        assert all(result == results[0] for result in results)
+
+    async def test_create_playlist_uses_machine_identifier(self, plex, requests_seen, responder):
+        """Playlist URIs reference the server by its real machine identifier."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/identity":
+                return httpx.Response(200, json={"MediaContainer": {"machineIdentifier": "abc"}})
+            return httpx.Response(200, json={})
+
+        responder["handler"] = handler
+
+        await plex.create_playlist("Mix", ["1", "2"])
+        await plex.create_playlist("Mix 2", ["3"])
+
+        posts = [request for request in requests_seen if request.method == "POST"]
+        assert posts[0].url.params["uri"] == (
+            "server://abc/com.plexapp.plugins.library/library/metadata/1,2"
+        )
+        assert [request.url.path for request in requests_seen].count("/identity") == 1
+
+    async def test_mark_watched_runs_in_background(self, plex, requests_seen):
+        """mark_watched returns immediately; close() waits for the request."""
+        await plex.mark_watched("42")
+        assert requests_seen == []
+
+        await plex.close()
+
+        assert requests_seen[0].url.path == "/:/scrobble"
+        assert requests_seen[0].url.params["key"] == "42"
+
+    async def test_background_failures_are_logged(self, plex, responder, caplog):
+        """Failures of fire-and-forget requests are logged, not raised."""
+        responder["handler"] = lambda request: httpx.Response(500)
+
+        await plex.mark_unwatched("42")
+        await plex.close()
+
+        assert "background request failed" in caplog.text
+
+
+    async def test_not_found_is_cached_until_mutation(self, plex, requests_seen, responder):
+        """Repeated probes for a missing item skip the network until something changes."""
+        responder["handler"] = lambda request: httpx.Response(
+            404 if request.method == "GET" else 200
+        )
+
+        for _ in range(3):
+            with pytest.raises(base.ArrClientNotFoundError):
+                await plex.get_metadata("99")
+        assert len(requests_seen) == 1
+
+        await plex.refresh_metadata("1")
+        with pytest.raises(base.ArrClientNotFoundError):
+            await plex.get_metadata("99")
+        assert len(requests_seen) == 3
+
+    async def test_limits_concurrent_requests(self):
+        """Requests beyond max_inflight wait for a free slot."""
+        from arr_suite_mcp.clients import PlexClient
+
+        release = asyncio.Event()
+        peak = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            peak.append(plex.in_flight)
+            await release.wait()
+            return httpx.Response(200, json={})
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        plex = PlexClient("http://plex:32400", "token", client=client, max_inflight=2)
+        tasks = [asyncio.ensure_future(plex.get(f"library/metadata/{i}")) for i in range(5)]
+        await asyncio.sleep(0.01)
+
+        assert plex.in_flight == 2
+        assert plex.queued == 3
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert max(peak) == 2
+        assert plex.in_flight == plex.queued == 0
+        await client.aclose()
+
+class TestSlots:
+    """Client instances carry no per-instance __dict__."""
+
+    @pytest.mark.parametrize("client_cls", [BazarrClient, OverseerrClient, RadarrClient, SonarrClient])
+    def test_arr_clients_have_no_dict(self, client_cls):
+        """Arr clients are fully slotted."""
+        assert not hasattr(client_cls("http://arr", "key"), "__dict__")
+
+    def test_plex_client_has_no_dict(self):
+        """PlexClient is fully slotted."""
+        from arr_suite_mcp.clients import PlexClient
+
+        assert not hasattr(PlexClient("http://plex:32400", "token"), "__dict__")
+
+
+class TestSharedClient:
+    """Test cases for the shared HTTP client."""
+
+    async def test_requests_compressed_responses(self):
+        """The shared client is reused and asks for compressed bodies."""
+        client = http_module.get_shared_client()
+        try:
+            assert "gzip" in client.headers["Accept-Encoding"]
+            assert client is http_module.get_shared_client()
+        finally:
+            await http_module.close_shared_clients()
+
+    def test_ssl_context_built_once(self):
+        """Every pool verifies with the same cached SSL context."""
+        assert http_module.get_ssl_context() is http_module.get_ssl_context()
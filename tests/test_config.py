@@ -0,0 +1,56 @@
+"""Tests for configuration loading."""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from arr_suite_mcp.config import ArrSuiteConfig, SonarrConfig
+
+
+class TestArrSuiteConfig:
+    """Test cases for ArrSuiteConfig service loading."""
+
+    def test_loads_services_from_env_file(self, tmp_path, monkeypatch):
+        """Service settings in .env are picked up; real env vars take precedence."""
+        for name in ("SONARR_API_KEY", "SONARR_HOST", "RADARR_API_KEY"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("SONARR_HOST", "tv.local")
+        (tmp_path / ".env").write_text("SONARR_API_KEY=abc\nSONARR_HOST=ignored\n")
+        monkeypatch.chdir(tmp_path)
+
+        config = ArrSuiteConfig()
+
+        assert config.sonarr.api_key == "abc"
+        assert config.sonarr.host == "tv.local"
+        assert config.radarr is None
+        assert "sonarr" in config.enabled_services
+        assert "SONARR_API_KEY" not in os.environ
+
+    def test_enabled_services_follow_assignment(self, tmp_path, monkeypatch):
+        """Assigning a service config refreshes enabled_services."""
+        monkeypatch.chdir(tmp_path)
+        config = ArrSuiteConfig()
+        config.sonarr = SonarrConfig(api_key="key")
+
+        assert config.enabled_services[0] == "sonarr"
+        config.sonarr = None
+        assert "sonarr" not in config.enabled_services
+
+
+class TestArrServiceConfig:
+    """Test cases for per-service settings."""
+
+    def test_base_url_is_computed_once(self):
+        """base_url joins scheme, host, port and base path, and is cached."""
+        config = SonarrConfig(api_key="key", ssl=True, base_path="/sonarr/")
+
+        assert config.base_url == "https://localhost:8989/sonarr"
+        assert config.base_url is config.base_url
+
+    def test_service_configs_are_frozen(self):
+        """Service configs cannot change after load, so base_url can't go stale."""
+        config = SonarrConfig(api_key="key")
+
+        with pytest.raises(ValidationError):
+            config.port = 1
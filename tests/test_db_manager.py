@@ -0,0 +1,244 @@
+"""Tests for the arr database manager."""
+
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+from arr_suite_mcp.utils import ArrDatabaseManager
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    """Config directory holding a small Sonarr database."""
+    db_path = tmp_path / "sonarr" / "sonarr.db"
+    db_path.parent.mkdir()
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE Series (Id INTEGER PRIMARY KEY, Title TEXT)")
+    conn.executemany("INSERT INTO Series (Title) VALUES (?)", [("Dune",), ("Severance",)])
+    conn.commit()
+    conn.close()
+    return tmp_path
+
+
+@pytest.fixture
+async def manager(config_dir):
+    """Database manager over the test config directory."""
+    async with ArrDatabaseManager(str(config_dir)) as manager:
+        yield manager
+
+
+class TestArrDatabaseManager:
+    """Test cases for ArrDatabaseManager queries."""
+
+    async def test_reads_and_writes_use_separate_pools(self, manager):
+        """Fetches borrow a pooled read-only connection; writes reuse the one writer."""
+        rows = await manager.execute_query("sonarr", "SELECT Title FROM Series ORDER BY Id")
+        reader = manager._readers["sonarr"][0]
+        changed = await manager.execute_query(
+            "sonarr", "UPDATE Series SET Title = ? WHERE Id = 1", ("Dune: Prophecy",), fetch=False
+        )
+        writer = manager._writers["sonarr"]
+        await manager.execute_query("sonarr", "DELETE FROM Series WHERE Id = 2", fetch=False)
+        after = await manager.execute_query("sonarr", "SELECT Title FROM Series")
+
+        assert rows == [{"Title": "Dune"}, {"Title": "Severance"}]
+        assert changed == 1
+        assert after == [{"Title": "Dune: Prophecy"}]
+        assert manager._writers["sonarr"] is writer
+        assert manager._readers["sonarr"] == [reader]
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            await manager.execute_query("sonarr", "DELETE FROM Series")
+
+    async def test_close_releases_connections(self, manager):
+        """close() closes the pooled connections; the next query reopens."""
+        await manager.list_tables("sonarr")
+        await manager.execute_query("sonarr", "DELETE FROM Series WHERE Id = 2", fetch=False)
+        conn = manager._readers["sonarr"][0]
+
+        await manager.close()
+
+        assert manager._readers == {}
+        assert manager._writers == {}
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        assert await manager.list_tables("sonarr") == ["Series"]
+
+    async def test_execute_many_is_one_transaction(self, manager):
+        """execute_many commits every row together, or none on error."""
+        added = await manager.execute_many(
+            "sonarr", "INSERT INTO Series (Title) VALUES (?)", [("Andor",), ("Taskmaster",)]
+        )
+        with pytest.raises(sqlite3.IntegrityError):
+            await manager.execute_many(
+                "sonarr", "INSERT INTO Series (Id, Title) VALUES (?, ?)", [(10, "A"), (1, "B")]
+            )
+
+        rows = await manager.execute_query("sonarr", "SELECT Title FROM Series ORDER BY Id")
+        assert added == 2
+        assert [row["Title"] for row in rows] == ["Dune", "Severance", "Andor", "Taskmaster"]
+
+    async def test_cancelled_batch_keeps_writer_until_done(self, manager):
+        """A cancelled execute_many holds the writer until its thread finishes."""
+        def slow_rows():
+            for i in range(20):
+                time.sleep(0.005)
+                yield (f"Row {i}",)
+
+        batch = asyncio.create_task(
+            manager.execute_many("sonarr", "INSERT INTO Series (Title) VALUES (?)", slow_rows())
+        )
+        await asyncio.sleep(0.03)
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+
+        assert not manager._writers["sonarr"].in_transaction
+        await manager.execute_query(
+            "sonarr", "INSERT INTO Series (Title) VALUES ('After')", fetch=False
+        )
+        rows = await manager.execute_query("sonarr", "SELECT COUNT(*) AS n FROM Series")
+        assert rows == [{"n": 2 + 20 + 1}]
+
+    async def test_iter_query_streams_rows(self, manager):
+        """iter_query yields every row across batches and returns its reader."""
+        rows = [
+            row async for row in manager.iter_query(
+                "sonarr", "SELECT Title FROM Series WHERE Id > ? ORDER BY Id", (0,), batch_size=1
+            )
+        ]
+
+        assert rows == [{"Title": "Dune"}, {"Title": "Severance"}]
+        assert len(manager._readers["sonarr"]) == 1
+
+    async def test_get_table_info_binds_table_name(self, manager):
+        """Table names are bound, never spliced into the SQL."""
+        columns = await manager.get_table_info("sonarr", "Series")
+        injected = await manager.get_table_info("sonarr", "Series); DROP TABLE Series; --")
+
+        assert [column["name"] for column in columns] == ["Id", "Title"]
+        assert columns[0]["pk"] == 1
+        assert injected == []
+        assert await manager.list_tables("sonarr") == ["Series"]
+
+    async def test_get_full_schema_matches_table_info(self, manager):
+        """get_full_schema returns get_table_info for every table in one query."""
+        await manager.execute_query(
+            "sonarr", "CREATE TABLE Episodes (Id INTEGER PRIMARY KEY, SeriesId INTEGER)",
+            fetch=False
+        )
+
+        schema = await manager.get_full_schema("sonarr")
+
+        assert list(schema) == await manager.list_tables("sonarr")
+        for table in schema:
+            assert schema[table] == await manager.get_table_info("sonarr", table)
+
+    async def test_configures_pooled_connections(self, config_dir):
+        """Pooled connections get the PRAGMA bundle; mmap can be turned off."""
+        wal = sqlite3.connect(config_dir / "sonarr" / "sonarr.db")
+        wal.execute("PRAGMA journal_mode=WAL")
+        wal.close()
+
+        async with ArrDatabaseManager(str(config_dir), use_mmap=False) as manager:
+            async def pragma(name):
+                return (await manager.execute_query("sonarr", f"PRAGMA {name}"))[0][name]
+
+            assert await pragma("cache_size") == -64000
+            assert await pragma("synchronous") == 1
+            assert await pragma("mmap_size") == 0
+
+    async def test_optimize_checkpoints_wal(self, manager):
+        """optimize_database folds the WAL back into the database file."""
+        await manager.execute_query("sonarr", "PRAGMA journal_mode=WAL", fetch=False)
+        await manager.execute_query(
+            "sonarr", "INSERT INTO Series (Title) VALUES ('Andor')", fetch=False
+        )
+        wal_file = manager.get_db_path("sonarr").with_name("sonarr.db-wal")
+        assert wal_file.stat().st_size > 0
+
+        await manager.optimize_database("sonarr")
+
+        assert wal_file.stat().st_size == 0
+
+    async def test_optimize_releases_free_pages(self, config_dir):
+        """With incremental auto-vacuum, optimize_database frees every free page."""
+        db_path = config_dir / "radarr" / "radarr.db"
+        db_path.parent.mkdir()
+        conn = sqlite3.connect(db_path)
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        conn.execute("CREATE TABLE Movies (Title TEXT)")
+        conn.executemany("INSERT INTO Movies VALUES (?)", [("x" * 500,)] * 1000)
+        conn.commit()
+        conn.execute("DELETE FROM Movies")
+        conn.commit()
+        conn.close()
+
+        async with ArrDatabaseManager(str(config_dir)) as manager:
+            await manager.optimize_database("radarr")
+            rows = await manager.execute_query("radarr", "PRAGMA freelist_count")
+
+        assert rows == [{"freelist_count": 0}]
+
+    async def test_vacuum_skips_mostly_full_databases(self, manager):
+        """VACUUM only runs once enough of the file is free pages."""
+        assert await manager.vacuum_database("sonarr") is False
+
+        await manager.execute_query("sonarr", "CREATE TABLE Blobs (Data TEXT)", fetch=False)
+        await manager.execute_many("sonarr", "INSERT INTO Blobs VALUES (?)", [("x" * 500,)] * 500)
+        await manager.execute_query("sonarr", "DROP TABLE Blobs", fetch=False)
+
+        assert await manager.vacuum_database("sonarr") is True
+        rows = await manager.execute_query("sonarr", "PRAGMA freelist_count")
+        assert rows == [{"freelist_count": 0}]
+
+    def test_human_readable_size(self):
+        """Sizes use the largest unit below the value, capped at PB."""
+        assert ArrDatabaseManager._human_readable_size(0) == "0.00 B"
+        assert ArrDatabaseManager._human_readable_size(1023) == "1023.00 B"
+        assert ArrDatabaseManager._human_readable_size(1536) == "1.50 KB"
+        assert ArrDatabaseManager._human_readable_size(1024**2 - 1) == "1024.00 KB"
+        assert ArrDatabaseManager._human_readable_size(3 * 1024**3) == "3.00 GB"
+        assert ArrDatabaseManager._human_readable_size(2048 * 1024**5) == "2048.00 PB"
+
+    async def test_missing_database(self, manager):
+        """Querying a service without a database file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await manager.execute_query("radarr", "SELECT 1")
+
+
+class TestArrDatabaseBackups:
+    """Test cases for ArrDatabaseManager backups."""
+
+    async def test_backup_includes_uncheckpointed_writes(self, manager, tmp_path):
+        """Backups go through SQLite, so rows still in the WAL file are copied."""
+        await manager.execute_query("sonarr", "PRAGMA journal_mode=WAL", fetch=False)
+        await manager.execute_query(
+            "sonarr", "INSERT INTO Series (Title) VALUES ('Andor')", fetch=False
+        )
+
+        backup_file = await manager.backup_database("sonarr", str(tmp_path / "backups"))
+
+        backup = sqlite3.connect(backup_file)
+        titles = [row[0] for row in backup.execute("SELECT Title FROM Series ORDER BY Id")]
+        backup.close()
+        assert titles == ["Dune", "Severance", "Andor"]
+
+    async def test_backup_all_skips_missing_databases(self, manager, tmp_path):
+        """backup_all backs up every database present and skips the rest."""
+        backups = await manager.backup_all(str(tmp_path / "backups"))
+
+        assert list(backups) == ["sonarr"]
+        assert backups["sonarr"].exists()
+
+    async def test_backups_in_the_same_second_get_distinct_files(self, manager, tmp_path):
+        """Concurrent backups of one service never overwrite each other."""
+        backup_dir = str(tmp_path / "backups")
+
+        backups = await asyncio.gather(
+            *(manager.backup_database("sonarr", backup_dir) for _ in range(3))
+        )
+
+        assert len(set(backups)) == 3
+        assert all(backup.stat().st_size > 0 for backup in backups)
@@ -86,3 +86,67 @@ class TestIntentRouter:
         assert "radarr" in explanation.lower()
         assert "search" in explanation.lower()
         assert "2023" in explanation
+
+    def test_keyword_matchers_find_substrings(self, router):
+        """Test both keyword matchers find exactly the contained keywords."""
+        from arr_suite_mcp.routers import intent_router
+
+        query = "add the collection to plex and mark as watched"
+        builders = [intent_router._build_trie, intent_router._build_token_index]
+        if intent_router.ahocorasick is not None:
+            builders.append(intent_router._build_automaton)
+
+        table = router._SERVICE_TABLE + router._OPERATION_TABLE
+        keywords = [keyword for keyword, _, _ in table]
+        expected = {i for i, keyword in enumerate(keywords) if keyword in query}
+        for build in builders:
+            assert build(keywords)(query) == expected
+
+    def test_parse_intent_cache(self, router):
+        """Test repeated queries reuse the analysis but not the context dict."""
+        first = router.parse_intent("Add Dune in 4K")
+        first.context["title"] = "changed"
+        second = router.parse_intent("Add Dune in 4K")
+
+        assert router._analyze.cache_info().hits == 1
+        assert second.service == first.service
+        assert "title" not in second.context
+
+    def test_parse_intent_cache_disabled(self):
+        """Test the cache can be turned off."""
+        router = IntentRouter(cache_enabled=False)
+
+        assert not hasattr(router._analyze, "cache_info")
+        assert router.parse_intent("Add Dune in 4K").context.get("is_4k") is True
+
+    def test_intent_is_frozen(self, router):
+        """Test parsed intents are immutable slotted records."""
+        intent = router.parse_intent("Search for The Matrix")
+
+        assert not hasattr(intent, "__dict__")
+        with pytest.raises(AttributeError):
+            intent.service = ArrService.SONARR
+
+    def test_route_without_context(self, router):
+        """Test routing can skip context extraction."""
+        service, operation, context = router.route(
+            "Add The Matrix from 1999",
+            extract_context=False
+        )
+
+        assert (service, operation) == router.route("Add The Matrix from 1999")[:2]
+        assert context == {}
+
+    def test_year_scanner_matches_pattern(self):
+        """Test the year fast path agrees with the year context pattern."""
+        import re
+        from arr_suite_mcp.routers import intent_router
+
+        pattern = re.compile(IntentRouter.CONTEXT_PATTERNS["year"][0])
+        for text in (
+            "1999", "from 2023", "x1999 2001", "19999 1984", "2020s 1990",
+            "1850", "in 201", "_2001 2002_ (2003)", "19 20 2019"
+        ):
+            match = pattern.search(text)
+            expected = match.span(1) if match else None
+            assert intent_router._find_year(text) == expected
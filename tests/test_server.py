@@ -0,0 +1,267 @@
+"""Tests for the MCP server's tool handling."""
+
+import asyncio
+
+import pytest
+
+from arr_suite_mcp import server as server_module
+from arr_suite_mcp.clients import ArrClientConnectionError
+from arr_suite_mcp.config import ArrSuiteConfig
+from arr_suite_mcp.server import ArrSuiteMCPServer
+
+
+class FakeClient:
+    """Stand-in service client that records calls and can be made to fail."""
+
+    service_name = "Fake"
+
+    def __init__(self, fail: bool = False, delay: float = 0.0):
+        self.fail = fail
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    async def _call(self, name, *args):
+        self.calls.append((name, *args))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.fail:
+            raise ArrClientConnectionError("refused")
+        return {"called": name, "args": list(args)}
+
+    async def get_system_status(self):
+        return await self._call("get_system_status")
+
+    async def lookup_series(self, term):
+        return await self._call("lookup_series", term)
+
+    async def lookup_movie(self, term):
+        return await self._call("lookup_movie", term)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """Server with no services from the environment and no MCP handlers registered."""
+    for name in ("SONARR", "RADARR", "PROWLARR", "BAZARR", "OVERSEERR", "JACKETT"):
+        monkeypatch.delenv(f"{name}_API_KEY", raising=False)
+    monkeypatch.delenv("PLEX_TOKEN", raising=False)
+    monkeypatch.chdir(tmp_path)
+    # Protocol wiring is the mcp library's concern, not under test here
+    monkeypatch.setattr(ArrSuiteMCPServer, "_register_handlers", lambda self: None)
+    return ArrSuiteMCPServer(ArrSuiteConfig())
+
+
+class TestCircuitBreaker:
+    """Test cases for the per-service circuit breaker."""
+
+    async def test_opens_after_threshold_and_fails_fast(self, server):
+        """Consecutive connection failures open the breaker; calls then skip I/O."""
+        client = server.clients["sonarr"] = FakeClient(fail=True)
+
+        for _ in range(server_module.BREAKER_FAILURE_THRESHOLD):
+            with pytest.raises(ArrClientConnectionError, match="refused"):
+                await server._dispatch_tool("sonarr_search_series", {"term": "Dune"})
+        with pytest.raises(ArrClientConnectionError, match="unreachable"):
+            await server._dispatch_tool("sonarr_search_series", {"term": "Dune"})
+
+        assert len(client.calls) == server_module.BREAKER_FAILURE_THRESHOLD
+
+    async def test_half_open_probe(self, server, monkeypatch):
+        """After the open window one call goes through: failure reopens, success closes."""
+        client = server.clients["sonarr"] = FakeClient(fail=True)
+        monkeypatch.setattr(server_module, "BREAKER_OPEN_SECONDS", 0.0)
+        for _ in range(server_module.BREAKER_FAILURE_THRESHOLD):
+            with pytest.raises(ArrClientConnectionError):
+                await server._call_service("sonarr", client.get_system_status)
+
+        with pytest.raises(ArrClientConnectionError, match="refused"):
+            await server._call_service("sonarr", client.get_system_status)
+        assert server._breakers["sonarr"][1] == server_module.BREAKER_FAILURE_THRESHOLD + 1
+
+        client.fail = False
+        await server._call_service("sonarr", client.get_system_status)
+        assert "sonarr" not in server._breakers
+        assert len(client.calls) == server_module.BREAKER_FAILURE_THRESHOLD + 2
+
+    async def test_concurrent_successes_close_breaker_once(self, server):
+        """Two successes racing to close the same breaker both return their results."""
+        client = FakeClient(fail=True)
+        with pytest.raises(ArrClientConnectionError):
+            await server._call_service("sonarr", client.get_system_status)
+        client.fail, client.delay = False, 0.01
+
+        results = await asyncio.gather(
+            server._call_service("sonarr", client.get_system_status),
+            server._call_service("sonarr", client.get_system_status)
+        )
+
+        assert [result["called"] for result in results] == ["get_system_status"] * 2
+        assert "sonarr" not in server._breakers
+
+    async def test_concurrent_failures_all_count(self, server):
+        """Failures that overlap in flight are all counted."""
+        client = FakeClient(fail=True, delay=0.01)
+
+        await asyncio.gather(
+            *(server._call_service("sonarr", client.get_system_status) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert server._breakers["sonarr"][1] == 3
+
+
+def search(term):
+    """arr_batch_execute operation searching Sonarr for term."""
+    return {"name": "sonarr_search_series", "arguments": {"term": term}}
+
+
+class TestBatchExecute:
+    """Test cases for arr_batch_execute."""
+
+    async def test_results_keep_operation_order(self, server):
+        """Results line up with operations even when later ones finish first."""
+        server.clients["sonarr"] = FakeClient(delay=0.02)
+        server.clients["radarr"] = FakeClient()
+
+        batch = await server._dispatch_tool("arr_batch_execute", {"operations": [
+            search("Dune"),
+            {"name": "radarr_search_movie", "arguments": {"term": "Alien"}},
+            search("Severance")
+        ]})
+
+        assert [result["name"] for result in batch["results"]] == [
+            "sonarr_search_series", "radarr_search_movie", "sonarr_search_series"
+        ]
+        assert [result["result"]["args"] for result in batch["results"]] == [
+            ["Dune"], ["Alien"], ["Severance"]
+        ]
+
+    async def test_max_concurrent_limits_operations_in_flight(self, server):
+        """No more than max_concurrent operations run at once."""
+        client = server.clients["sonarr"] = FakeClient(delay=0.01)
+
+        await server._dispatch_tool("arr_batch_execute", {
+            "operations": [search(str(i)) for i in range(6)],
+            "max_concurrent": 2
+        })
+
+        assert len(client.calls) == 6
+        assert client.peak == 2
+
+    async def test_stop_on_error_skips_remaining_operations(self, server):
+        """Once an operation raises, operations not yet started are skipped."""
+        server.clients["sonarr"] = FakeClient(fail=True)
+
+        batch = await server._dispatch_tool("arr_batch_execute", {
+            "operations": [search("Dune"), search("Severance")],
+            "max_concurrent": 1,
+            "stop_on_error": True
+        })
+
+        assert batch["results"][0]["error"] == "refused"
+        assert batch["results"][1] == {"name": "sonarr_search_series", "skipped": True}
+
+    async def test_stop_on_error_counts_error_results(self, server):
+        """A tool that returns an error dict stops the batch like one that raises."""
+        client = server.clients["sonarr"] = FakeClient()
+
+        batch = await server._dispatch_tool("arr_batch_execute", {
+            "operations": [{"name": "sonarr_no_such_tool"}, search("Dune")],
+            "max_concurrent": 1,
+            "stop_on_error": True
+        })
+
+        assert "error" in batch["results"][0]["result"]
+        assert batch["results"][1]["skipped"] is True
+        assert client.calls == []
+
+    async def test_errors_do_not_stop_batch_by_default(self, server):
+        """Without stop_on_error every operation runs and reports its own outcome."""
+        server.clients["sonarr"] = FakeClient(fail=True)
+        server.clients["radarr"] = FakeClient()
+
+        batch = await server._dispatch_tool("arr_batch_execute", {"operations": [
+            search("Dune"),
+            {"name": "radarr_search_movie", "arguments": {"term": "Alien"}}
+        ]})
+
+        assert batch["results"][0]["error"] == "refused"
+        assert batch["results"][1]["result"]["called"] == "lookup_movie"
+
+    async def test_nested_batches_are_rejected(self, server):
+        """A batch inside a batch is reported as an error, not run."""
+        client = server.clients["sonarr"] = FakeClient()
+
+        batch = await server._dispatch_tool("arr_batch_execute", {"operations": [
+            {"name": "arr_batch_execute", "arguments": {"operations": [search("Dune")]}}
+        ]})
+
+        assert batch["results"] == [
+            {"name": "arr_batch_execute", "error": "Batches cannot be nested"}
+        ]
+        assert client.calls == []
+
+
+class TestSystemStatusCache:
+    """Test cases for arr_get_system_status caching."""
+
+    async def test_reuses_status_within_ttl(self, server):
+        """Repeat calls inside STATUS_CACHE_TTL don't hit the services again."""
+        client = server.clients["sonarr"] = FakeClient()
+
+        first = await server._dispatch_tool("arr_get_system_status", {})
+        second = await server._dispatch_tool("arr_get_system_status", {})
+
+        assert first == second == {
+            "sonarr": {"online": True, "status": {"called": "get_system_status", "args": []}}
+        }
+        assert len(client.calls) == 1
+
+    async def test_refreshes_only_expired_services(self, server):
+        """Expired or missing entries are fetched; fresh ones come from the cache."""
+        sonarr = server.clients["sonarr"] = FakeClient()
+        radarr = server.clients["radarr"] = FakeClient(fail=True)
+        await server._dispatch_tool("arr_get_system_status", {})
+        server._status_cache["sonarr"] = (0.0, server._status_cache["sonarr"][1])
+        del server._status_cache["radarr"]
+
+        status = await server._dispatch_tool("arr_get_system_status", {})
+        await server._dispatch_tool("arr_get_system_status", {})
+
+        assert status["radarr"] == {"online": False, "error": "refused"}
+        assert len(sonarr.calls) == 2
+        assert len(radarr.calls) == 2
+
+
+class TestToolTimeout:
+    """Test cases for the per-tool-call deadline."""
+
+    async def test_slow_tool_times_out(self, server):
+        """A tool still running after tool_timeout raises TimeoutError naming the tool."""
+        server.clients["sonarr"] = FakeClient(delay=1.0)
+        server.config.tool_timeout = 0.01
+
+        with pytest.raises(TimeoutError, match="sonarr_search_series timed out after 0.01s"):
+            await server._run_tool("sonarr_search_series", {"term": "Dune"})
+
+    async def test_batched_calls_get_their_own_deadline(self, server):
+        """In a batch, only the slow call times out; the others still return."""
+        server.clients["sonarr"] = FakeClient(delay=1.0)
+        server.clients["radarr"] = FakeClient()
+        server.config.tool_timeout = 0.05
+
+        batch = await server._dispatch_tool("arr_batch_execute", {"operations": [
+            search("Dune"),
+            {"name": "radarr_search_movie", "arguments": {"term": "Alien"}}
+        ]})
+
+        assert "timed out" in batch["results"][0]["error"]
+        assert batch["results"][1]["result"]["called"] == "lookup_movie"